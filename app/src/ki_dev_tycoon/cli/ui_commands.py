@@ -2,30 +2,64 @@
 
 from __future__ import annotations
 
-import typer
+import time
 
-from ki_dev_tycoon.ui.app import TycoonApp
-from ki_dev_tycoon.ui.presenter import SimulationPresenter, SimulationPresenterConfig
+_PROCESS_START = time.perf_counter()
+
+from typing import Any  # noqa: E402
+
+import typer  # noqa: E402
+
+from ki_dev_tycoon.ui.startup import StartupTimer  # noqa: E402
 
 
 app = typer.Typer(help="Launch the KI Dev Tycoon Textual client.")
 
+STARTUP_REPORT_OPTION = typer.Option(
+    False,
+    "--startup-report",
+    help="Print a startup-time breakdown to stderr when the UI exits.",
+)
+
 
-def _run_ui(config: SimulationPresenterConfig, *, headless: bool = False) -> None:
-    presenter = SimulationPresenter(config)
-    tycoon_app = TycoonApp(presenter=presenter)
+def _run_ui(
+    *, headless: bool = False, startup_report: bool = False, **options: Any
+) -> None:
+    timer = StartupTimer(origin=_PROCESS_START)
+    # Textual and the simulation kernel are imported here so that the timer
+    # attributes their cost to the "imports" phase.
+    from ki_dev_tycoon.ui.app import TycoonApp
+    from ki_dev_tycoon.ui.presenter import (
+        SimulationPresenter,
+        SimulationPresenterConfig,
+    )
+
+    timer.mark("imports")
+    presenter = SimulationPresenter(SimulationPresenterConfig(**options))
+    tycoon_app = TycoonApp(presenter=presenter, startup=timer)
     tycoon_app.run(headless=headless)
+    if startup_report:
+        typer.echo(timer.format(), err=True)
 
 
 @app.command()
 def dev(
     ticks: int = typer.Option(30, help="Number of ticks to simulate for the dashboard."),
     seed: int = typer.Option(42, help="Deterministic simulation seed."),
+    refresh_ticks: int = typer.Option(
+        1, min=0, help="Ticks the live simulation advances per refresh (Ctrl+R)."
+    ),
+    startup_report: bool = STARTUP_REPORT_OPTION,
 ) -> None:
     """Launch the UI with a local simulation in development mode."""
 
-    config = SimulationPresenterConfig(ticks=ticks, seed=seed, source="simulation")
-    _run_ui(config)
+    _run_ui(
+        startup_report=startup_report,
+        ticks=ticks,
+        seed=seed,
+        source="simulation",
+        ticks_per_refresh=refresh_ticks,
+    )
 
 
 @app.command()
@@ -37,25 +71,31 @@ def play(
     ),
     ticks: int = typer.Option(30, help="Fallback simulation ticks if API is unavailable."),
     seed: int = typer.Option(42, help="Fallback simulation seed."),
+    startup_report: bool = STARTUP_REPORT_OPTION,
 ) -> None:
     """Connect to the FastAPI backend or fall back to a local simulation."""
 
-    config = SimulationPresenterConfig(
+    _run_ui(
+        startup_report=startup_report,
         ticks=ticks,
         seed=seed,
         api_url=api_url,
         source="api",
     )
-    _run_ui(config)
 
 
 @app.command()
 def autoplay(
     ticks: int = typer.Option(60, help="Number of ticks for the automated run."),
     seed: int = typer.Option(42, help="Deterministic simulation seed."),
+    startup_report: bool = STARTUP_REPORT_OPTION,
 ) -> None:
     """Run the UI headlessly using Textual's dummy driver for automation."""
 
-    config = SimulationPresenterConfig(ticks=ticks, seed=seed, source="simulation")
-    _run_ui(config, headless=True)
-
+    _run_ui(
+        headless=True,
+        startup_report=startup_report,
+        ticks=ticks,
+        seed=seed,
+        source="simulation",
+    )
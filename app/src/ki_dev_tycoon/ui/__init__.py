@@ -1,5 +1,22 @@
 """Textual UI components for KI Dev Tycoon."""
 
-from .app import TycoonApp
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .app import TycoonApp
+
+
+def __getattr__(name: str) -> Any:
+    # Importing the app pulls in Textual and the simulation kernel; entry
+    # points import it explicitly once their startup timer is running.
+    if name == "TycoonApp":
+        from .app import TycoonApp
+
+        return TycoonApp
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 __all__ = ["TycoonApp"]
@@ -3,26 +3,22 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict
+from typing import TYPE_CHECKING, Callable, Dict
 
 from textual.app import App
 from textual.binding import Binding
-from textual.events import Mount
+from textual.events import Mount, Unmount
 
+from . import screens
 from .presenter import SimulationPresenter, SimulationPresenterConfig
+from .startup import StartupTimer
 from .theme import ThemeController
-from .viewmodels import UiState
+from .viewmodels import UI_SECTIONS, UiState, UiStateUpdate
 from .widgets import NavItem
-from .screens import (
-    DashboardScreen,
-    EventsScreen,
-    MarketScreen,
-    ProductsScreen,
-    ResearchScreen,
-    TeamScreen,
-)
 from .screens.base import BaseScreen
-from .screens.settings import SettingsDialog
+
+if TYPE_CHECKING:
+    from .screens.settings import SettingsDialog
 
 
 NAV_ITEMS: tuple[NavItem, ...] = (
@@ -34,6 +30,16 @@ NAV_ITEMS: tuple[NavItem, ...] = (
     NavItem("events", "Events", "6"),
 )
 
+# Screen classes are resolved (and their modules imported) on first navigation.
+SCREEN_CLASSES: dict[str, str] = {
+    "dashboard": "DashboardScreen",
+    "team": "TeamScreen",
+    "research": "ResearchScreen",
+    "products": "ProductsScreen",
+    "market": "MarketScreen",
+    "events": "EventsScreen",
+}
+
 
 class TycoonApp(App[None]):
     """Textual front-end for the KI Dev Tycoon simulation."""
@@ -58,42 +64,67 @@ class TycoonApp(App[None]):
         presenter: SimulationPresenter | None = None,
         theme_controller: ThemeController | None = None,
         config: SimulationPresenterConfig | None = None,
+        startup: StartupTimer | None = None,
     ) -> None:
         super().__init__()
+        self.startup = startup or StartupTimer()
         self._logger = logging.getLogger(__name__)
         self.presenter = presenter or SimulationPresenter(config)
         self.theme_controller = theme_controller or ThemeController()
         self._state: UiState | None = None
         self._screens: Dict[str, BaseScreen] = {}
+        self.startup.mark("app_init")
 
     async def on_mount(self, event: Mount) -> None:
         del event
-        nav_items = NAV_ITEMS
-        self._screens = {
-            "dashboard": DashboardScreen(nav_items),
-            "team": TeamScreen(nav_items),
-            "research": ResearchScreen(nav_items),
-            "products": ProductsScreen(nav_items),
-            "market": MarketScreen(nav_items),
-            "events": EventsScreen(nav_items),
-        }
-        for screen_id, screen in self._screens.items():
-            self.install_screen(screen, screen_id)
+        self.startup.mark("mount")
+        self._screen("dashboard")
         self.switch_screen("dashboard")
         self.theme_controller.apply(self, self.theme_controller.settings)
+        # Paint the empty dashboard before the first simulation run.
+        self.call_after_refresh(self._load_initial_state)
+
+    async def _load_initial_state(self) -> None:
+        self.startup.mark("first_paint")
         await self._refresh_state()
+        self.startup.mark("first_state")
+        self._logger.debug("Startup breakdown\n%s", self.startup.format())
+
+    def _screen(self, screen_id: str) -> BaseScreen:
+        """Return the screen for ``screen_id``, constructing it on first use."""
+
+        screen = self._screens.get(screen_id)
+        if screen is None:
+            factory: Callable[[tuple[NavItem, ...]], BaseScreen] = getattr(
+                screens, SCREEN_CLASSES[screen_id]
+            )
+            screen = factory(NAV_ITEMS)
+            screen.set_class(
+                self.theme_controller.settings.colorblind_friendly, "colorblind-mode"
+            )
+            self._screens[screen_id] = screen
+            self.install_screen(screen, screen_id)
+            if self._state is not None:
+                screen.apply_update(
+                    UiStateUpdate(state=self._state, changed=UI_SECTIONS)
+                )
+        return screen
+
+    async def on_unmount(self, event: Unmount) -> None:
+        del event
+        await self.presenter.aclose()
 
     async def _refresh_state(self) -> None:
         self._set_status("Simulation wird geladen…")
         try:
-            state = await self.presenter.build_ui_state()
+            update = await self.presenter.build_ui_update()
         except Exception:  # pragma: no cover - safeguard for UI experiments
             self._logger.exception("Failed to build UI state")
             self._set_status("Ladevorgang fehlgeschlagen")
             return
-        self._state = state
+        self._state = update.state
         for screen in self._screens.values():
-            screen.update_view(state)
+            screen.apply_update(update)
         latest_tick = self.presenter.latest_tick
         status = f"Tick {latest_tick}" if latest_tick else ""
         self._set_status(status or None)
@@ -102,13 +133,16 @@ class TycoonApp(App[None]):
         self.sub_title = status or ""
 
     def action_navigate(self, screen_id: str) -> None:
-        if screen_id in self._screens:
+        if screen_id in SCREEN_CLASSES:
+            self._screen(screen_id)
             self.switch_screen(screen_id)
 
     async def action_refresh(self) -> None:
         await self._refresh_state()
 
     async def action_open_settings(self) -> None:
+        from .screens.settings import SettingsDialog
+
         dialog = SettingsDialog(self.theme_controller.settings)
         self.push_screen(dialog)
 
@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Literal, Sequence
+from typing import TYPE_CHECKING, Iterable, Literal, Mapping, Sequence
 
-import httpx
-
-from ki_dev_tycoon.achievements import AchievementTracker, default_definitions
+from ki_dev_tycoon.app import SimulationConfig, SimulationSession
 from ki_dev_tycoon.core.events import (
     AchievementUnlocked,
     EventBus,
@@ -17,15 +16,13 @@ from ki_dev_tycoon.core.events import (
     SimulationStarted,
     TickProcessed,
 )
-from ki_dev_tycoon.core.rng import RandomSource
-from ki_dev_tycoon.core.state import GameState, ProductState, ResearchState, TeamMember, TeamState
-from ki_dev_tycoon.core.time import TickClock
+from ki_dev_tycoon.core.state import ProductState, ResearchState, TeamState
 from ki_dev_tycoon.data.loader import AssetBundle, load_assets
-from ki_dev_tycoon.economy import project_adoption
+from ki_dev_tycoon.pipeline import Resolution, TickContext
 from ki_dev_tycoon.platform import steam
-from ki_dev_tycoon.products import compute_quality
-from ki_dev_tycoon.research import progress_research
-from ki_dev_tycoon.team import ensure_minimum_staff, train_team
+
+if TYPE_CHECKING:
+    import httpx
 
 from .viewmodels import (
     AchievementViewModel,
@@ -38,7 +35,9 @@ from .viewmodels import (
     ResearchViewModel,
     TeamMemberViewModel,
     TeamViewModel,
+    UI_SECTIONS,
     UiState,
+    UiStateUpdate,
 )
 
 
@@ -54,19 +53,38 @@ class SimulationPresenterConfig:
     asset_root: Path | None = None
     api_url: str | None = None
     source: Literal["simulation", "api"] = "simulation"
+    ticks_per_refresh: int = 1
+    event_log_size: int = 40
+    history_size: int = 30
 
 
 class SimulationPresenter:
     """Aggregate simulation data for the Textual UI."""
 
-    def __init__(self, config: SimulationPresenterConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: SimulationPresenterConfig | None = None,
+        *,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         self.config = config or SimulationPresenterConfig()
         self._event_bus = EventBus()
         self._event_bus.subscribe(TickProcessed, self._record_tick)
         self._event_bus.subscribe(AchievementUnlocked, self._on_achievement_unlocked)
-        self._observed_ticks: list[int] = []
-        self._achievement_tracker = AchievementTracker(default_definitions())
+        self._latest_tick = 0
         self._recent_achievements: list[AchievementViewModel] = []
+        self._session: SimulationSession | None = None
+        self._history: deque[KpiSnapshot] = deque(maxlen=self.config.history_size)
+        self._events: deque[EventLogEntry] = deque(maxlen=self.config.event_log_size)
+        self._events_dirty = False
+        self._ui_state: UiState | None = None
+        self._sources: dict[str, object] = {}
+        self._refresh_lock = asyncio.Lock()
+        self._http_client = http_client
+        self._owns_http_client = False
+        self._api_etag: str | None = None
+        self._api_state: UiState | None = None
+        self._asset_cache: tuple[Path, AssetBundle] | None = None
 
     @property
     def event_bus(self) -> EventBus:
@@ -78,176 +96,240 @@ class SimulationPresenter:
     def latest_tick(self) -> int:
         """Return the highest tick observed while running the simulation."""
 
-        return self._observed_ticks[-1] if self._observed_ticks else 0
+        return self._latest_tick
 
     async def build_ui_state(self) -> UiState:
         """Return the :class:`UiState` according to the configured source."""
 
-        if self.config.source == "api" and self.config.api_url:
-            try:
-                return await self._fetch_from_api(self.config.api_url)
-            except httpx.HTTPError:
-                # Fallback to local simulation if the API is unreachable.
-                pass
-        return await asyncio.to_thread(self._simulate_locally)
-
-    def _simulate_locally(self) -> UiState:
-        config = self.config
-        assets = load_assets(self._resolve_asset_root(config.asset_root))
-        clock = TickClock()
-        rng = RandomSource(config.seed)
-        self._achievement_tracker = AchievementTracker(default_definitions())
-        self._recent_achievements.clear()
-        self._event_bus.publish(SimulationStarted(seed=config.seed))
-
-        products = tuple(
-            ProductState(
-                product_id=product.id,
-                quality=product.base_quality,
-                adoption=0,
-                price=product.base_price,
-            )
-            for product in assets.products.values()
-        )
-        research_state = ResearchState(
-            unlocked=frozenset(),
-            active=None,
-            progress=0.0,
-            backlog=tuple(sorted(assets.research)),
-        )
-        state = GameState(
-            tick=clock.current_tick(),
-            cash=0.0,
-            reputation=50.0,
-            team=TeamState(members=()),
-            products=products,
-            research=research_state,
-        )
-
-        history: list[KpiSnapshot] = []
-        events: list[EventLogEntry] = []
-
-        for _ in range(config.ticks):
-            clock.advance()
-            state = state.advance_tick(clock)
-            tick_rng = rng.namespaced(f"tick:{state.tick}")
-            self._event_bus.publish(TickProcessed(tick=state.tick))
-
-            state, hired = self._ensure_staffing(state, assets, tick_rng)
-            quality_bonus, demand_bonus, training_bonus = self._aggregate_research_bonuses(
-                state.research, assets
-            )
-            state = self._train_team(state, assets, training_bonus)
-            state, completed_nodes = self._advance_research(state, assets)
-            if completed_nodes:
-                quality_bonus, demand_bonus, training_bonus = self._aggregate_research_bonuses(
-                    state.research, assets
-                )
-            state, event_entry, demand_multiplier, quality_penalty, reputation_bonus = self._apply_event(
-                state, assets, tick_rng
-            )
-            if event_entry is not None:
-                events.append(event_entry)
-            if reputation_bonus:
-                state = state.apply_reputation_delta(reputation_bonus)
-
-            state, revenue = self._update_products(
-                state,
-                assets,
-                tick_rng,
-                quality_bonus=quality_bonus,
-                demand_bonus=demand_bonus,
-                demand_multiplier=demand_multiplier,
-                quality_penalty=quality_penalty,
-            )
-
-            salary_cost = sum(assets.roles[member.role_id].salary for member in state.team.members)
-            cash_delta = revenue - salary_cost - config.operating_costs
-            state = state.apply_cash_delta(cash_delta)
-
-            direction = 1 if cash_delta >= 0 else -1
-            jitter = (tick_rng.random() - 0.5) * 0.2
-            state = state.apply_reputation_delta(direction * 0.5 + jitter)
-
-            unlocked = self._achievement_tracker.evaluate(state)
-            if unlocked:
-                state = state.add_achievements(unlocked)
-                for achievement in unlocked:
-                    self._event_bus.publish(
-                        AchievementUnlocked(tick=state.tick, achievement=achievement)
-                    )
-
-            total_adoption = sum(product.adoption for product in state.products)
-            avg_quality = (
-                sum(product.quality for product in state.products) / len(state.products)
-                if state.products
-                else 0.0
-            )
-            history.append(
+        update = await self.build_ui_update()
+        return update.state
+
+    async def build_ui_update(self) -> UiStateUpdate:
+        """Advance the data source and return the new state plus changed sections.
+
+        The local simulation is kept alive between calls: the first call
+        simulates ``config.ticks`` ticks, later calls advance the same session by
+        ``config.ticks_per_refresh`` ticks and only rebuild the view models whose
+        underlying game state changed.
+        """
+
+        async with self._refresh_lock:
+            if self.config.source == "api" and self.config.api_url:
+                # httpx is only needed in API mode; keep it off the startup path.
+                import httpx
+
+                try:
+                    state = await self._fetch_from_api(self.config.api_url)
+                except httpx.HTTPError:
+                    # Fallback to local simulation if the API is unreachable.
+                    pass
+                else:
+                    return self._publish(state, {})
+            return await self._simulate_locally()
+
+    async def forecast(
+        self, ticks: int = 365, *, resolution: Resolution = "monthly"
+    ) -> tuple[KpiSnapshot, ...]:
+        """Return a coarse KPI preview of the next ``ticks`` ticks.
+
+        The live session is projected in weekly or monthly macro-ticks, which
+        is cheap enough for instant what-if answers on the dashboard; the
+        session itself is not advanced. Empty until the first refresh.
+        """
+
+        async with self._refresh_lock:
+            session = self._session
+            if session is None:
+                return ()
+            state = session.state
+            rows = session.forecast(ticks, resolution=resolution)
+        snapshots = []
+        tick, cash = state.tick, state.cash
+        for row in rows:
+            snapshots.append(
                 KpiSnapshot(
-                    tick=state.tick,
-                    cash=state.cash,
-                    reputation=state.reputation,
-                    revenue=revenue,
-                    adoption=total_adoption,
-                    avg_quality=avg_quality,
-                    cash_delta=cash_delta,
+                    tick=int(row["tick"]),
+                    cash=row["cash"],
+                    reputation=row["reputation"],
+                    revenue=row["revenue"],
+                    adoption=int(row["adoption"]),
+                    avg_quality=row["avg_quality"],
+                    cash_delta=(row["cash"] - cash) / (row["tick"] - tick),
                 )
             )
-
-            if completed_nodes:
-                completion_text = ", ".join(completed_nodes)
-                events.append(
-                    EventLogEntry(
-                        tick=state.tick,
-                        name="Research breakthrough",
-                        description=f"Unlocked: {completion_text}",
-                    )
-                )
-            if hired:
-                events.append(
-                    EventLogEntry(
-                        tick=state.tick,
-                        name="New hires",
-                        description=f"Added {len(hired)} team members",
-                    )
+            tick, cash = int(row["tick"]), row["cash"]
+        return tuple(snapshots)
+
+    def reset(self) -> None:
+        """Discard the live simulation so that the next refresh starts over."""
+
+        if self._session is not None:
+            self._event_bus.publish(SimulationCompleted(tick=self._session.state.tick))
+        self._session = None
+        self._history.clear()
+        self._events.clear()
+        self._events_dirty = False
+        self._ui_state = None
+        self._sources.clear()
+
+    async def _simulate_locally(self) -> UiStateUpdate:
+        config = self.config
+        session = self._session
+        if session is None:
+            if self._asset_cache is None:
+                await asyncio.to_thread(self._load_assets)
+            session = self._start_session()
+            ticks = config.ticks
+        else:
+            ticks = config.ticks_per_refresh
+        await session.advance_async(ticks)
+        state = session.state
+        assets = session.assets
+
+        sources: dict[str, object] = {
+            "team": state.team,
+            "research": state.research,
+            "products": state.products,
+            "achievements": state.achievements,
+        }
+        previous = self._ui_state if self._sources else None
+        same = {
+            section
+            for section, source in sources.items()
+            if self._sources.get(section) is source
+        }
+        if previous is not None and "team" in same:
+            team = previous.team
+        else:
+            team = self._build_team_view(state.team, assets)
+        if previous is not None and "research" in same:
+            research = previous.research
+        else:
+            research = self._build_research_view(state.research, assets)
+        if previous is not None and "products" in same:
+            products_vm, markets = previous.products, previous.markets
+        else:
+            products_vm = self._build_product_view(state.products, assets)
+            markets = self._build_market_view(state.products, assets)
+        if previous is not None and "achievements" in same:
+            achievements = previous.achievements
+        else:
+            achievements = tuple(
+                AchievementViewModel(
+                    achievement_id=achievement.id,
+                    name=achievement.name,
+                    description=achievement.description,
+                    unlocked_tick=achievement.unlocked_tick,
                 )
-
-        self._event_bus.publish(SimulationCompleted(tick=state.tick))
-
-        dashboard = self._build_dashboard(history)
-        team = self._build_team_view(state.team, assets)
-        research = self._build_research_view(state.research, assets)
-        products_vm = self._build_product_view(state.products, assets)
-        markets = self._build_market_view(state.products, assets)
-        achievement_models = tuple(
-            AchievementViewModel(
-                achievement_id=achievement.id,
-                name=achievement.name,
-                description=achievement.description,
-                unlocked_tick=achievement.unlocked_tick,
+                for achievement in state.achievements
             )
-            for achievement in state.achievements
-        )
-
-        return UiState(
-            dashboard=dashboard,
+        if previous is not None and not self._events_dirty:
+            events = previous.events
+        else:
+            events = tuple(self._events)
+        self._events_dirty = False
+
+        ui_state = UiState(
+            dashboard=self._build_dashboard(self._history),
             team=team,
             research=research,
             products=products_vm,
             markets=markets,
-            events=tuple(events[-40:]),
-            achievements=achievement_models,
+            events=events,
+            achievements=achievements,
         )
+        return self._publish(ui_state, sources)
+
+    def _start_session(self) -> SimulationSession:
+        config = self.config
+        self.reset()
+        asset_root, assets = self._load_assets()
+        self._recent_achievements.clear()
+        self._event_bus.publish(SimulationStarted(seed=config.seed))
+        self._session = SimulationSession(
+            SimulationConfig(
+                ticks=config.ticks,
+                seed=config.seed,
+                daily_active_users=config.daily_active_users,
+                arp_dau=config.arp_dau,
+                operating_costs=config.operating_costs,
+                asset_root=asset_root,
+            ),
+            assets=assets,
+            event_bus=self._event_bus,
+            tick_hooks=(self._collect_tick,),
+        )
+        return self._session
+
+    def _collect_tick(self, context: TickContext) -> None:
+        self._history.append(self._kpi_snapshot(context))
+        entries = self._event_log_entries(context)
+        if entries:
+            self._events.extend(entries)
+            self._events_dirty = True
+
+    def _publish(self, state: UiState, sources: dict[str, object]) -> UiStateUpdate:
+        previous = self._ui_state
+        if previous is None:
+            changed = UI_SECTIONS
+        else:
+            changed = frozenset(
+                section
+                for section in UI_SECTIONS
+                if getattr(previous, section) is not getattr(state, section)
+                and getattr(previous, section) != getattr(state, section)
+            )
+        self._ui_state = state
+        self._sources = sources
+        return UiStateUpdate(state=state, changed=changed)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client if the presenter created one."""
+
+        client, self._http_client = self._http_client, None
+        if client is not None and self._owns_http_client:
+            await client.aclose()
+
+    def _api_client(self, base_url: str) -> httpx.AsyncClient:
+        import httpx
+
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                base_url=base_url,
+                timeout=5.0,
+                limits=httpx.Limits(
+                    max_connections=4,
+                    max_keepalive_connections=2,
+                    keepalive_expiry=30.0,
+                ),
+            )
+            self._owns_http_client = True
+        return self._http_client
+
+    def _load_assets(self) -> tuple[Path, AssetBundle]:
+        asset_root = self._resolve_asset_root(self.config.asset_root)
+        cached = self._asset_cache
+        if cached is None or cached[0] != asset_root:
+            cached = (asset_root, load_assets(asset_root))
+            self._asset_cache = cached
+        return cached
 
     async def _fetch_from_api(self, base_url: str) -> UiState:
-        async with httpx.AsyncClient(base_url=base_url, timeout=5.0) as client:
-            response = await client.get("/state")
-            response.raise_for_status()
-            payload = response.json()
+        import httpx
+
+        client = self._api_client(base_url)
+        headers: dict[str, str] = {}
+        if self._api_state is not None and self._api_etag is not None:
+            headers["If-None-Match"] = self._api_etag
+        response = await client.get("/state", headers=headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED and self._api_state is not None:
+            return self._api_state
+        response.raise_for_status()
+        payload = response.json()
+        self._api_etag = response.headers.get("ETag")
 
         config = self.config
-        assets = load_assets(self._resolve_asset_root(config.asset_root))
+        _, assets = self._load_assets()
 
         average_quality = (
             sum(float(project["quality"]) for project in payload["projects"])
@@ -286,7 +368,7 @@ class SimulationPresenter:
             )
             for entry in payload.get("achievements", [])
         )
-        return UiState(
+        self._api_state = UiState(
             dashboard=dashboard,
             team=team,
             research=research,
@@ -301,6 +383,7 @@ class SimulationPresenter:
             ),
             achievements=achievement_models,
         )
+        return self._api_state
 
     def _build_dashboard(self, history: Sequence[KpiSnapshot]) -> DashboardViewModel:
         latest = history[-1]
@@ -323,7 +406,7 @@ class SimulationPresenter:
                 role_name=assets.roles[member.role_id].name,
                 skill=member.skill,
                 training_progress=member.training_progress,
-                salary=assets.roles[member.role_id].salary,
+                salary=member.daily_salary(assets.roles[member.role_id].salary),
             )
             for member in team.members
         )
@@ -394,80 +477,59 @@ class SimulationPresenter:
             )
         return tuple(markets)
 
-    def _ensure_staffing(
-        self, state: GameState, assets: AssetBundle, tick_rng: RandomSource
-    ) -> tuple[GameState, tuple[TeamMember, ...]]:
-        product_ids = tuple(product.product_id for product in state.products)
-        hiring_result = ensure_minimum_staff(
-            state.team,
-            assets=assets,
-            rng=tick_rng.namespaced(f"hiring:{state.tick}"),
-            product_ids=product_ids,
-        )
-        state = state.update_team(hiring_result.team)
-        return state, hiring_result.hired
-
-    def _train_team(
-        self, state: GameState, assets: AssetBundle, training_bonus: float
-    ) -> GameState:
-        training_result = train_team(
-            state.team,
-            assets=assets,
-            training_bonus=training_bonus,
+    def _kpi_snapshot(self, context: TickContext) -> KpiSnapshot:
+        products = context.state.products
+        total_adoption = sum(product.adoption for product in products)
+        avg_quality = (
+            sum(product.quality for product in products) / len(products)
+            if products
+            else 0.0
         )
-        return state.update_team(training_result.team)
-
-    def _advance_research(
-        self, state: GameState, assets: AssetBundle
-    ) -> tuple[GameState, tuple[str, ...]]:
-        research_points = self._compute_research_points(state.team)
-        progress_result = progress_research(
-            state.research,
-            assets=assets,
-            research_points=research_points,
+        return KpiSnapshot(
+            tick=context.tick,
+            cash=context.state.cash,
+            reputation=context.state.reputation,
+            revenue=context.revenue,
+            adoption=total_adoption,
+            avg_quality=avg_quality,
+            cash_delta=context.cash_delta,
         )
-        state = state.update_research(progress_result.state)
-        return state, progress_result.completed
-
-    def _aggregate_research_bonuses(
-        self, research: ResearchState, assets: AssetBundle
-    ) -> tuple[float, float, float]:
-        quality_bonus = 0.0
-        demand_bonus = 0.0
-        training_bonus = 0.0
-        for node_id in research.unlocked:
-            node = assets.research.get(node_id)
-            if node is None:
-                continue
-            unlocks = node.unlocks
-            quality_bonus += unlocks.quality_bonus or 0.0
-            demand_bonus += unlocks.demand_bonus or 0.0
-            training_bonus += unlocks.training_bonus or 0.0
-        return quality_bonus, demand_bonus, training_bonus
 
-    def _apply_event(
-        self,
-        state: GameState,
-        assets: AssetBundle,
-        tick_rng: RandomSource,
-    ) -> tuple[GameState, EventLogEntry | None, float, float, float]:
-        events = sorted(assets.events.values(), key=lambda event: event.id)
-        total_weight = sum(event.weight for event in events)
-        if total_weight <= 0:
-            return state, None, 1.0, 0.0, 0.0
-        roll = tick_rng.namespaced(f"events:{state.tick}").random() * total_weight
-        accumulator = 0.0
-        selected = None
-        for event in events:
-            accumulator += event.weight
-            if roll <= accumulator:
-                selected = event
-                break
-        if selected is None:
-            return state, None, 1.0, 0.0, 0.0
-        demand_multiplier = selected.effects.get("demand_multiplier", 1.0)
-        quality_penalty = selected.effects.get("quality_penalty", 0.0)
-        reputation_bonus = selected.effects.get("reputation_bonus", 0.0)
+    def _event_log_entries(self, context: TickContext) -> list[EventLogEntry]:
+        entries: list[EventLogEntry] = []
+        event = context.event
+        if event is not None:
+            entries.append(
+                EventLogEntry(
+                    tick=context.tick,
+                    name=event.name,
+                    description=self._describe_event_effects(event.effects),
+                )
+            )
+        if context.completed_research:
+            completion_text = ", ".join(context.completed_research)
+            entries.append(
+                EventLogEntry(
+                    tick=context.tick,
+                    name="Research breakthrough",
+                    description=f"Unlocked: {completion_text}",
+                )
+            )
+        if context.hired:
+            entries.append(
+                EventLogEntry(
+                    tick=context.tick,
+                    name="New hires",
+                    description=f"Added {len(context.hired)} team members",
+                )
+            )
+        return entries
+
+    @staticmethod
+    def _describe_event_effects(effects: Mapping[str, float]) -> str:
+        demand_multiplier = effects.get("demand_multiplier", 1.0)
+        quality_penalty = effects.get("quality_penalty", 0.0)
+        reputation_bonus = effects.get("reputation_bonus", 0.0)
         effect_parts: list[str] = []
         if demand_multiplier != 1.0:
             effect_parts.append(f"Demand x{demand_multiplier:.2f}")
@@ -475,63 +537,10 @@ class SimulationPresenter:
             effect_parts.append(f"Quality -{quality_penalty:.2f}")
         if reputation_bonus:
             effect_parts.append(f"Reputation +{reputation_bonus:.1f}")
-        description = ", ".join(effect_parts) if effect_parts else "No immediate effects"
-        entry = EventLogEntry(
-            tick=state.tick,
-            name=selected.name,
-            description=description,
-        )
-        return state, entry, demand_multiplier, quality_penalty, reputation_bonus
-
-    def _update_products(
-        self,
-        state: GameState,
-        assets: AssetBundle,
-        tick_rng: RandomSource,
-        *,
-        quality_bonus: float,
-        demand_bonus: float,
-        demand_multiplier: float,
-        quality_penalty: float,
-    ) -> tuple[GameState, float]:
-        total_revenue = 0.0
-        demand_rng = tick_rng.namespaced(f"demand:{state.tick}")
-        for product in state.products:
-            quality = compute_quality(
-                state,
-                product=product,
-                assets=assets,
-                research_quality_bonus=quality_bonus,
-            )
-            if quality_penalty:
-                quality = max(0.0, quality - quality_penalty)
-            updated_product = product.update_quality(quality)
-            adoption = project_adoption(
-                state,
-                product=updated_product,
-                assets=assets,
-                rng=demand_rng.namespaced(f"{product.product_id}:{state.tick}"),
-                demand_bonus=demand_bonus,
-                demand_multiplier=demand_multiplier,
-            )
-            updated_product = updated_product.update_adoption(adoption)
-            state = state.update_product(product.product_id, updated_product)
-            total_revenue += updated_product.adoption * updated_product.price
-        return state, total_revenue
-
-    def _compute_research_points(self, team: TeamState) -> float:
-        points = 0.0
-        for member in team.members:
-            if member.role_id == "data_scientist":
-                points += member.skill * 2.0
-            elif member.role_id == "engineer":
-                points += member.skill * 0.75
-            else:
-                points += member.skill * 0.25
-        return points
+        return ", ".join(effect_parts) if effect_parts else "No immediate effects"
 
     def _record_tick(self, event: TickProcessed) -> None:
-        self._observed_ticks.append(event.tick)
+        self._latest_tick = event.tick
 
     def _on_achievement_unlocked(self, event: AchievementUnlocked) -> None:
         view_model = AchievementViewModel(
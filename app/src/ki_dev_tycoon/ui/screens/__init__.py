@@ -1,11 +1,41 @@
-"""Screen exports for the Textual UI."""
-
-from .dashboard import DashboardScreen
-from .team import TeamScreen
-from .research import ResearchScreen
-from .products import ProductsScreen
-from .market import MarketScreen
-from .events import EventsScreen
+"""Screen exports for the Textual UI.
+
+Screens are imported on first access so that the client only pays for the
+screens it actually shows.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .dashboard import DashboardScreen
+    from .events import EventsScreen
+    from .market import MarketScreen
+    from .products import ProductsScreen
+    from .research import ResearchScreen
+    from .team import TeamScreen
+
+_SCREEN_MODULES: dict[str, str] = {
+    "DashboardScreen": "dashboard",
+    "TeamScreen": "team",
+    "ResearchScreen": "research",
+    "ProductsScreen": "products",
+    "MarketScreen": "market",
+    "EventsScreen": "events",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _SCREEN_MODULES.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    screen = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = screen
+    return screen
+
 
 __all__ = [
     "DashboardScreen",
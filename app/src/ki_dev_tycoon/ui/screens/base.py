@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import Iterable, Sequence
+from typing import ClassVar, Iterable, Sequence
 
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical
@@ -11,18 +11,22 @@ from textual.events import Show
 from textual.screen import Screen
 from textual.widgets import Footer, Header
 
-from ..viewmodels import UiState
+from ..viewmodels import UI_SECTIONS, UiState, UiStateUpdate
 from ..widgets import NavItem, NavigationBar
 
 
 class BaseScreen(Screen[UiState]):
     """Common scaffolding for screens with navigation."""
 
+    SECTIONS: ClassVar[frozenset[str]] = UI_SECTIONS
+    """:class:`UiState` sections rendered by :meth:`update_view`."""
+
     def __init__(self, *, screen_id: str, title: str, nav_items: Sequence[NavItem]) -> None:
         super().__init__(id=screen_id)
         self._title = title
         self._nav_items = tuple(nav_items)
         self._navigation: NavigationBar | None = None
+        self._pending: UiState | None = None
         self.title = title
 
     def compose(self) -> ComposeResult:
@@ -42,6 +46,17 @@ class BaseScreen(Screen[UiState]):
     def update_view(self, state: UiState) -> None:
         """Update the widgets using ``state``."""
 
+    def apply_update(self, update: UiStateUpdate) -> None:
+        """Render ``update`` now if visible, otherwise defer until shown."""
+
+        if not update.affects(self.SECTIONS):
+            return
+        if self.is_current:
+            self._pending = None
+            self.update_view(update.state)
+        else:
+            self._pending = update.state
+
     def on_navigation_bar_nav_requested(self, message: NavigationBar.NavRequested) -> None:
         message.stop()
         if message.target != self.id:
@@ -51,4 +66,7 @@ class BaseScreen(Screen[UiState]):
         del event
         if self._navigation is not None:
             self._navigation.set_active(self.id or "")
+        if self._pending is not None:
+            state, self._pending = self._pending, None
+            self.update_view(state)
 
@@ -13,6 +13,8 @@ from .base import BaseScreen
 class DashboardScreen(BaseScreen):
     """High-level KPI overview."""
 
+    SECTIONS = frozenset({"dashboard", "events"})
+
     def __init__(self, nav_items: tuple[NavItem, ...]) -> None:
         super().__init__(screen_id="dashboard", title="Dashboard", nav_items=nav_items)
         self._kpi = KpiPanel()
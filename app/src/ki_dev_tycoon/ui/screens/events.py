@@ -14,6 +14,8 @@ from .base import BaseScreen
 class EventsScreen(BaseScreen):
     """Dedicated event timeline view."""
 
+    SECTIONS = frozenset({"events"})
+
     def __init__(self, nav_items: tuple[NavItem, ...]) -> None:
         super().__init__(screen_id="events", title="Events", nav_items=nav_items)
         self._hint = Static(
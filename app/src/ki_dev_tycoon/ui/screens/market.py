@@ -14,6 +14,8 @@ from .base import BaseScreen
 class MarketScreen(BaseScreen):
     """Display market demand and adoption."""
 
+    SECTIONS = frozenset({"markets"})
+
     def __init__(self, nav_items: tuple[NavItem, ...]) -> None:
         super().__init__(screen_id="market", title="Markt", nav_items=nav_items)
         self._summary = Static(id="market-summary")
@@ -14,6 +14,8 @@ from .base import BaseScreen
 class ProductsScreen(BaseScreen):
     """Display portfolio metrics and related events."""
 
+    SECTIONS = frozenset({"products", "events"})
+
     def __init__(self, nav_items: tuple[NavItem, ...]) -> None:
         super().__init__(screen_id="products", title="Produkte", nav_items=nav_items)
         self._products = ProductTable()
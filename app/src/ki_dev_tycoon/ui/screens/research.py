@@ -14,6 +14,8 @@ from .base import BaseScreen
 class ResearchScreen(BaseScreen):
     """Visualise research progress and backlog."""
 
+    SECTIONS = frozenset({"research"})
+
     def __init__(self, nav_items: tuple[NavItem, ...]) -> None:
         super().__init__(screen_id="research", title="Forschung", nav_items=nav_items)
         self._tree = ResearchTree()
@@ -13,6 +13,8 @@ from .base import BaseScreen
 class TeamScreen(BaseScreen):
     """Display team composition and related events."""
 
+    SECTIONS = frozenset({"team", "events"})
+
     def __init__(self, nav_items: tuple[NavItem, ...]) -> None:
         super().__init__(screen_id="team", title="Team", nav_items=nav_items)
         self._team = TeamTable()
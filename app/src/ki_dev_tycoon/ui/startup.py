@@ -0,0 +1,48 @@
+"""Startup-time breakdown for the Textual client."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class StartupTimer:
+    """Record named phases between ``origin`` and the first rendered dashboard.
+
+    ``origin`` defaults to the moment the timer is created; entry points pass
+    a ``perf_counter`` value taken before their heavy imports.
+    """
+
+    origin: float = field(default_factory=time.perf_counter)
+    _marks: list[tuple[str, float]] = field(default_factory=list, init=False)
+
+    def mark(self, phase: str) -> None:
+        """Record that ``phase`` finished now; repeated phases keep the first mark."""
+
+        if not any(name == phase for name, _ in self._marks):
+            self._marks.append((phase, time.perf_counter()))
+
+    def has(self, phase: str) -> bool:
+        return any(name == phase for name, _ in self._marks)
+
+    def breakdown(self) -> tuple[tuple[str, float, float], ...]:
+        """Return ``(phase, duration_ms, elapsed_ms)`` for each recorded phase."""
+
+        rows: list[tuple[str, float, float]] = []
+        previous = self.origin
+        for phase, at in self._marks:
+            rows.append((phase, (at - previous) * 1_000, (at - self.origin) * 1_000))
+            previous = at
+        return tuple(rows)
+
+    def format(self) -> str:
+        """Render the breakdown as a small fixed-width table."""
+
+        lines = [f"{'phase':<16}{'ms':>10}{'total ms':>12}"]
+        for phase, duration, elapsed in self.breakdown():
+            lines.append(f"{phase:<16}{duration:>10.1f}{elapsed:>12.1f}")
+        return "\n".join(lines)
+
+
+__all__ = ["StartupTimer"]
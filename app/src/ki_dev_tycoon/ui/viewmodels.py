@@ -141,3 +141,21 @@ class UiState:
     markets: tuple[MarketViewModel, ...]
     events: tuple[EventLogEntry, ...]
     achievements: tuple[AchievementViewModel, ...]
+
+
+UI_SECTIONS: frozenset[str] = frozenset(
+    {"dashboard", "team", "research", "products", "markets", "events", "achievements"}
+)
+
+
+@dataclass(slots=True, frozen=True)
+class UiStateUpdate:
+    """A new :class:`UiState` together with the sections that changed."""
+
+    state: UiState
+    changed: frozenset[str]
+
+    def affects(self, sections: Iterable[str]) -> bool:
+        """Return whether any of ``sections`` changed in this update."""
+
+        return not self.changed.isdisjoint(sections)
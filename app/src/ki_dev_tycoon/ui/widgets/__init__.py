@@ -8,8 +8,10 @@ from .product_table import ProductTable
 from .market_table import MarketTable
 from .event_log import EventLog
 from .research_tree import ResearchTree
+from .virtual_table import ColumnSpec, RowDiff, VirtualTable
 
 __all__ = [
+    "ColumnSpec",
     "EventLog",
     "KpiPanel",
     "MarketTable",
@@ -19,4 +21,6 @@ __all__ = [
     "TeamTable",
     "Timeline",
     "ResearchTree",
+    "RowDiff",
+    "VirtualTable",
 ]
@@ -4,36 +4,53 @@ from __future__ import annotations
 
 from typing import Iterable
 
-from rich.table import Table
-from textual.widget import Widget
-
 from ..viewmodels import EventLogEntry
+from .virtual_table import ColumnSpec, RowDiff, VirtualTable
 
 
-class EventLog(Widget):
-    """Render the recent simulation events."""
+def _entry_cells(entry: tuple[str, EventLogEntry]) -> tuple[str, ...]:
+    _, event = entry
+    return (str(event.tick), event.name, event.description)
+
+
+def _keyed(events: Iterable[EventLogEntry]) -> list[tuple[str, EventLogEntry]]:
+    """Assign stable keys, numbering repeated entries within the window."""
 
-    DEFAULT_CSS = "EventLog { width: 1fr; height: auto; padding: 0 1; }"
+    seen: dict[EventLogEntry, int] = {}
+    keyed = []
+    for event in events:
+        occurrence = seen.get(event, 0)
+        seen[event] = occurrence + 1
+        keyed.append(
+            (f"{event.tick}:{event.name}:{event.description}#{occurrence}", event)
+        )
+    return keyed
+
+
+class EventLog(VirtualTable[tuple[str, EventLogEntry]]):
+    """Render the recent simulation events."""
 
     def __init__(self, *, rows: int = 12) -> None:
-        super().__init__()
+        super().__init__(
+            title="Event log",
+            columns=(
+                ColumnSpec("Tick", justify="right"),
+                ColumnSpec("Event", style="bold"),
+                ColumnSpec("Details"),
+            ),
+            placeholder=("–", "No events", "Simulation idle"),
+        )
         self._rows = rows
         self._events: tuple[EventLogEntry, ...] = ()
 
-    def update_view(self, events: Iterable[EventLogEntry]) -> None:
-        events_tuple = tuple(events)
-        self._events = events_tuple[-self._rows :]
-        self.refresh()
-
-    def render(self) -> Table:
-        table = Table(title="Event log", pad_edge=False)
-        table.add_column("Tick", justify="right")
-        table.add_column("Event", justify="left", style="bold")
-        table.add_column("Details", justify="left")
-        if not self._events:
-            table.add_row("–", "No events", "Simulation idle")
-            return table
-        for entry in self._events:
-            table.add_row(str(entry.tick), entry.name, entry.description)
-        return table
-
+    def update_view(self, events: Iterable[EventLogEntry]) -> RowDiff:
+        visible = tuple(events)[-self._rows :]
+        if visible == self._events:
+            return RowDiff()
+        self._events = visible
+        diff = self.sync(
+            _keyed(visible), key=lambda entry: entry[0], cells=_entry_cells
+        )
+        if self.is_mounted:
+            self.scroll_end(animate=False)
+        return diff
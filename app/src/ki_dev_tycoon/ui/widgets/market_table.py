@@ -20,7 +20,10 @@ class MarketTable(Widget):
         self._markets: tuple[MarketViewModel, ...] = ()
 
     def update_view(self, markets: Iterable[MarketViewModel]) -> None:
-        self._markets = tuple(markets)
+        markets_tuple = tuple(markets)
+        if markets_tuple is self._markets:
+            return
+        self._markets = markets_tuple
         self.refresh()
 
     def render(self) -> Table:
@@ -20,6 +20,8 @@ class ResearchTree(Widget):
         self._research: ResearchViewModel | None = None
 
     def update_view(self, research: ResearchViewModel) -> None:
+        if research is self._research:
+            return
         self._research = research
         self.refresh()
 
@@ -2,54 +2,76 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from dataclasses import dataclass
 from typing import Iterable
 
-from rich.table import Table
-from textual.widget import Widget
-
 from ..viewmodels import TeamMemberViewModel, TeamViewModel
+from .virtual_table import ColumnSpec, RowDiff, VirtualTable
 
 
-class TeamTable(Widget):
-    """Render the current team composition."""
+@dataclass(slots=True, frozen=True)
+class RoleSummary:
+    """Aggregated headcount, skill and payroll for a single role."""
+
+    role_name: str
+    headcount: int
+    average_skill: float
+    salary: float
+
+
+def summarise_roles(members: Iterable[TeamMemberViewModel]) -> tuple[RoleSummary, ...]:
+    """Aggregate ``members`` per role in a single pass, sorted by role name."""
+
+    totals: dict[str, list[float]] = {}
+    for member in members:
+        bucket = totals.get(member.role_name)
+        if bucket is None:
+            bucket = totals[member.role_name] = [0.0, 0.0, 0.0]
+        bucket[0] += 1
+        bucket[1] += member.skill
+        bucket[2] += member.salary
+    return tuple(
+        RoleSummary(
+            role_name=role_name,
+            headcount=int(count),
+            average_skill=skill / count,
+            salary=salary,
+        )
+        for role_name, (count, skill, salary) in sorted(totals.items())
+    )
 
-    DEFAULT_CSS = "TeamTable { width: 1fr; height: auto; padding: 0 1; }"
+
+def _summary_cells(summary: RoleSummary) -> tuple[str, ...]:
+    return (
+        summary.role_name,
+        str(summary.headcount),
+        f"{summary.average_skill:.2f}",
+        f"€{summary.salary:,.0f}",
+    )
+
+
+class TeamTable(VirtualTable[RoleSummary]):
+    """Render the current team composition."""
 
     def __init__(self) -> None:
-        super().__init__()
+        super().__init__(
+            title="Team",
+            columns=(
+                ColumnSpec("Role", style="bold"),
+                ColumnSpec("Headcount", justify="right"),
+                ColumnSpec("Average skill", justify="right"),
+                ColumnSpec("Salary / day", justify="right"),
+            ),
+            placeholder=("No staff", "0", "–", "–"),
+        )
         self._team: TeamViewModel | None = None
 
-    def update_view(self, team: TeamViewModel) -> None:
+    def update_view(self, team: TeamViewModel) -> RowDiff:
+        if team is self._team:
+            return RowDiff()
         self._team = team
-        self.refresh()
-
-    def _aggregate(self, members: Iterable[TeamMemberViewModel]) -> Table:
-        table = Table(title="Team", pad_edge=False)
-        table.add_column("Role", justify="left", style="bold")
-        table.add_column("Headcount", justify="right")
-        table.add_column("Average skill", justify="right")
-        table.add_column("Salary / day", justify="right")
-
-        buckets: dict[str, list[TeamMemberViewModel]] = defaultdict(list)
-        for member in members:
-            buckets[member.role_name].append(member)
-        if not buckets:
-            table.add_row("No staff", "0", "–", "–")
-            return table
-        for role_name, bucket in sorted(buckets.items(), key=lambda item: item[0]):
-            average_skill = sum(member.skill for member in bucket) / len(bucket)
-            salary = sum(member.salary for member in bucket)
-            table.add_row(
-                role_name,
-                str(len(bucket)),
-                f"{average_skill:.2f}",
-                f"€{salary:,.0f}",
-            )
-        return table
-
-    def render(self) -> Table:
-        if self._team is None:
-            return self._aggregate(())
-        return self._aggregate(self._team.members)
-
+        return self.sync(
+            summarise_roles(team.members),
+            key=lambda summary: summary.role_name,
+            cells=_summary_cells,
+        )
@@ -2,47 +2,47 @@
 
 from __future__ import annotations
 
-from typing import Iterable
-
-from rich.table import Table
-from textual.widget import Widget
-
 from ..viewmodels import DashboardViewModel, KpiSnapshot
+from .virtual_table import ColumnSpec, RowDiff, VirtualTable
 
 
-class Timeline(Widget):
-    """Render the KPI history as a compact table."""
+def _snapshot_cells(snapshot: KpiSnapshot) -> tuple[str, ...]:
+    return (
+        str(snapshot.tick),
+        f"€{snapshot.cash:,.0f}",
+        f"€{snapshot.revenue:,.0f}",
+        f"{snapshot.adoption:,d}",
+        f"{snapshot.avg_quality:.2f}",
+    )
 
-    DEFAULT_CSS = "Timeline { width: 1fr; height: auto; padding: 0 1; }"
+
+class Timeline(VirtualTable[KpiSnapshot]):
+    """Render the KPI history as a compact, scrollable table."""
 
     def __init__(self, *, rows: int = 10) -> None:
-        super().__init__()
+        super().__init__(
+            title="Recent KPIs",
+            columns=(
+                ColumnSpec("Tick", justify="right"),
+                ColumnSpec("Cash", justify="right"),
+                ColumnSpec("Revenue", justify="right"),
+                ColumnSpec("Adoption", justify="right"),
+                ColumnSpec("Quality", justify="right"),
+            ),
+            placeholder=("–", "–", "–", "–", "–"),
+        )
         self._dashboard: DashboardViewModel | None = None
         self._rows = rows
 
-    def update_view(self, dashboard: DashboardViewModel) -> None:
+    def update_view(self, dashboard: DashboardViewModel) -> RowDiff:
+        if dashboard is self._dashboard:
+            return RowDiff()
         self._dashboard = dashboard
-        self.refresh()
-
-    def _rows_for(self, history: Iterable[KpiSnapshot]) -> Table:
-        table = Table(title="Recent KPIs", pad_edge=False)
-        table.add_column("Tick", justify="right")
-        table.add_column("Cash", justify="right")
-        table.add_column("Revenue", justify="right")
-        table.add_column("Adoption", justify="right")
-        table.add_column("Quality", justify="right")
-        for snapshot in history:
-            table.add_row(
-                str(snapshot.tick),
-                f"€{snapshot.cash:,.0f}",
-                f"€{snapshot.revenue:,.0f}",
-                f"{snapshot.adoption:,d}",
-                f"{snapshot.avg_quality:.2f}",
-            )
-        return table
-
-    def render(self) -> Table:
-        if self._dashboard is None:
-            return self._rows_for(())
-        return self._rows_for(self._dashboard.tail(self._rows))
-
+        diff = self.sync(
+            dashboard.tail(self._rows),
+            key=lambda snapshot: str(snapshot.tick),
+            cells=_snapshot_cells,
+        )
+        if self.is_mounted:
+            self.scroll_end(animate=False)
+        return diff
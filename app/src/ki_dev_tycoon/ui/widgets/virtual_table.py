@@ -0,0 +1,199 @@
+"""Virtualized table widget fed from keyed row diffs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Generic, Iterable, Sequence, TypeVar
+
+from rich.text import Text
+from textual.widgets import DataTable
+
+T = TypeVar("T")
+
+PLACEHOLDER_KEY = "__placeholder__"
+
+
+@dataclass(slots=True, frozen=True)
+class ColumnSpec:
+    """Header label and cell styling for a single table column."""
+
+    label: str
+    justify: str = "left"
+    style: str = ""
+
+
+@dataclass(slots=True, frozen=True)
+class RowDiff:
+    """Number of rows touched by a :meth:`VirtualTable.sync` call."""
+
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    rebuilt: bool = False
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.removed or self.rebuilt)
+
+
+class VirtualTable(DataTable[Text], Generic[T]):
+    """Data table that only paints visible rows and updates from diffs.
+
+    Rows are identified by a stable key. Each sync compares the incoming items
+    with the cached source objects and formatted cells, so unchanged rows are
+    neither re-formatted nor re-rendered; ``DataTable`` itself only renders
+    the lines inside the viewport.
+    """
+
+    DEFAULT_CSS = """
+    VirtualTable {
+        width: 1fr;
+        height: 1fr;
+        min-height: 5;
+        padding: 0 1;
+        border: round $primary-background;
+    }
+    """
+
+    def __init__(
+        self,
+        *,
+        title: str,
+        columns: Sequence[ColumnSpec],
+        placeholder: Sequence[str],
+    ) -> None:
+        super().__init__(show_cursor=False, cursor_type="row", zebra_stripes=True)
+        if len(placeholder) != len(columns):
+            msg = "placeholder must provide one cell per column"
+            raise ValueError(msg)
+        self.border_title = title
+        self._columns = tuple(columns)
+        self._column_keys = tuple(
+            self.add_column(column.label, key=f"col-{index}")
+            for index, column in enumerate(self._columns)
+        )
+        self._placeholder = tuple(placeholder)
+        self._order: list[str] = []
+        self._cells: dict[str, tuple[str, ...]] = {}
+        self._sources: dict[str, T] = {}
+        # Rows whose cell updates still wait for the idle width measurement.
+        self._width_pending: set[str] = set()
+        self._show_placeholder()
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        """Return the keys of the rows currently shown, in display order."""
+
+        return tuple(self._order)
+
+    def cells(self, key: str) -> tuple[str, ...]:
+        """Return the cached formatted cells for ``key``."""
+
+        return self._cells[key]
+
+    def sync(
+        self,
+        items: Iterable[T],
+        *,
+        key: Callable[[T], str],
+        cells: Callable[[T], Sequence[str]],
+    ) -> RowDiff:
+        """Bring the table in line with ``items`` touching as few rows as possible."""
+
+        incoming: dict[str, T] = {}
+        for item in items:
+            incoming[key(item)] = item
+        formatted = {
+            row_key: self._format(row_key, item, cells)
+            for row_key, item in incoming.items()
+        }
+        self._sources = incoming
+        if not incoming:
+            if self._order == [PLACEHOLDER_KEY]:
+                return RowDiff()
+            self._clear_rows()
+            self._show_placeholder()
+            return RowDiff(rebuilt=True)
+
+        if self._order == [PLACEHOLDER_KEY]:
+            self._clear_rows()
+
+        kept = [row_key for row_key in self._order if row_key in incoming]
+        new_order = list(incoming)
+        if new_order[: len(kept)] != kept:
+            self._clear_rows()
+            self._append(new_order, formatted)
+            return RowDiff(added=len(new_order), rebuilt=True)
+
+        removed = 0
+        for row_key in self._order:
+            if row_key not in incoming:
+                self.remove_row(row_key)
+                self._width_pending.discard(row_key)
+                del self._cells[row_key]
+                removed += 1
+        updated = 0
+        for row_key in kept:
+            new_cells = formatted[row_key]
+            old_cells = self._cells[row_key]
+            if new_cells == old_cells:
+                continue
+            for index, (old, new) in enumerate(zip(old_cells, new_cells)):
+                if old != new:
+                    self.update_cell(
+                        row_key,
+                        self._column_keys[index],
+                        self._styled(index, new),
+                        update_width=True,
+                    )
+            self._cells[row_key] = new_cells
+            self._width_pending.add(row_key)
+            updated += 1
+        self._order = kept
+        added = new_order[len(kept) :]
+        self._append(added, formatted)
+        return RowDiff(added=len(added), updated=updated, removed=removed)
+
+    def _format(
+        self, row_key: str, item: T, cells: Callable[[T], Sequence[str]]
+    ) -> tuple[str, ...]:
+        previous = self._sources.get(row_key)
+        cached = self._cells.get(row_key)
+        if cached is not None and previous is not None:
+            if previous is item or previous == item:
+                return cached
+        return tuple(cells(item))
+
+    def _append(
+        self, row_keys: Sequence[str], formatted: dict[str, tuple[str, ...]]
+    ) -> None:
+        for row_key in row_keys:
+            row_cells = formatted[row_key]
+            self.add_row(
+                *(self._styled(index, cell) for index, cell in enumerate(row_cells)),
+                key=row_key,
+            )
+            self._cells[row_key] = row_cells
+            self._order.append(row_key)
+
+    def on_idle(self) -> None:
+        # DataTable measures the pending cell widths on the same idle event.
+        self._width_pending.clear()
+
+    def _clear_rows(self) -> None:
+        # clear() keeps cell updates queued for width measurement, which would
+        # point at rows that no longer exist when the table idles; remove_row
+        # drops them.
+        for row_key in self._width_pending:
+            self.remove_row(row_key)
+        self._width_pending.clear()
+        self.clear()
+        self._order = []
+        self._cells = {}
+
+    def _show_placeholder(self) -> None:
+        self._append([PLACEHOLDER_KEY], {PLACEHOLDER_KEY: self._placeholder})
+
+    def _styled(self, index: int, value: str) -> Text:
+        column = self._columns[index]
+        return Text(value, justify=column.justify, style=column.style)  # type: ignore[arg-type]
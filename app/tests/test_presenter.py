@@ -0,0 +1,116 @@
+"""Tests for the incremental presenter refresh path."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+APP_SRC = ROOT / "app" / "src"
+SIM_SRC = ROOT / "sim" / "src"
+for path in (str(SIM_SRC), str(APP_SRC)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from ki_dev_tycoon.ui.presenter import SimulationPresenter, SimulationPresenterConfig
+from ki_dev_tycoon.ui.viewmodels import UI_SECTIONS, UiStateUpdate
+
+
+def test_refresh_advances_live_simulation_incrementally() -> None:
+    presenter = SimulationPresenter(
+        SimulationPresenterConfig(ticks=8, seed=5, ticks_per_refresh=2)
+    )
+
+    first = asyncio.run(presenter.build_ui_update())
+    second = asyncio.run(presenter.build_ui_update())
+    fresh = asyncio.run(
+        SimulationPresenter(SimulationPresenterConfig(ticks=10, seed=5)).build_ui_state()
+    )
+
+    assert first.changed == UI_SECTIONS
+    assert second.state.dashboard.current_tick == 10
+    assert "dashboard" in second.changed
+    assert second.state.dashboard == fresh.dashboard
+    assert second.state.events == fresh.events
+
+
+def test_refresh_without_ticks_reports_no_changes() -> None:
+    presenter = SimulationPresenter(
+        SimulationPresenterConfig(ticks=4, seed=1, ticks_per_refresh=0)
+    )
+
+    first = asyncio.run(presenter.build_ui_update())
+    second = asyncio.run(presenter.build_ui_update())
+
+    assert second.changed == frozenset()
+    assert second.state.team is first.state.team
+
+
+def test_dashboard_history_keeps_only_the_recent_tail() -> None:
+    presenter = SimulationPresenter(
+        SimulationPresenterConfig(ticks=12, seed=5, history_size=5)
+    )
+
+    state = asyncio.run(presenter.build_ui_state())
+
+    assert [snapshot.tick for snapshot in state.dashboard.history] == list(range(8, 13))
+    assert presenter.latest_tick == 12
+
+
+def test_forecast_previews_live_session_without_advancing_it() -> None:
+    presenter = SimulationPresenter(SimulationPresenterConfig(ticks=10, seed=3))
+
+    assert asyncio.run(presenter.forecast(30)) == ()
+    state = asyncio.run(presenter.build_ui_state())
+    forecast = asyncio.run(presenter.forecast(30, resolution="weekly"))
+    refreshed = asyncio.run(presenter.build_ui_state())
+    untouched = SimulationPresenter(SimulationPresenterConfig(ticks=10, seed=3))
+    asyncio.run(untouched.build_ui_state())
+
+    assert [snapshot.tick for snapshot in forecast] == [17, 24, 31, 38, 40]
+    assert forecast[0].cash_delta == (forecast[0].cash - state.dashboard.cash) / 7
+    assert refreshed.dashboard == asyncio.run(untouched.build_ui_state()).dashboard
+
+
+def test_api_refresh_uses_conditional_requests() -> None:
+    import httpx
+
+    from ki_dev_tycoon.api import create_app
+    from ki_dev_tycoon.app import SimulationConfig
+
+    api = create_app(
+        SimulationConfig(
+            ticks=3,
+            seed=2,
+            daily_active_users=1_000,
+            arp_dau=0.1,
+            operating_costs=50.0,
+        )
+    )
+    statuses: list[int] = []
+
+    async def record(response: httpx.Response) -> None:
+        statuses.append(response.status_code)
+
+    async def scenario() -> tuple[UiStateUpdate, UiStateUpdate]:
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=api),
+            base_url="http://testserver",
+            event_hooks={"response": [record]},
+        )
+        presenter = SimulationPresenter(
+            SimulationPresenterConfig(source="api", api_url="http://testserver"),
+            http_client=client,
+        )
+        first = await presenter.build_ui_update()
+        second = await presenter.build_ui_update()
+        await presenter.aclose()
+        await client.aclose()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert statuses == [200, 304]
+    assert second.state is first.state
+    assert second.changed == frozenset()
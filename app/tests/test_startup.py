@@ -0,0 +1,65 @@
+"""Tests for the lazy startup path of the Textual client."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+APP_SRC = ROOT / "app" / "src"
+SIM_SRC = ROOT / "sim" / "src"
+for path in (str(SIM_SRC), str(APP_SRC)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from ki_dev_tycoon.ui.app import SCREEN_CLASSES, TycoonApp
+from ki_dev_tycoon.ui.startup import StartupTimer
+
+
+def test_startup_timer_keeps_first_mark_per_phase() -> None:
+    timer = StartupTimer(origin=0.0)
+    timer.mark("imports")
+    timer.mark("mount")
+    timer.mark("imports")
+
+    phases = [phase for phase, _, _ in timer.breakdown()]
+    assert phases == ["imports", "mount"]
+    assert timer.has("mount") and not timer.has("first_paint")
+    durations = timer.breakdown()
+    assert durations[1][2] == pytest.approx(durations[0][1] + durations[1][1])
+    assert timer.format().splitlines()[0].split() == ["phase", "ms", "total", "ms"]
+
+
+def test_app_construction_builds_no_screens() -> None:
+    timer = StartupTimer()
+    app = TycoonApp(startup=timer)
+
+    assert app.startup is timer
+    assert timer.has("app_init")
+    assert app._screens == {}
+    assert set(SCREEN_CLASSES) >= {"dashboard", "team", "events"}
+
+
+def test_ui_package_import_defers_screen_modules() -> None:
+    code = (
+        "import sys\n"
+        "import ki_dev_tycoon.ui.app\n"
+        "loaded = [name for name in sys.modules"
+        " if name.startswith('ki_dev_tycoon.ui.screens.')"
+        " and not name.endswith('.base')]\n"
+        "print(','.join(sorted(loaded)))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(APP_SRC), str(SIM_SRC)]))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+
+    assert result.stdout.strip() == ""
@@ -38,3 +38,26 @@ def test_dashboard_kpi_snapshot() -> None:
     expected = snapshot_path.read_text(encoding="utf-8")
     assert output == expected
 
+
+
+def test_presenter_matches_cli_simulation() -> None:
+    """The UI and the CLI share one tick pipeline and report identical numbers."""
+
+    from ki_dev_tycoon.app import SimulationConfig, run_simulation
+
+    presenter = SimulationPresenter(SimulationPresenterConfig(ticks=12, seed=3))
+    state = asyncio.run(presenter.build_ui_state())
+    result = run_simulation(
+        SimulationConfig(
+            ticks=12,
+            seed=3,
+            daily_active_users=5_000,
+            arp_dau=0.12,
+            operating_costs=450.0,
+        )
+    )
+
+    assert state.dashboard.current_tick == result.final_tick
+    assert round(state.dashboard.cash, 2) == result.cash
+    assert round(state.dashboard.reputation, 2) == result.reputation
+    assert presenter.latest_tick == result.final_tick
@@ -0,0 +1,135 @@
+"""Tests for the virtualized table widgets."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Callable, TypeVar
+
+ROOT = Path(__file__).resolve().parents[2]
+APP_SRC = ROOT / "app" / "src"
+SIM_SRC = ROOT / "sim" / "src"
+for path in (str(SIM_SRC), str(APP_SRC)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from textual.app import App, ComposeResult
+from textual.widget import Widget
+
+from ki_dev_tycoon.ui.viewmodels import (
+    EventLogEntry,
+    ProductViewModel,
+    TeamMemberViewModel,
+    TeamViewModel,
+)
+from ki_dev_tycoon.ui.widgets import (
+    EventLog,
+    ProductTable,
+    RowDiff,
+    TeamTable,
+    VirtualTable,
+)
+from ki_dev_tycoon.ui.widgets.virtual_table import PLACEHOLDER_KEY
+
+W = TypeVar("W", bound=Widget)
+
+
+def _product(index: int, adoption: int = 0) -> ProductViewModel:
+    return ProductViewModel(
+        product_id=f"product_{index}",
+        name=f"Product {index}",
+        market="SaaS",
+        price=10.0,
+        quality=0.5,
+        adoption=adoption,
+    )
+
+
+def _mounted(factory: Callable[[], W], check: Callable[[W], None]) -> None:
+    class _WidgetApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield factory()
+
+    async def scenario() -> None:
+        app = _WidgetApp()
+        async with app.run_test(size=(80, 20)) as pilot:
+            await pilot.pause()
+            check(app.query_one(VirtualTable))  # type: ignore[arg-type]
+
+    asyncio.run(scenario())
+
+
+def test_product_table_applies_row_diffs() -> None:
+    def check(table: ProductTable) -> None:
+        assert table.keys == (PLACEHOLDER_KEY,)
+        products = [_product(index) for index in range(500)]
+        assert table.update_view(products) == RowDiff(added=500)
+
+        products[42] = _product(42, adoption=1_234)
+        shifted = products[1:] + [_product(500)]
+        assert table.update_view(shifted) == RowDiff(added=1, updated=1, removed=1)
+        assert table.cells("product_42")[-1] == "1,234"
+        assert table.row_count == 500
+        assert not table.update_view(list(shifted)).changed
+
+        assert table.update_view(()).rebuilt
+        assert table.keys == (PLACEHOLDER_KEY,)
+
+    _mounted(ProductTable, check)
+
+
+def test_team_table_aggregates_large_rosters_once() -> None:
+    members = tuple(
+        TeamMemberViewModel(
+            role_id=f"role_{index % 3}",
+            role_name=f"Role {index % 3}",
+            skill=0.5,
+            training_progress=0.0,
+            salary=100.0,
+        )
+        for index in range(3_000)
+    )
+
+    def check(table: TeamTable) -> None:
+        assert table.update_view(TeamViewModel(members=members)).added == 3
+        assert table.keys == ("Role 0", "Role 1", "Role 2")
+        assert table.cells("Role 1") == ("Role 1", "1000", "0.50", "€100,000")
+
+    _mounted(TeamTable, check)
+
+
+def test_event_log_keeps_duplicate_entries_apart() -> None:
+    entry = EventLogEntry(tick=1, name="Hire", description="Developer")
+
+    def check(log: EventLog) -> None:
+        log.update_view([entry, entry])
+        diff = log.update_view([entry, entry, EventLogEntry(2, "Research", "Done")])
+        assert log.row_count == 3
+        assert diff == RowDiff(added=1)
+
+    _mounted(lambda: EventLog(rows=3), check)
+
+
+def test_virtual_table_renders_only_visible_rows() -> None:
+    rendered: set[int] = set()
+
+    class _CountingTable(ProductTable):
+        def render_line(self, y: int):  # type: ignore[no-untyped-def]
+            rendered.add(y + self.scroll_offset.y)
+            return super().render_line(y)
+
+    class _TableApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield _CountingTable()
+
+    async def scenario() -> int:
+        app = _TableApp()
+        async with app.run_test(size=(80, 20)) as pilot:
+            table = app.query_one(_CountingTable)
+            table.update_view([_product(index) for index in range(2_000)])
+            await pilot.pause()
+            return table.row_count
+
+    assert asyncio.run(scenario()) == 2_000
+    assert 0 < len(rendered) <= 20
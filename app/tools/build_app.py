@@ -47,7 +47,23 @@ def _write_version_metadata(target: Path, version: str) -> None:
     target.write_text(f"{version}\n", encoding="utf-8")
 
 
-def _copy_support_files(dist_dir: Path, mode: str) -> None:
+def _compiled_assets_path(work_dir: Path) -> Path:
+    from ki_dev_tycoon.data import COMPILED_ASSETS_NAME
+
+    return work_dir / "compiled" / COMPILED_ASSETS_NAME
+
+
+def _compile_assets(asset_root: Path, target: Path) -> Path:
+    """Validate the YAML assets once at build time and store them in binary form."""
+
+    from ki_dev_tycoon.data import compile_assets
+
+    return compile_assets(asset_root, target)
+
+
+def _copy_support_files(
+    dist_dir: Path, mode: str, compiled_assets: Path | None = None
+) -> None:
     licence_src = REPO_ROOT / "LICENSE"
     if licence_src.exists():
         shutil.copy2(licence_src, dist_dir / "LICENSE")
@@ -59,6 +75,8 @@ def _copy_support_files(dist_dir: Path, mode: str) -> None:
         if target_assets.exists():
             shutil.rmtree(target_assets)
         shutil.copytree(ASSET_ROOT, target_assets)
+        if compiled_assets is not None:
+            shutil.copy2(compiled_assets, target_assets / compiled_assets.name)
 
 
 def build_application(
@@ -74,6 +92,7 @@ def build_application(
     assets: Sequence[Path],
     clean: bool,
     dry_run: bool,
+    compile_assets: bool = True,
 ) -> Path:
 
     dist_dir = dist_dir.expanduser().resolve()
@@ -108,6 +127,14 @@ def build_application(
     for data in _collect_add_data(assets):
         command.append(f"--add-data={data}")
 
+    compiled_assets: Path | None = None
+    if compile_assets and ASSET_ROOT.exists():
+        compiled_assets = _compiled_assets_path(work_dir)
+        if not dry_run:
+            _compile_assets(ASSET_ROOT, compiled_assets)
+        # Lands next to the YAML files so ``load_assets`` skips YAML parsing.
+        command.append(f"--add-data={compiled_assets}{os.pathsep}{ASSET_ROOT.name}")
+
     command.append(str(entry))
 
     if dry_run:
@@ -127,7 +154,9 @@ def build_application(
         target.mkdir(exist_ok=True)
         version_file = target / "VERSION.txt"
     _write_version_metadata(version_file, version)
-    _copy_support_files(target if target.is_dir() else target.parent, mode)
+    _copy_support_files(
+        target if target.is_dir() else target.parent, mode, compiled_assets
+    )
     return target
 
 
@@ -149,8 +178,14 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         help="Additional asset directories to bundle.",
     )
     parser.add_argument("--no-clean", action="store_false", dest="clean")
+    parser.add_argument(
+        "--no-compile-assets",
+        action="store_false",
+        dest="compile_assets",
+        help="Bundle only the YAML assets instead of a precompiled asset file.",
+    )
     parser.add_argument("--dry-run", action="store_true")
-    parser.set_defaults(clean=True)
+    parser.set_defaults(clean=True, compile_assets=True)
     return parser.parse_args(argv)
 
 
@@ -171,6 +206,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             assets=assets,
             clean=args.clean,
             dry_run=args.dry_run,
+            compile_assets=args.compile_assets,
         )
     except Exception as exc:  # pragma: no cover - exercised via CLI
         print(f"Build failed: {exc}", file=sys.stderr)
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
-from importlib import metadata
 from pkgutil import extend_path
 
 __path__ = extend_path(__path__, __name__)
 __all__ = ["__version__"]
 
-try:
-    __version__ = metadata.version("ki-dev-tycoon")
-except metadata.PackageNotFoundError:  # pragma: no cover - during local edits
-    __version__ = "0.0.0"
+
+def __getattr__(name: str) -> str:
+    # ``importlib.metadata`` is slow to import; resolve the version on demand.
+    if name != "__version__":
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    from importlib import metadata
+
+    try:
+        version = metadata.version("ki-dev-tycoon")
+    except metadata.PackageNotFoundError:  # pragma: no cover - during local edits
+        version = "0.0.0"
+    globals()["__version__"] = version
+    return version
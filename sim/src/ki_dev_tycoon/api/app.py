@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 from dataclasses import replace
 from pathlib import Path
 from threading import Lock
 from typing import Iterable, Literal
 
-from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, status
 from pydantic import BaseModel, Field
 
 from ki_dev_tycoon import __version__
@@ -17,6 +19,7 @@ from ki_dev_tycoon.app import SimulationConfig, SimulationResult, run_simulation
 from ki_dev_tycoon.core.state import GameState, ProductState
 from ki_dev_tycoon.data import load_assets
 from ki_dev_tycoon.persistence.savegame import load_game
+from ki_dev_tycoon.pipeline.macro import Resolution
 
 
 def _default_simulation_config() -> SimulationConfig:
@@ -37,6 +40,10 @@ class SimulationRequest(BaseModel):
     daily_active_users: int | None = Field(None, ge=0)
     arp_dau: float | None = Field(None, ge=0.0)
     operating_costs: float | None = Field(None, ge=0.0)
+    resolution: Resolution | None = Field(
+        None,
+        description="Tick resolution; 'weekly' or 'monthly' return fast approximate previews.",
+    )
     save_path: Path | None = Field(
         None,
         description="Optional path to a savegame that should be loaded instead of running a simulation.",
@@ -60,6 +67,9 @@ class SimulationRequest(BaseModel):
                 if self.operating_costs is not None
                 else base.operating_costs
             ),
+            resolution=(
+                self.resolution if self.resolution is not None else base.resolution
+            ),
         )
 
 
@@ -83,6 +93,9 @@ class SimulationRepository:
         self._config = replace(config, asset_root=self._asset_root)
         self._state: GameState | None = None
         self._result: SimulationResult | None = None
+        self._generation = 0
+        self._etag: str | None = None
+        self._state_dto: SimulationStateDTO | None = None
         self.refresh()
 
     _UNSET = object()
@@ -96,6 +109,9 @@ class SimulationRepository:
         """Recompute the simulation snapshot."""
 
         with self._lock:
+            self._generation += 1
+            self._etag = None
+            self._state_dto = None
             if save_path is not self._UNSET:
                 if save_path is None:
                     self._save_path = None
@@ -141,8 +157,18 @@ class SimulationRepository:
                 return list(self._result.history)
             return []
 
+    def _snapshot(self) -> tuple[int, GameState]:
+        """Return the current state together with its refresh generation."""
+
+        with self._lock:
+            assert self._state is not None  # set by refresh() in __init__
+            return self._generation, self._state
+
     def achievements(self) -> Iterable[AchievementDTO]:
-        state = self.get_state()
+        return self._achievement_dtos(self.get_state())
+
+    @staticmethod
+    def _achievement_dtos(state: GameState) -> Iterable[AchievementDTO]:
         return (
             AchievementDTO(
                 id=achievement.id,
@@ -153,17 +179,45 @@ class SimulationRepository:
             for achievement in state.achievements
         )
 
+    def state_etag(self) -> str:
+        """Return a strong ETag derived from the tick and a hash of the state.
+
+        The value is cached until the next :meth:`refresh`. It is only cached
+        when no refresh happened while it was computed.
+        """
+
+        with self._lock:
+            if self._etag is not None:
+                return self._etag
+        generation, state = self._snapshot()
+        payload = json.dumps(
+            state.to_dict(), sort_keys=True, separators=(",", ":")
+        ).encode("utf-8")
+        digest = hashlib.sha256(payload).hexdigest()[:16]
+        etag = f'"{state.tick}-{digest}"'
+        with self._lock:
+            if self._generation == generation:
+                self._etag = etag
+        return etag
+
     def build_state_dto(self) -> SimulationStateDTO:
-        state = self.get_state()
+        with self._lock:
+            if self._state_dto is not None:
+                return self._state_dto
+        generation, state = self._snapshot()
         projects = [self._project_preview(product) for product in state.products]
-        return SimulationStateDTO(
+        dto = SimulationStateDTO(
             tick=state.tick,
             in_game_day=state.tick // 10,
             reputation=state.reputation,
             cash=state.cash,
             projects=projects,
-            achievements=list(self.achievements()),
+            achievements=list(self._achievement_dtos(state)),
         )
+        with self._lock:
+            if self._generation == generation:
+                self._state_dto = dto
+        return dto
 
     def _project_preview(self, product: ProductState) -> ProjectPreviewDTO:
         config = self._assets.products.get(product.product_id)
@@ -197,6 +251,22 @@ class SimulationRepository:
         return "planning"
 
 
+def _etag_matches(header: str | None, etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header matches ``etag``."""
+
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
 def _environment_save_path() -> Path | None:
     raw = os.getenv("KI_DEV_TYCOON_SAVE")
     if not raw:
@@ -226,10 +296,23 @@ def create_app(
     def get_repository(request: Request) -> SimulationRepository:
         return request.app.state.repository
 
-    @app.get("/state", response_model=SimulationStateDTO, tags=["State"])
+    @app.get(
+        "/state",
+        response_model=SimulationStateDTO,
+        tags=["State"],
+        responses={status.HTTP_304_NOT_MODIFIED: {"description": "State unchanged"}},
+    )
     async def read_state(
+        request: Request,
+        response: Response,
         repo: SimulationRepository = Depends(get_repository),
-    ) -> SimulationStateDTO:
+    ) -> SimulationStateDTO | Response:
+        etag = repo.state_etag()
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+        response.headers["ETag"] = etag
         return repo.build_state_dto()
 
     @app.get("/state/raw", tags=["State"])
@@ -6,11 +6,15 @@ import logging
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, Sequence
 
 from pydantic import BaseModel, Field
 
-from ki_dev_tycoon.achievements import AchievementTracker, default_definitions
+from ki_dev_tycoon.achievements import (
+    AchievementSnapshot,
+    AchievementTracker,
+    default_definitions,
+)
 from ki_dev_tycoon.core import (
     AchievementUnlocked,
     EventBus,
@@ -24,16 +28,35 @@ from ki_dev_tycoon.core.loop import TickLoop
 from ki_dev_tycoon.core.state import GameState, ProductState, ResearchState, TeamState
 from ki_dev_tycoon.core.time import TimeProvider
 from ki_dev_tycoon.data import AssetBundle, load_assets
-from ki_dev_tycoon.economy import project_adoption
-from ki_dev_tycoon.products import compute_quality
-from ki_dev_tycoon.research import progress_research
-from ki_dev_tycoon.team import ensure_minimum_staff, train_team
+from ki_dev_tycoon.economy.competition import (
+    CompetitionState,
+    create_competition,
+    summarise_competition,
+)
+from ki_dev_tycoon.pipeline import (
+    FastForward,
+    StageProfiler,
+    TickHook,
+    TickPipeline,
+    TickSystem,
+    default_systems,
+)
+from ki_dev_tycoon.pipeline.macro import MacroEngine, Resolution, resolution_days
+from ki_dev_tycoon.pipeline.stopping import StopCondition, StopMonitor, StopReason
+from ki_dev_tycoon.team.labor_market import LaborMarket, create_labor_market
 from ki_dev_tycoon.utils.logging import get_logger
+from ki_dev_tycoon.utils.memory import AllocationTracker
+
+if TYPE_CHECKING:
+    from ki_dev_tycoon.core.async_loop import AsyncTickLoop
 
 ClockFactory = Callable[[], TimeProvider]
 RandomFactory = Callable[[int], RandomSource]
 TickLoopFactory = Callable[[TimeProvider, RandomSource], TickLoop]
 
+# Fast-forwarded ticks are planned in chunks to bound the outcome buffer.
+FAST_FORWARD_CHUNK = 4096
+
 
 def _default_assets_root() -> Path:
     module_path = Path(__file__).resolve()
@@ -62,6 +85,10 @@ class SimulationConfig:
     arp_dau: float
     operating_costs: float
     asset_root: Path | None = None
+    competitors: int = 0
+    candidate_pool: int = 0
+    resolution: Resolution = "daily"
+    common_random_numbers: bool = False
 
     def resolve_asset_root(self) -> Path:
         """Return the directory containing balancing assets."""
@@ -88,83 +115,70 @@ class SimulationResult(BaseModel):
     state: dict[str, Any] = Field(
         description="Final immutable game state snapshot as a dictionary."
     )
+    profile: dict[str, dict[str, float]] | None = Field(
+        default=None,
+        description="Optional per-stage timing breakdown when profiling is enabled.",
+    )
+    memory: dict[str, Any] | None = Field(
+        default=None,
+        description="Optional tracemalloc report and object footprints when requested.",
+    )
+    competition: dict[str, dict[str, float | str | int]] | None = Field(
+        default=None,
+        description="Per-market player share and rival summary when rivals compete.",
+    )
+    resolution: str | None = Field(
+        default=None,
+        description="Macro-tick resolution of an approximate weekly or monthly run.",
+    )
+    stopped: dict[str, str | int] | None = Field(
+        default=None,
+        description="Stop condition that ended the run early and the tick it fired on.",
+    )
 
 
-def _default_tick_loop(clock: TimeProvider, rng: RandomSource) -> TickLoop:
-    """Instantiate the default tick loop for the simulation."""
+@dataclass(slots=True, frozen=True)
+class SimulationSnapshot:
+    """Point-in-time capture of a :class:`SimulationSession`.
 
-    return TickLoop(clock=clock, rng=rng)
+    Game states are immutable, so snapshots share structure with the running
+    session instead of copying it.
+    """
 
+    config: SimulationConfig
+    state: GameState
+    history: tuple[dict[str, float], ...] = ()
+    competition: CompetitionState | None = None
+    labor_market: LaborMarket | None = None
 
-def _aggregate_research_bonuses(state: ResearchState, assets: AssetBundle) -> tuple[float, float, float]:
-    quality_bonus = 0.0
-    demand_bonus = 0.0
-    training_bonus = 0.0
-    for node_id in state.unlocked:
-        node = assets.research.get(node_id)
-        if node is None:
-            continue
-        unlocks = node.unlocks
-        quality_bonus += unlocks.quality_bonus or 0.0
-        demand_bonus += unlocks.demand_bonus or 0.0
-        training_bonus += unlocks.training_bonus or 0.0
-    return quality_bonus, demand_bonus, training_bonus
-
-
-def _compute_research_points(team: TeamState) -> float:
-    points = 0.0
-    for member in team.members:
-        if member.role_id == "data_scientist":
-            points += member.skill * 2.0
-        elif member.role_id == "engineer":
-            points += member.skill * 0.75
-        else:
-            points += member.skill * 0.25
-    return points
-
-
-def _sample_event_effects(rng: RandomSource, assets: AssetBundle) -> dict[str, float]:
-    weights = [(event, event.weight) for event in assets.events.values()]
-    total_weight = sum(weight for _, weight in weights)
-    if total_weight <= 0:
-        return {}
-    roll = rng.random() * total_weight
-    accumulator = 0.0
-    for event, weight in weights:
-        accumulator += weight
-        if roll <= accumulator:
-            return dict(event.effects)
-    return {}
 
+def _default_tick_loop(clock: TimeProvider, rng: RandomSource) -> TickLoop:
+    """Instantiate the default tick loop for the simulation."""
+
+    return TickLoop(clock=clock, rng=rng)
 
-def run_simulation(
-    config: SimulationConfig,
-    *,
-    logger: Optional[logging.Logger] = None,
-    event_bus: Optional[EventBus] = None,
-    clock_factory: ClockFactory | None = None,
-    rng_factory: RandomFactory | None = None,
-    tick_loop_factory: TickLoopFactory | None = None,
-    capture_history: bool = False,
-) -> SimulationResult:
-    """Execute the deterministic simulation using the configured providers."""
 
-    if config.ticks <= 0:
-        msg = "Simulation requires at least one tick"
-        raise ValueError(msg)
+def _history_row(state: GameState, revenue: float) -> dict[str, float]:
+    """Return the KPI history row recorded for the end-of-tick ``state``."""
 
-    sim_logger = logger or get_logger("simulation")
-    clock_provider = clock_factory or TickClock
-    rng_provider = rng_factory or RandomSource
-    loop_provider = tick_loop_factory or _default_tick_loop
+    total_adoption = sum(product.adoption for product in state.products)
+    avg_quality = (
+        sum(product.quality for product in state.products) / len(state.products)
+        if state.products
+        else 0.0
+    )
+    return {
+        "tick": float(state.tick),
+        "cash": float(state.cash),
+        "reputation": float(state.reputation),
+        "revenue": float(revenue),
+        "adoption": float(total_adoption),
+        "avg_quality": float(avg_quality),
+    }
 
-    assets = load_assets(config.resolve_asset_root())
-    clock = clock_provider()
-    rng = rng_provider(config.seed)
-    loop = loop_provider(clock, rng)
 
-    if event_bus is not None:
-        event_bus.publish(SimulationStarted(seed=config.seed))
+def _initial_state(assets: AssetBundle, clock: TimeProvider) -> GameState:
+    """Return the starting state of a fresh simulation run."""
 
     products = tuple(
         ProductState(
@@ -181,7 +195,7 @@ def run_simulation(
         progress=0.0,
         backlog=tuple(sorted(assets.research)),
     )
-    state = GameState(
+    return GameState(
         tick=clock.current_tick(),
         cash=0.0,
         reputation=50.0,
@@ -189,158 +203,634 @@ def run_simulation(
         products=products,
         research=research_state,
     )
-    achievement_tracker = AchievementTracker(default_definitions())
-    achievement_tracker.extend(state.achievements)
 
-    sim_logger.info(
-        "simulation.start", extra={"seed": config.seed, "ticks": config.ticks}
-    )
-    start_time = time.perf_counter()
 
-    product_ids = tuple(product.product_id for product in state.products)
+class SimulationSession:
+    """Resumable simulation run that can be advanced tick by tick.
+
+    The session owns the clock, RNG and tick loop of a single run. Because the
+    per-tick RNG streams are derived via :meth:`RandomSource.namespaced` from the
+    seed and tick number, a snapshot of the immutable :class:`GameState` is
+    sufficient to resume a run bit-for-bit.
+
+    With ``config.competitors`` rival studios (seeded per company from the run
+    seed) share the asset markets with the player; their immutable
+    :class:`CompetitionState` travels with snapshots next to the game state.
+    ``config.candidate_pool`` likewise switches hiring to per-role candidate
+    pools held in a :class:`LaborMarket`. ``config.common_random_numbers``
+    keys every hire roll, with or without candidate pools, by role and
+    head-count slot, so that runs of two asset versions with the same seed
+    share their random draws.
+
+    ``fast_forward`` lets :meth:`advance` skip through steady-state stretches
+    with :class:`FastForward` while hooks, profiling and candidate pools are
+    absent; states and history stay identical to stepping every tick.
+
+    ``stop_conditions`` are checked after every tick; once one fires,
+    :meth:`advance` stops early and :attr:`stop_reason` records why and when.
+    """
+
+    def __init__(
+        self,
+        config: SimulationConfig,
+        *,
+        assets: AssetBundle | None = None,
+        logger: Optional[logging.Logger] = None,
+        event_bus: Optional[EventBus] = None,
+        clock_factory: ClockFactory | None = None,
+        rng_factory: RandomFactory | None = None,
+        tick_loop_factory: TickLoopFactory | None = None,
+        capture_history: bool = False,
+        initial_state: GameState | None = None,
+        history: Sequence[dict[str, float]] = (),
+        systems: Sequence[TickSystem] | None = None,
+        tick_hooks: Sequence[TickHook] = (),
+        profiler: StageProfiler | None = None,
+        competition: CompetitionState | None = None,
+        labor_market: LaborMarket | None = None,
+        fast_forward: bool = False,
+        stop_conditions: Sequence[StopCondition] = (),
+    ) -> None:
+        self._config = config
+        self._logger = logger or get_logger("simulation")
+        self._event_bus = event_bus
+        self._capture_history = capture_history
+        self._profiler = profiler
+        self._assets = assets or load_assets(config.resolve_asset_root())
+
+        clock_provider = clock_factory or TickClock
+        rng_provider = rng_factory or RandomSource
+        loop_provider = tick_loop_factory or _default_tick_loop
+        self._clock = clock_provider()
+        if initial_state is not None and initial_state.tick > self._clock.current_tick():
+            self._clock.advance(initial_state.tick - self._clock.current_tick())
+        self._loop = loop_provider(self._clock, rng_provider(config.seed))
+
+        self._state = initial_state or _initial_state(self._assets, self._clock)
+        self._achievement_tracker = AchievementTracker(default_definitions())
+        self._achievement_tracker.extend(self._state.achievements)
+        self._product_ids = tuple(product.product_id for product in self._state.products)
+        self._history: list[dict[str, float]] = list(history)
+        if competition is None and config.competitors > 0:
+            competition = create_competition(
+                self._assets,
+                companies=config.competitors,
+                rng=RandomSource(config.seed).namespaced("competitors"),
+            )
+        self._competition = competition
+        self._market_share: dict[str, float] = {}
+        if labor_market is None and config.candidate_pool > 0:
+            labor_market = create_labor_market(
+                self._assets,
+                size=config.candidate_pool,
+                rng=RandomSource(config.seed).namespaced("labor"),
+                tick=self._state.tick,
+            )
+        self._labor_market = labor_market
+        if systems is None and (
+            competition is not None or config.common_random_numbers
+        ):
+            systems = default_systems(
+                competition=competition is not None,
+                common_random_numbers=config.common_random_numbers,
+            )
+        self._pipeline = TickPipeline(systems, hooks=tick_hooks)
+        self._fast_forward = (
+            FastForward(self._pipeline) if fast_forward and profiler is None else None
+        )
+        self._observed: tuple[GameState, GameState] | None = None
+        self._stop_monitor = StopMonitor(stop_conditions)
 
-    history: list[dict[str, float]] = []
+    @property
+    def config(self) -> SimulationConfig:
+        """Return the configuration used for upcoming ticks."""
 
-    def process_tick(_: int, tick_rng: RandomSource) -> None:
-        nonlocal state
-        state = state.advance_tick(clock)
-        if sim_logger.isEnabledFor(logging.DEBUG):
-            sim_logger.debug(
-                "simulation.tick", extra={"tick": state.tick, "seed": config.seed}
-            )
-        if event_bus is not None:
-            event_bus.publish(TickProcessed(tick=state.tick))
+        return self._config
 
-        hiring_rng = tick_rng.namespaced(f"hiring:{state.tick}")
-        demand_rng = tick_rng.namespaced(f"demand:{state.tick}")
-        reputation_rng = tick_rng.namespaced(f"reputation:{state.tick}")
-        event_rng = tick_rng.namespaced(f"events:{state.tick}")
+    @property
+    def assets(self) -> AssetBundle:
+        """Return the balancing assets driving the session."""
 
-        hiring_result = ensure_minimum_staff(
-            state.team,
-            assets=assets,
-            rng=hiring_rng,
-            product_ids=product_ids,
+        return self._assets
+
+    @property
+    def pipeline(self) -> TickPipeline:
+        """Return the tick pipeline so callers can register hooks."""
+
+        return self._pipeline
+
+    @property
+    def state(self) -> GameState:
+        """Return the current immutable game state."""
+
+        return self._observed_state()
+
+    @property
+    def competition(self) -> CompetitionState | None:
+        """Return the rival studios or ``None`` for a single-studio run."""
+
+        return self._competition
+
+    @property
+    def labor_market(self) -> LaborMarket | None:
+        """Return the candidate pools or ``None`` for fixed-skill hiring."""
+
+        return self._labor_market
+
+    @property
+    def profiler(self) -> StageProfiler | None:
+        """Return the stage profiler if profiling is enabled."""
+
+        return self._profiler
+
+    @property
+    def stop_reason(self) -> StopReason | None:
+        """Return the stop condition that ended the run, if one fired."""
+
+        return self._stop_monitor.reason
+
+    @property
+    def tick_loop(self) -> TickLoop:
+        """Return the loop driving this session, e.g. to wrap it in a driver."""
+
+        return self._loop
+
+    def apply_overrides(
+        self,
+        *,
+        config: SimulationConfig | None = None,
+        prices: Mapping[str, float] | None = None,
+    ) -> None:
+        """Swap the configuration and/or product prices for upcoming ticks.
+
+        Raises:
+            KeyError: If ``prices`` references an unknown product.
+        """
+
+        if config is not None:
+            self._config = config
+        for product_id, price in (prices or {}).items():
+            if product_id not in self._product_ids:
+                msg = f"Unknown product referenced in price override: {product_id}"
+                raise KeyError(msg)
+            product = next(
+                item for item in self._state.products if item.product_id == product_id
+            )
+            self._state = self._state.update_product(
+                product_id, product.update_price(price)
+            )
+
+    def advance(self, ticks: int) -> int:
+        """Process up to ``ticks`` additional ticks and return the number processed.
+
+        Fewer ticks are processed only when a stop condition fires.
+        """
+
+        if ticks < 0:
+            msg = "SimulationSession cannot advance by a negative number of ticks"
+            raise ValueError(msg)
+        loop = self._loop
+        processed_ticks = 0
+        monitor = self._stop_monitor
+        while processed_ticks < ticks and monitor.reason is None:
+            steady = self._steady_ticks(ticks - processed_ticks)
+            if steady:
+                processed_ticks += self._fast_forward_ticks(steady)
+                continue
+            processed = loop.advance_by(loop.tick_duration, self._process_tick)
+            if processed == 0:
+                processed = loop.advance_by(loop.tick_duration, self._process_tick)
+                if processed == 0:
+                    msg = "TickLoop failed to advance the simulation tick"
+                    raise RuntimeError(msg)
+            processed_ticks += processed
+        return processed_ticks
+
+    async def advance_async(
+        self, ticks: int, *, driver: AsyncTickLoop | None = None
+    ) -> int:
+        """Process up to ``ticks`` ticks on the event loop, yielding between batches.
+
+        Pass a ``driver`` built from :attr:`tick_loop` to pause, resume or
+        cancel the run from other coroutines. Like :meth:`advance`, the run
+        ends early once a stop condition fires; the number of ticks actually
+        processed is returned.
+        """
+
+        from ki_dev_tycoon.core.async_loop import AsyncTickLoop
+
+        if driver is None:
+            driver = AsyncTickLoop(self._loop)
+        elif driver.loop is not self._loop:
+            msg = "AsyncTickLoop must wrap this session's tick loop"
+            raise ValueError(msg)
+        monitor = self._stop_monitor
+        return await driver.advance(
+            ticks,
+            self._process_tick,
+            stop=(lambda: monitor.reason is not None) if monitor else None,
         )
-        state = state.update_team(hiring_result.team)
 
-        quality_bonus, demand_bonus, training_bonus = _aggregate_research_bonuses(
-            state.research, assets
+    def forecast(
+        self, ticks: int, *, resolution: Resolution = "weekly"
+    ) -> list[dict[str, float]]:
+        """Preview the next ``ticks`` ticks in coarse macro-ticks.
+
+        Returns one history row per macro-tick (``revenue`` is the average
+        daily revenue) computed by a :class:`MacroEngine` from the current
+        state. The forecast is approximate and leaves the session untouched.
+        """
+
+        if ticks < 0:
+            msg = "SimulationSession cannot forecast a negative number of ticks"
+            raise ValueError(msg)
+        state = self._observed_state()
+        tracker = AchievementTracker(default_definitions())
+        tracker.extend(state.achievements)
+        engine = MacroEngine(
+            self._assets,
+            operating_costs=self._config.operating_costs,
+            common_random_numbers=self._config.common_random_numbers,
         )
+        return [
+            _history_row(outcome.state, outcome.revenue)
+            for outcome in engine.run(
+                state,
+                ticks,
+                days=resolution_days(resolution),
+                rng=self._loop.rng,
+                achievement_tracker=tracker,
+            )
+        ]
 
-        training_result = train_team(
-            state.team, assets=assets, training_bonus=training_bonus
+    def snapshot(self) -> SimulationSnapshot:
+        """Capture the current state so that it can be resumed or forked."""
+
+        return SimulationSnapshot(
+            config=self._config,
+            state=self._observed_state(),
+            history=tuple(dict(row) for row in self._history),
+            competition=self._competition,
+            labor_market=self._labor_market,
         )
-        state = state.update_team(training_result.team)
 
-        research_points = _compute_research_points(state.team)
-        research_result = progress_research(
-            state.research, assets=assets, research_points=research_points
+    def result(self) -> SimulationResult:
+        """Build the result payload for the current state."""
+
+        state = self._observed_state()
+        return SimulationResult(
+            final_tick=state.tick,
+            cash=round(state.cash, 2),
+            reputation=round(state.reputation, 2),
+            history=list(self._history) if self._capture_history else None,
+            achievements=[
+                achievement.to_dict()
+                for achievement in self._achievement_tracker.unlocked()
+            ],
+            state=state.to_dict(),
+            profile=self._profiler.breakdown() if self._profiler else None,
+            stopped=(
+                self._stop_monitor.reason.to_dict()
+                if self._stop_monitor.reason is not None
+                else None
+            ),
+            competition=(
+                summarise_competition(self._competition, self._market_share)
+                if self._competition is not None
+                else None
+            ),
         )
-        state = state.update_research(research_result.state)
-        if research_result.completed:
-            quality_bonus, demand_bonus, training_bonus = _aggregate_research_bonuses(
-                state.research, assets
-            )
 
-        event_effects = _sample_event_effects(event_rng, assets)
-        demand_multiplier = event_effects.get("demand_multiplier", 1.0)
-        quality_penalty = event_effects.get("quality_penalty", 0.0)
-        reputation_bonus = event_effects.get("reputation_bonus", 0.0)
-        if reputation_bonus:
-            state = state.apply_reputation_delta(reputation_bonus)
+    def _observed_state(self) -> GameState:
+        """Return ``_state`` with the pipeline's deferred updates applied.
 
-        total_revenue = 0.0
-        for product in state.products:
-            quality = compute_quality(
-                state,
-                product=product,
-                assets=assets,
-                research_quality_bonus=quality_bonus,
-            )
-            if quality_penalty:
-                quality = max(0.0, quality - quality_penalty)
-            updated_product = product.update_quality(quality)
-            adoption = project_adoption(
-                state,
-                product=updated_product,
-                assets=assets,
-                rng=demand_rng.namespaced(f"{product.product_id}:{state.tick}"),
-                demand_bonus=demand_bonus,
-                demand_multiplier=demand_multiplier,
+        The internal state may carry stale per-member values between ticks
+        (see :meth:`TickPipeline.materialise`); the materialised view is
+        cached until the next tick replaces the state.
+        """
+
+        observed = self._observed
+        if observed is None or observed[0] is not self._state:
+            observed = self._observed = (
+                self._state,
+                self._pipeline.materialise(self._state),
             )
-            updated_product = updated_product.update_adoption(adoption)
-            state = state.update_product(product.product_id, updated_product)
-            total_revenue += updated_product.adoption * updated_product.price
+        return observed[1]
+
+    def _steady_ticks(self, limit: int) -> int:
+        """Return how many of the next ``limit`` ticks can be fast-forwarded."""
+
+        fast_forward = self._fast_forward
+        if (
+            fast_forward is None
+            or self._labor_market is not None
+            or self._clock.current_tick() != self._state.tick
+        ):
+            return 0
+        return fast_forward.steady_ticks(
+            self._state,
+            assets=self._assets,
+            product_ids=self._product_ids,
+            limit=min(limit, FAST_FORWARD_CHUNK),
+        )
 
-        salary_cost = sum(
-            assets.roles[member.role_id].salary for member in state.team.members
+    def _fast_forward_ticks(self, count: int) -> int:
+        assert self._fast_forward is not None
+        monitor = self._stop_monitor
+        planned = self._fast_forward.advance(
+            self._state,
+            count,
+            assets=self._assets,
+            rng=self._loop.rng,
+            achievement_tracker=self._achievement_tracker,
+            operating_costs=self._config.operating_costs,
+            stop=(
+                (lambda state: monitor.check(state, self._assets) is not None)
+                if monitor
+                else None
+            ),
         )
-        cash_delta = total_revenue - salary_cost - config.operating_costs
-        state = state.apply_cash_delta(cash_delta)
-
-        direction = 1 if cash_delta >= 0 else -1
-        jitter = (reputation_rng.random() - 0.5) * 0.2
-        state = state.apply_reputation_delta(direction * 0.5 + jitter)
-
-        unlocked = achievement_tracker.evaluate(state)
-        if unlocked:
-            state = state.add_achievements(unlocked)
-            if event_bus is not None:
-                for achievement in unlocked:
-                    event_bus.publish(
-                        AchievementUnlocked(tick=state.tick, achievement=achievement)
-                    )
+        outcomes = iter(planned)
 
-        if capture_history:
-            total_adoption = sum(product.adoption for product in state.products)
-            avg_quality = (
-                sum(product.quality for product in state.products) / len(state.products)
-                if state.products
-                else 0.0
+        def process(tick: int, _: RandomSource) -> None:
+            outcome = next(outcomes)
+            self._announce_tick(tick)
+            self._complete_tick(outcome.state, outcome.revenue, outcome.unlocked)
+
+        return self._loop.advance_ticks(len(planned), process)
+
+    def _announce_tick(self, tick: int) -> None:
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "simulation.tick", extra={"tick": tick, "seed": self._config.seed}
+            )
+        if self._event_bus is not None:
+            self._event_bus.publish(TickProcessed(tick=tick))
+
+    def _process_tick(self, _: int, tick_rng: RandomSource) -> None:
+        profiler = self._profiler
+        tick_started = time.perf_counter_ns() if profiler is not None else 0
+        state = self._state.advance_tick(self._clock)
+        self._announce_tick(state.tick)
+
+        context = self._pipeline.run(
+            state,
+            assets=self._assets,
+            rng=tick_rng,
+            achievement_tracker=self._achievement_tracker,
+            operating_costs=self._config.operating_costs,
+            product_ids=self._product_ids,
+            profiler=profiler,
+            competition=self._competition,
+            labor_market=self._labor_market,
+        )
+        if context.competition is not None:
+            self._competition = context.competition
+            self._market_share = context.market_share or {}
+        self._labor_market = context.labor_market
+        self._complete_tick(context.state, context.revenue, context.unlocked)
+        if self._stop_monitor:
+            self._stop_monitor.check(context.state, self._assets)
+        if profiler is not None:
+            profiler.record(
+                "tick", context.state.tick, tick_started, time.perf_counter_ns()
             )
-            history.append(
+
+    def _complete_tick(
+        self,
+        state: GameState,
+        revenue: float,
+        unlocked: tuple[AchievementSnapshot, ...],
+    ) -> None:
+        """Publish unlocks, record history and store the end-of-tick ``state``."""
+
+        profiler = self._profiler
+        event_bus = self._event_bus
+        if event_bus is not None:
+            for achievement in unlocked:
+                event_bus.publish(
+                    AchievementUnlocked(tick=state.tick, achievement=achievement)
+                )
+
+        if self._capture_history:
+            history_started = time.perf_counter_ns() if profiler is not None else 0
+            self._history.append(_history_row(state, revenue))
+            if profiler is not None:
+                profiler.record(
+                    "history", state.tick, history_started, time.perf_counter_ns()
+                )
+        self._state = state
+
+
+def run_simulation(
+    config: SimulationConfig,
+    *,
+    logger: Optional[logging.Logger] = None,
+    event_bus: Optional[EventBus] = None,
+    clock_factory: ClockFactory | None = None,
+    rng_factory: RandomFactory | None = None,
+    tick_loop_factory: TickLoopFactory | None = None,
+    capture_history: bool = False,
+    assets: AssetBundle | None = None,
+    profiler: StageProfiler | None = None,
+    track_memory: bool = False,
+    stop_conditions: Sequence[StopCondition] = (),
+) -> SimulationResult:
+    """Execute the deterministic simulation using the configured providers.
+
+    Passing a :class:`StageProfiler` times every pipeline stage and adds the
+    breakdown to :attr:`SimulationResult.profile`. ``track_memory`` traces
+    allocations with ``tracemalloc`` and reports them, together with the deep
+    size of the final state and history, in :attr:`SimulationResult.memory`.
+
+    Steady-state stretches (saturated markets, full staffing, no pending
+    skill or research changes) are fast-forwarded in closed form unless a
+    profiler or a custom ``tick_loop_factory`` is given; the result is
+    identical to stepping every tick.
+
+    ``config.resolution`` ``"weekly"`` or ``"monthly"`` trades accuracy for
+    speed: the run advances in macro-ticks of 7 or 30 days computed by a
+    :class:`MacroEngine`, and history holds one row per macro-tick.
+
+    ``stop_conditions`` (e.g. :class:`~ki_dev_tycoon.pipeline.Bankruptcy`)
+    end the run before ``config.ticks`` once the outcome is decided;
+    :attr:`SimulationResult.stopped` records the condition and tick.
+    """
+
+    if config.ticks <= 0:
+        msg = "Simulation requires at least one tick"
+        raise ValueError(msg)
+    days = resolution_days(config.resolution)
+    if days > 1:
+        if profiler is not None or tick_loop_factory is not None:
+            msg = "Profiling and custom tick loops require the daily resolution"
+            raise ValueError(msg)
+        if config.competitors > 0 or config.candidate_pool > 0:
+            msg = "Rival studios and candidate pools require the daily resolution"
+            raise ValueError(msg)
+
+    sim_logger = logger or get_logger("simulation")
+    tracker = AllocationTracker() if track_memory else None
+    if tracker is not None:
+        tracker.start()
+    if days > 1:
+        result, state = _run_macro_ticks(
+            config,
+            days=days,
+            logger=sim_logger,
+            event_bus=event_bus,
+            clock_factory=clock_factory,
+            rng_factory=rng_factory,
+            capture_history=capture_history,
+            assets=assets,
+            stop_conditions=stop_conditions,
+        )
+        if tracker is not None:
+            result.memory = tracker.stop(
                 {
-                    "tick": float(state.tick),
-                    "cash": float(state.cash),
-                    "reputation": float(state.reputation),
-                    "revenue": float(total_revenue),
-                    "adoption": float(total_adoption),
-                    "avg_quality": float(avg_quality),
+                    "game_state": state,
+                    "team": state.team,
+                    "history": result.history or [],
+                    "result_state": result.state,
                 }
             )
+        return result
+    session = SimulationSession(
+        config,
+        assets=assets,
+        logger=sim_logger,
+        event_bus=event_bus,
+        clock_factory=clock_factory,
+        rng_factory=rng_factory,
+        tick_loop_factory=tick_loop_factory,
+        capture_history=capture_history,
+        profiler=profiler,
+        fast_forward=tick_loop_factory is None,
+        stop_conditions=stop_conditions,
+    )
 
-    processed_ticks = 0
-    while processed_ticks < config.ticks:
-        processed = loop.advance_by(loop.tick_duration, process_tick)
-        if processed == 0:
-            processed = loop.advance_by(loop.tick_duration, process_tick)
-            if processed == 0:
-                msg = "TickLoop failed to advance the simulation tick"
-                raise RuntimeError(msg)
-        processed_ticks += processed
+    if event_bus is not None:
+        event_bus.publish(SimulationStarted(seed=config.seed))
+
+    sim_logger.info(
+        "simulation.start", extra={"seed": config.seed, "ticks": config.ticks}
+    )
+    start_time = time.perf_counter()
+
+    session.advance(config.ticks)
 
     duration_ms = (time.perf_counter() - start_time) * 1000
     sim_logger.info(
         "simulation.complete",
         extra={
             "seed": config.seed,
-            "tick": state.tick,
+            "tick": session.state.tick,
             "duration_ms": round(duration_ms, 2),
+            "stopped": (
+                session.stop_reason.condition if session.stop_reason else None
+            ),
         },
     )
 
+    if event_bus is not None:
+        event_bus.publish(SimulationCompleted(tick=session.state.tick))
+
+    result = session.result()
+    if tracker is not None:
+        result.memory = tracker.stop(
+            {
+                "game_state": session.state,
+                "team": session.state.team,
+                "history": result.history or [],
+                "result_state": result.state,
+            }
+        )
+    return result
+
+
+def _run_macro_ticks(
+    config: SimulationConfig,
+    *,
+    days: int,
+    logger: logging.Logger,
+    event_bus: Optional[EventBus],
+    clock_factory: ClockFactory | None,
+    rng_factory: RandomFactory | None,
+    capture_history: bool,
+    assets: AssetBundle | None,
+    stop_conditions: Sequence[StopCondition],
+) -> tuple[SimulationResult, GameState]:
+    """Run ``config`` in macro-ticks of ``days`` days and return the result."""
+
+    bundle = assets or load_assets(config.resolve_asset_root())
+    clock = (clock_factory or TickClock)()
+    rng = (rng_factory or RandomSource)(config.seed)
+    state = _initial_state(bundle, clock)
+    achievement_tracker = AchievementTracker(default_definitions())
+    monitor = StopMonitor(stop_conditions)
+    history: list[dict[str, float]] = []
+
+    if event_bus is not None:
+        event_bus.publish(SimulationStarted(seed=config.seed))
+    logger.info(
+        "simulation.start",
+        extra={
+            "seed": config.seed,
+            "ticks": config.ticks,
+            "resolution": config.resolution,
+        },
+    )
+    start_time = time.perf_counter()
+
+    engine = MacroEngine(
+        bundle,
+        operating_costs=config.operating_costs,
+        common_random_numbers=config.common_random_numbers,
+    )
+    for outcome in engine.run(
+        state,
+        config.ticks,
+        days=days,
+        rng=rng,
+        achievement_tracker=achievement_tracker,
+    ):
+        state = outcome.state
+        if event_bus is not None:
+            event_bus.publish(TickProcessed(tick=state.tick))
+            for achievement in outcome.unlocked:
+                event_bus.publish(
+                    AchievementUnlocked(tick=state.tick, achievement=achievement)
+                )
+        if capture_history:
+            history.append(_history_row(state, outcome.revenue))
+        if monitor and monitor.check(state, bundle, ticks=outcome.days):
+            break
+
+    duration_ms = (time.perf_counter() - start_time) * 1000
+    logger.info(
+        "simulation.complete",
+        extra={
+            "seed": config.seed,
+            "tick": state.tick,
+            "duration_ms": round(duration_ms, 2),
+        },
+    )
     if event_bus is not None:
         event_bus.publish(SimulationCompleted(tick=state.tick))
 
-    return SimulationResult(
+    result = SimulationResult(
         final_tick=state.tick,
         cash=round(state.cash, 2),
         reputation=round(state.reputation, 2),
         history=history if capture_history else None,
-        achievements=[achievement.to_dict() for achievement in achievement_tracker.unlocked()],
+        achievements=[
+            achievement.to_dict() for achievement in achievement_tracker.unlocked()
+        ],
         state=state.to_dict(),
+        resolution=config.resolution,
+        stopped=monitor.reason.to_dict() if monitor.reason is not None else None,
     )
+    return result, state
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
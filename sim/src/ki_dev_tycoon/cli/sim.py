@@ -5,14 +5,19 @@ from __future__ import annotations
 import csv
 import json
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Any, Callable, Optional, Sequence
 
 import typer
 
-from ki_dev_tycoon.app import SimulationConfig, run_simulation
-from ki_dev_tycoon.utils.logging import configure_logging, get_logger
+# Simulation modules (pydantic, yaml, zstandard, ...) are imported inside the
+# commands so that ``ki-sim --help`` and argument errors stay cheap. Rich help
+# rendering is disabled for the same reason: it imports markdown and pygments.
 
-app = typer.Typer(help="Run deterministic KI Dev Tycoon simulations.")
+app = typer.Typer(
+    help="Run deterministic KI Dev Tycoon simulations.",
+    rich_markup_mode=None,
+    pretty_exceptions_enable=False,
+)
 
 
 @app.command()
@@ -33,6 +38,27 @@ def run(
         None,
         help="Optional directory containing balancing assets. Defaults to packaged assets.",
     ),
+    competitors: int = typer.Option(
+        0, min=0, help="Number of rival studios competing for the same markets."
+    ),
+    candidate_pool: int = typer.Option(
+        0,
+        min=0,
+        help="Hire from per-role candidate pools of this size (0: fixed-skill hires).",
+    ),
+    resolution: str = typer.Option(
+        "daily",
+        help="Tick resolution: 'daily', or 'weekly'/'monthly' for fast approximate previews.",
+        case_sensitive=False,
+    ),
+    stop_on: list[str] = typer.Option(
+        [],
+        "--stop-on",
+        help="Stop early on 'bankruptcy' (30 ticks at zero cash) or 'stagnation' (repeatable).",
+    ),
+    target_cash: Optional[float] = typer.Option(
+        None, help="Stop early once cash reaches this amount in Euro."
+    ),
     output: Optional[Path] = typer.Option(
         None,
         "--output",
@@ -45,12 +71,48 @@ def run(
         help="Logging verbosity for the simulation run.",
         case_sensitive=False,
     ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Time every pipeline stage and report the breakdown on stderr.",
+    ),
+    profile_output: Optional[Path] = typer.Option(
+        None,
+        help="Write a per-stage trace file (implies --profile).",
+        metavar="PATH",
+    ),
+    profile_format: str = typer.Option(
+        "chrome",
+        help="Trace file format: 'chrome' (about:tracing/Perfetto) or 'speedscope'.",
+        case_sensitive=False,
+    ),
+    memory_report: bool = typer.Option(
+        False,
+        "--memory-report",
+        help="Trace allocations with tracemalloc and report memory use on stderr.",
+    ),
 ) -> None:
     """Run the deterministic simulation for ``ticks`` days."""
 
+    from ki_dev_tycoon.app import SimulationConfig, run_simulation
+    from ki_dev_tycoon.pipeline.macro import RESOLUTIONS
+    from ki_dev_tycoon.pipeline.profiling import TRACE_FORMATS, StageProfiler
+    from ki_dev_tycoon.pipeline.stopping import (
+        Bankruptcy,
+        Stagnation,
+        StopCondition,
+        TargetReached,
+    )
+    from ki_dev_tycoon.utils.logging import configure_logging, get_logger
+
     configure_logging(log_level.upper())
     sim_logger = get_logger("simulation")
 
+    tick_resolution = resolution.lower()
+    if tick_resolution not in RESOLUTIONS:
+        raise typer.BadParameter(
+            f"expected one of {', '.join(RESOLUTIONS)}", param_hint="--resolution"
+        )
     config = SimulationConfig(
         ticks=ticks,
         seed=seed,
@@ -58,10 +120,64 @@ def run(
         arp_dau=arp_dau,
         operating_costs=operating_costs,
         asset_root=asset_root,
+        competitors=competitors,
+        candidate_pool=candidate_pool,
+        resolution=tick_resolution,  # type: ignore[arg-type]
+    )
+
+    trace_format = next(
+        (name for name in TRACE_FORMATS if name == profile_format.lower()), None
+    )
+    if trace_format is None:
+        raise typer.BadParameter(
+            f"expected one of {', '.join(TRACE_FORMATS)}", param_hint="--profile-format"
+        )
+    profiler = None
+    if profile or profile_output is not None:
+        profiler = StageProfiler(trace=profile_output is not None)
+
+    known_conditions: dict[str, Callable[[], StopCondition]] = {
+        "bankruptcy": Bankruptcy,
+        "stagnation": Stagnation,
+    }
+    stop_conditions: list[StopCondition] = []
+    for name in stop_on:
+        if name.lower() not in known_conditions:
+            raise typer.BadParameter(
+                f"expected one of {', '.join(known_conditions)}", param_hint="--stop-on"
+            )
+        stop_conditions.append(known_conditions[name.lower()]())
+    if target_cash is not None:
+        stop_conditions.append(TargetReached(cash=target_cash))
+
+    result = run_simulation(
+        config,
+        logger=sim_logger,
+        profiler=profiler,
+        track_memory=memory_report,
+        stop_conditions=stop_conditions,
     )
+    exclude = set()
+    if profiler is None:
+        exclude.add("profile")
+    if not memory_report:
+        exclude.add("memory")
+    if result.competition is None:
+        exclude.add("competition")
+    if result.resolution is None:
+        exclude.add("resolution")
+    if result.stopped is None:
+        exclude.add("stopped")
+    payload = json.dumps(result.model_dump(exclude=exclude or None), indent=2)
 
-    result = run_simulation(config, logger=sim_logger)
-    payload = json.dumps(result.model_dump(), indent=2)
+    if profiler is not None:
+        _echo_profile(result.profile or {})
+        if profile_output is not None:
+            profiler.write_trace(profile_output, format=trace_format)
+            typer.echo(f"Trace written to {profile_output}", err=True)
+
+    if result.memory is not None:
+        _echo_memory(result.memory)
 
     if output is None:
         typer.echo(payload)
@@ -72,6 +188,44 @@ def run(
     typer.echo(f"Result written to {output}")
 
 
+def _echo_profile(breakdown: dict[str, dict[str, float]]) -> None:
+    """Print the stage breakdown sorted by total time to stderr."""
+
+    header = f"{'stage':<18}{'calls':>8}{'total ms':>12}{'mean us':>10}{'share':>8}"
+    typer.echo(header, err=True)
+    for stage, stats in sorted(
+        breakdown.items(), key=lambda item: item[1]["total_ms"], reverse=True
+    ):
+        typer.echo(
+            f"{stage:<18}{int(stats['calls']):>8}{stats['total_ms']:>12.3f}"
+            f"{stats['mean_us']:>10.1f}{stats['share']:>8.1%}",
+            err=True,
+        )
+
+
+def _echo_memory(report: dict[str, Any]) -> None:
+    """Print the tracemalloc summary and object footprints to stderr."""
+
+    typer.echo(
+        f"peak {report['peak_bytes'] / 1024:.1f} KiB, "
+        f"retained {report['retained_bytes'] / 1024:.1f} KiB",
+        err=True,
+    )
+    for label, footprint in report.get("objects", {}).items():
+        types = ", ".join(
+            f"{name}={entry['bytes']}B/{entry['count']}"
+            for name, entry in list(footprint["types"].items())[:4]
+        )
+        typer.echo(f"{label:<14}{footprint['bytes']:>10} B  {types}", err=True)
+    typer.echo(f"{'allocated by':<60}{'bytes':>10}{'count':>8}", err=True)
+    for allocation in report["top_allocations"]:
+        typer.echo(
+            f"{allocation['location'][-60:]:<60}{allocation['bytes']:>10}"
+            f"{allocation['count']:>8}",
+            err=True,
+        )
+
+
 @app.command()
 def export(
     *,
@@ -93,6 +247,9 @@ def export(
 ) -> None:
     """Run a 30-day simulation and export KPI metrics as CSV."""
 
+    from ki_dev_tycoon.app import SimulationConfig, run_simulation
+    from ki_dev_tycoon.utils.logging import configure_logging, get_logger
+
     configure_logging(log_level.upper())
     sim_logger = get_logger("simulation")
 
@@ -124,6 +281,50 @@ def export(
     typer.echo(f"Exported KPI history for {len(history)} ticks to {output}")
 
 
+@app.command("gen-assets")
+def gen_assets(
+    *,
+    output: Path = typer.Option(
+        ...,
+        "--output",
+        "-o",
+        help="Directory that receives the generated YAML catalogues.",
+        metavar="DIR",
+    ),
+    seed: int = typer.Option(42, help="Seed for the generated catalogues."),
+    roles: int = typer.Option(20, min=1, help="Number of team roles."),
+    products: int = typer.Option(100, min=1, help="Number of products."),
+    markets: int = typer.Option(10, min=1, help="Number of markets."),
+    research: int = typer.Option(200, min=0, help="Number of research nodes."),
+    events: int = typer.Option(20, min=0, help="Number of random events."),
+    max_prerequisites: int = typer.Option(
+        3, min=0, help="Maximum prerequisites per research node."
+    ),
+) -> None:
+    """Generate seeded synthetic balancing assets for scale testing."""
+
+    from ki_dev_tycoon.data.synthetic import (
+        SyntheticAssetSpec,
+        generate_assets,
+        write_assets,
+    )
+
+    spec = SyntheticAssetSpec(
+        roles=roles,
+        products=products,
+        markets=markets,
+        research=research,
+        events=events,
+        seed=seed,
+        max_prerequisites=max_prerequisites,
+    )
+    write_assets(generate_assets(spec), output)
+    typer.echo(
+        f"Generated {roles} roles, {products} products, {markets} markets, "
+        f"{research} research nodes and {events} events in {output}"
+    )
+
+
 def run_cli(argv: Optional[Sequence[str]] = None) -> int:
     """Execute the Typer application with the provided arguments."""
 
@@ -1,5 +1,9 @@
 """Core infrastructure for deterministic simulation."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from .events import (
     AchievementUnlocked,
     EventBus,
@@ -8,13 +12,24 @@ from .events import (
     SimulationStarted,
     TickProcessed,
 )
-from .loop import TickLoop
+from .loop import MAX_SPEED, TickLoop
 from .rng import RandomSource
+from .scheduler import EventScheduler
+from .tick_stats import TickOverrun, TickStats, TickStatsSnapshot
 from .time import FrozenTime, TickClock, TimeProvider
 
+if TYPE_CHECKING:
+    from .async_loop import AsyncTickLoop
+
 __all__ = [
     "EventBus",
+    "EventScheduler",
     "TickLoop",
+    "AsyncTickLoop",
+    "MAX_SPEED",
+    "TickStats",
+    "TickStatsSnapshot",
+    "TickOverrun",
     "RandomSource",
     "TickClock",
     "TimeProvider",
@@ -25,3 +40,13 @@ __all__ = [
     "SimulationCompleted",
     "AchievementUnlocked",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Importing asyncio costs more than the rest of the package; defer it.
+    if name == "AsyncTickLoop":
+        from .async_loop import AsyncTickLoop
+
+        return AsyncTickLoop
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
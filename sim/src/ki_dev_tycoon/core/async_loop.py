@@ -0,0 +1,118 @@
+"""Asyncio driver for :class:`~ki_dev_tycoon.core.loop.TickLoop`."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Callable
+
+from ki_dev_tycoon.core.loop import TickHandler, TickLoop
+
+
+class AsyncTickLoop:
+    """Schedule ticks of a :class:`TickLoop` on the running event loop.
+
+    Ticks are processed in batches of ``batch_size``; between batches the
+    driver yields to the event loop so that other coroutines (HTTP handlers,
+    UI refreshes, further sessions) stay responsive. :meth:`pause` holds the
+    driver before the next batch, :meth:`cancel` stops it cooperatively.
+    """
+
+    def __init__(self, loop: TickLoop, *, batch_size: int = 32) -> None:
+        if batch_size <= 0:
+            msg = "AsyncTickLoop requires a positive batch_size"
+            raise ValueError(msg)
+        self._loop = loop
+        self._batch_size = batch_size
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+        self._cancelled = False
+
+    @property
+    def loop(self) -> TickLoop:
+        return self._loop
+
+    @property
+    def paused(self) -> bool:
+        return not self._resumed.is_set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def pause(self) -> None:
+        """Hold the driver before its next batch."""
+
+        self._resumed.clear()
+
+    def resume(self) -> None:
+        """Continue a paused driver."""
+
+        self._resumed.set()
+
+    def cancel(self) -> None:
+        """Stop the driver after the batch currently being processed."""
+
+        self._cancelled = True
+        self._resumed.set()
+
+    async def advance(
+        self,
+        ticks: int,
+        handler: TickHandler,
+        *,
+        stop: Callable[[], bool] | None = None,
+    ) -> int:
+        """Process ``ticks`` ticks as fast as possible, yielding between batches.
+
+        ``stop`` is consulted after every tick and ends the run once it
+        returns ``True``. Returns the number of ticks processed, which is
+        lower than ``ticks`` when the driver was cancelled or stopped.
+        """
+
+        if ticks < 0:
+            msg = "AsyncTickLoop cannot advance by a negative number of ticks"
+            raise ValueError(msg)
+        processed = 0
+        while processed < ticks:
+            if not await self._checkpoint() or (stop is not None and stop()):
+                break
+            batch = min(self._batch_size, ticks - processed)
+            if stop is None:
+                processed += self._loop.advance_ticks(batch, handler)
+                continue
+            for _ in range(batch):
+                processed += self._loop.advance_ticks(1, handler)
+                if stop():
+                    return processed
+        return processed
+
+    async def run(self, ticks: int, handler: TickHandler) -> int:
+        """Process ``ticks`` ticks paced by the loop's clock and time scale."""
+
+        if ticks < 0:
+            msg = "AsyncTickLoop cannot run a negative number of ticks"
+            raise ValueError(msg)
+        loop = self._loop
+        if loop.max_speed:
+            return await self.advance(ticks, handler)
+        processed = 0
+        while processed < ticks:
+            if not await self._checkpoint():
+                break
+            processed += loop.step(handler, limit=ticks - processed)
+            if processed < ticks:
+                await asyncio.sleep(loop.time_until_next_tick())
+        return processed
+
+    async def _checkpoint(self) -> bool:
+        """Yield to the event loop, wait while paused and report cancellation."""
+
+        await asyncio.sleep(0)
+        if not self._resumed.is_set():
+            await self._resumed.wait()
+            # Resuming should not count the pause as elapsed simulation time.
+            self._loop.reset_time_reference()
+        return not self._cancelled
+
+
+__all__ = ["AsyncTickLoop"]
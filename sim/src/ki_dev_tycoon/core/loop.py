@@ -2,62 +2,159 @@
 
 from __future__ import annotations
 
+import math
 import time
 from dataclasses import dataclass, field
-from typing import Callable
+from typing import Callable, Literal
 
 from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.core.tick_stats import TickStats
 from ki_dev_tycoon.core.time import TimeProvider
 
 TickHandler = Callable[[int, RandomSource], None]
+BatchHandler = Callable[[range, RandomSource], None]
 TimeSource = Callable[[], float]
 SleepFunction = Callable[[float], None]
+CatchUpPolicy = Literal["defer", "drop"]
+
+MAX_SPEED = math.inf
+CATCH_UP_POLICIES: tuple[CatchUpPolicy, ...] = ("defer", "drop")
 
 
 @dataclass(slots=True)
 class TickLoop:
-    """Fixed-step accumulator loop for deterministic tick processing."""
+    """Fixed-step accumulator loop for deterministic tick processing.
+
+    ``time_scale`` dilates wall-clock time sampled by :meth:`step` and
+    :meth:`run` (``MAX_SPEED`` skips waiting entirely). ``max_ticks_per_step``
+    caps how many ticks a single advance may process; surplus ticks are kept
+    for later steps (``"defer"``) or discarded (``"drop"``) according to
+    ``catch_up``.
+
+    When ``stats`` is given, handler durations, wake-up jitter and budget
+    overruns are recorded and sleeps are shortened by the observed oversleep.
+    ``spin_threshold`` switches :meth:`run` to sleep-then-spin: it wakes that
+    many seconds early and busy-waits on ``time_source`` until the deadline.
+    """
 
     clock: TimeProvider
     rng: RandomSource
     tick_duration: float = 0.5
     time_source: TimeSource | None = None
     sleep: SleepFunction | None = None
+    time_scale: float = 1.0
+    max_ticks_per_step: int | None = None
+    catch_up: CatchUpPolicy = "defer"
+    stats: TickStats | None = None
+    spin_threshold: float = 0.0
     _accumulator: float = field(default=0.0, init=False)
     _last_time: float = field(default=0.0, init=False)
+    _dropped_ticks: int = field(default=0, init=False)
 
     def __post_init__(self) -> None:
         if self.tick_duration <= 0:
             msg = "TickLoop requires a positive tick_duration"
             raise ValueError(msg)
+        self.set_time_scale(self.time_scale)
+        if self.max_ticks_per_step is not None and self.max_ticks_per_step <= 0:
+            msg = "TickLoop requires a positive max_ticks_per_step"
+            raise ValueError(msg)
+        if self.catch_up not in CATCH_UP_POLICIES:
+            msg = f"Unknown catch-up policy '{self.catch_up}'"
+            raise ValueError(msg)
+        if self.spin_threshold < 0:
+            msg = "TickLoop requires a non-negative spin_threshold"
+            raise ValueError(msg)
         if self.time_source is None:
             self.time_source = time.perf_counter
         if self.sleep is None:
             self.sleep = lambda _: None
         self._last_time = self.time_source()
 
+    @property
+    def dropped_ticks(self) -> int:
+        """Return how many ticks the ``"drop"`` policy has discarded so far."""
+
+        return self._dropped_ticks
+
+    @property
+    def max_speed(self) -> bool:
+        return math.isinf(self.time_scale)
+
+    @property
+    def tick_budget(self) -> float:
+        """Wall-clock seconds available per tick at the current time scale."""
+
+        return self.tick_duration / self.time_scale
+
+    def set_time_scale(self, time_scale: float) -> None:
+        """Change the time dilation factor, e.g. ``1.0``, ``10.0`` or ``MAX_SPEED``."""
+
+        if not time_scale > 0:
+            msg = "TickLoop requires a positive time_scale"
+            raise ValueError(msg)
+        self.time_scale = time_scale
+
     def advance_by(self, delta_seconds: float, handler: TickHandler) -> int:
         """Advance the loop by ``delta_seconds`` and process pending ticks."""
 
-        if delta_seconds < 0:
-            msg = "TickLoop cannot be advanced by a negative duration"
+        return self.advance_ticks(self._collect(delta_seconds), handler)
+
+    def advance_batch(self, delta_seconds: float, handler: BatchHandler) -> int:
+        """Advance by ``delta_seconds`` and hand all due ticks to ``handler`` at once.
+
+        The clock is moved to the last tick of the batch before ``handler`` is
+        called with the range of processed tick numbers.
+        """
+
+        due = self._collect(delta_seconds)
+        if due:
+            first = self.clock.current_tick() + 1
+            self.clock.advance(due)
+            handler(range(first, first + due), self.rng)
+        return due
+
+    def advance_ticks(self, count: int, handler: TickHandler) -> int:
+        """Process exactly ``count`` ticks without consulting the accumulator."""
+
+        if count < 0:
+            msg = "TickLoop cannot advance by a negative number of ticks"
             raise ValueError(msg)
-        processed = 0
-        self._accumulator += delta_seconds
-        while self._accumulator + 1e-12 >= self.tick_duration:
+        stats = self.stats
+        if stats is None:
+            for _ in range(count):
+                self.clock.advance()
+                handler(self.clock.current_tick(), self.rng)
+            return count
+        budget = self.tick_budget
+        for _ in range(count):
             self.clock.advance()
-            handler(self.clock.current_tick(), self.rng)
-            self._accumulator -= self.tick_duration
-            processed += 1
-        return processed
+            tick = self.clock.current_tick()
+            started = self.time_source()
+            handler(tick, self.rng)
+            stats.record_handler(tick, self.time_source() - started, budget)
+        return count
+
+    def step(self, handler: TickHandler, *, limit: int | None = None) -> int:
+        """Sample the time source once and process any accumulated ticks.
 
-    def step(self, handler: TickHandler) -> int:
-        """Sample the time source once and process any accumulated ticks."""
+        ``limit`` caps the ticks processed by this step; the surplus stays in
+        the accumulator for the next step.
+        """
 
         now = self.time_source()
         delta = max(0.0, now - self._last_time)
         self._last_time = now
-        return self.advance_by(delta, handler)
+        if self.max_speed:
+            count = self.max_ticks_per_step or 1
+            return self.advance_ticks(
+                count if limit is None else min(count, limit), handler
+            )
+        due = self._collect(delta * self.time_scale)
+        if limit is not None and due > limit:
+            self._accumulator += (due - limit) * self.tick_duration
+            due = limit
+        return self.advance_ticks(due, handler)
 
     def run(self, ticks: int, handler: TickHandler) -> None:
         """Run the loop until ``ticks`` iterations have been processed."""
@@ -66,8 +163,63 @@ class TickLoop:
             msg = "TickLoop cannot run a negative number of ticks"
             raise ValueError(msg)
         processed = 0
+        if self.max_speed:
+            budget = self.max_ticks_per_step or ticks
+            while processed < ticks:
+                processed += self.advance_ticks(min(budget, ticks - processed), handler)
+            return
         while processed < ticks:
-            processed += self.step(handler)
+            processed += self.step(handler, limit=ticks - processed)
             if processed < ticks and self._accumulator < self.tick_duration:
                 remaining = self.tick_duration - self._accumulator
-                self.sleep(remaining)
+                self._wait(remaining / self.time_scale)
+
+    def time_until_next_tick(self) -> float:
+        """Return the wall-clock seconds until the next tick is due."""
+
+        remaining = max(0.0, self.tick_duration - self._accumulator)
+        return remaining / self.time_scale
+
+    def reset_time_reference(self) -> None:
+        """Forget wall-clock time elapsed since the last step, e.g. after a pause."""
+
+        self._last_time = self.time_source()
+
+    def _wait(self, duration: float) -> None:
+        """Sleep until the next tick is due, measuring how late we wake up."""
+
+        if self.stats is None and self.spin_threshold == 0.0:
+            self.sleep(duration)
+            return
+        deadline = self._last_time + duration
+        early = self.spin_threshold
+        if self.stats is not None:
+            early = max(early, self.stats.oversleep_estimate)
+        pause = deadline - self.time_source() - early
+        if pause > 0:
+            self.sleep(pause)
+        now = self.time_source()
+        if self.spin_threshold > 0:
+            while now < deadline:
+                now = self.time_source()
+        if self.stats is not None:
+            self.stats.record_wake(now - deadline)
+
+    def _collect(self, delta_seconds: float) -> int:
+        """Accumulate ``delta_seconds`` and return the ticks due under the budget."""
+
+        if delta_seconds < 0:
+            msg = "TickLoop cannot be advanced by a negative duration"
+            raise ValueError(msg)
+        self._accumulator += delta_seconds
+        budget = self.max_ticks_per_step
+        due = 0
+        while self._accumulator + 1e-12 >= self.tick_duration:
+            if budget is not None and due >= budget:
+                if self.catch_up == "defer":
+                    break
+                self._dropped_ticks += 1
+            else:
+                due += 1
+            self._accumulator -= self.tick_duration
+        return due
@@ -51,6 +51,16 @@ class RandomSource:
 
         return self._rng.random()
 
+    def randoms(self, count: int) -> list[float]:
+        """Return the next ``count`` values of :meth:`random` in one call.
+
+        The sequence is identical to calling :meth:`random` ``count`` times;
+        batching only avoids the per-call overhead in tight loops.
+        """
+
+        draw = self._rng.random
+        return [draw() for _ in range(count)]
+
     def fork(self, offset: int) -> "RandomSource":
         """Create a derived random source with a deterministic integer offset."""
 
@@ -68,3 +78,20 @@ class RandomSource:
         digest = hashlib.sha256(payload).digest()
         derived_seed = int.from_bytes(digest[:8], "big")
         return RandomSource(seed=_normalise_seed(derived_seed))
+
+    def namespaced_randoms(self, namespaces: Iterable[str]) -> list[float]:
+        """Return the first :meth:`random` value of each namespaced child.
+
+        Equivalent to ``[self.namespaced(ns).random() for ns in namespaces]``
+        but re-seeds a single generator instead of building one source per
+        namespace.
+        """
+
+        generator = Random()
+        values: list[float] = []
+        for namespace in namespaces:
+            payload = f"{self.seed}:{namespace}".encode("utf-8")
+            digest = hashlib.sha256(payload).digest()
+            generator.seed(_normalise_seed(int.from_bytes(digest[:8], "big")))
+            values.append(generator.random())
+        return values
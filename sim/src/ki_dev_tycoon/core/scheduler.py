@@ -0,0 +1,84 @@
+"""Priority queue of keyed future events for discrete-event updates."""
+
+from __future__ import annotations
+
+import heapq
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class EventScheduler(Generic[K]):
+    """Min-heap of "next interesting tick" events, at most one per key.
+
+    Rescheduling or cancelling a key leaves its old heap entry in place and
+    skips it lazily when it surfaces, so every operation is ``O(log n)`` and
+    a tick only touches the events that are actually due.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[int, int, K]] = []
+        self._pending: dict[K, tuple[int, int]] = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._pending
+
+    def schedule(self, key: K, tick: int) -> None:
+        """Schedule ``key`` at ``tick``, replacing any pending event of ``key``."""
+
+        self._sequence += 1
+        self._pending[key] = (tick, self._sequence)
+        heapq.heappush(self._heap, (tick, self._sequence, key))
+
+    def cancel(self, key: K) -> None:
+        """Drop the pending event of ``key`` if there is one."""
+
+        self._pending.pop(key, None)
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._pending.clear()
+
+    def tick_of(self, key: K) -> int | None:
+        """Return the tick ``key`` is scheduled at, or ``None``."""
+
+        entry = self._pending.get(key)
+        return entry[0] if entry is not None else None
+
+    def next_tick(self) -> int | None:
+        """Return the earliest pending tick without removing it."""
+
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, tick: int) -> list[K]:
+        """Remove and return every key scheduled at or before ``tick``.
+
+        Keys come out ordered by tick and then by scheduling order.
+        """
+
+        due: list[K] = []
+        heap = self._heap
+        pending = self._pending
+        while heap and heap[0][0] <= tick:
+            event_tick, sequence, key = heapq.heappop(heap)
+            if pending.get(key) == (event_tick, sequence):
+                del pending[key]
+                due.append(key)
+        return due
+
+    def _discard_stale(self) -> None:
+        heap = self._heap
+        pending = self._pending
+        while heap:
+            event_tick, sequence, key = heap[0]
+            if pending.get(key) == (event_tick, sequence):
+                return
+            heapq.heappop(heap)
+
+
+__all__ = ["EventScheduler"]
@@ -24,6 +24,12 @@ class TeamMember:
     role_id: str
     skill: float
     training_progress: float = 0.0
+    salary: float | None = None
+
+    def daily_salary(self, role_salary: float) -> float:
+        """Return the salary agreed on hire, or ``role_salary`` if there is none."""
+
+        return role_salary if self.salary is None else self.salary
 
     def gain_skill(self, delta: float) -> "TeamMember":
         """Return a new member with ``skill`` increased by ``delta``."""
@@ -43,18 +49,23 @@ class TeamMember:
         return replace(self, training_progress=0.0)
 
     def to_dict(self) -> Dict[str, float | str]:
-        return {
+        payload: Dict[str, float | str] = {
             "role_id": self.role_id,
             "skill": self.skill,
             "training_progress": self.training_progress,
         }
+        if self.salary is not None:
+            payload["salary"] = self.salary
+        return payload
 
     @classmethod
     def from_dict(cls, payload: Mapping[str, Any]) -> "TeamMember":
+        salary = payload.get("salary")
         return cls(
             role_id=str(payload["role_id"]),
             skill=float(payload["skill"]),
             training_progress=float(payload.get("training_progress", 0.0)),
+            salary=None if salary is None else float(salary),
         )
 
 
@@ -111,6 +122,11 @@ class ProductState:
 
         return replace(self, adoption=max(0, adoption))
 
+    def update_price(self, price: float) -> "ProductState":
+        """Return a new product state with a non-negative ``price``."""
+
+        return replace(self, price=max(0.0, price))
+
     def to_dict(self) -> Dict[str, float | int | str]:
         return {
             "product_id": self.product_id,
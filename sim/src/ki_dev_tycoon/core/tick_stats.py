@@ -0,0 +1,150 @@
+"""Rolling timing statistics for real-time tick loops."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Sequence
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+
+
+@dataclass(slots=True, frozen=True)
+class TickOverrun:
+    """A tick whose handler exceeded the available time budget."""
+
+    tick: int
+    duration: float
+    budget: float
+
+
+OverrunCallback = Callable[[TickOverrun], None]
+
+
+@dataclass(slots=True, frozen=True)
+class TickStatsSnapshot:
+    """Immutable summary of the recent tick timings (all values in seconds)."""
+
+    ticks: int
+    overruns: int
+    handler_mean: float
+    handler_p50: float
+    handler_p95: float
+    handler_max: float
+    jitter_mean: float
+    jitter_p95: float
+    jitter_max: float
+    oversleep_estimate: float
+    histogram: tuple[tuple[float, int], ...]
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+@dataclass(slots=True)
+class TickStats:
+    """Collect handler durations, wake-up jitter and budget overruns.
+
+    Durations and jitter are kept in a rolling window of ``window`` samples.
+    ``histogram`` buckets handler durations by the upper bounds in
+    ``buckets``; the final bucket (``inf``) catches everything slower.
+    """
+
+    window: int = 512
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    on_overrun: OverrunCallback | None = None
+    smoothing: float = 0.2
+    _handler_times: Deque[float] = field(init=False)
+    _jitter: Deque[float] = field(init=False)
+    _ticks: int = field(default=0, init=False)
+    _overruns: int = field(default=0, init=False)
+    _oversleep: float = field(default=0.0, init=False)
+
+    def __post_init__(self) -> None:
+        if self.window <= 0:
+            msg = "TickStats requires a positive window"
+            raise ValueError(msg)
+        if list(self.buckets) != sorted(self.buckets):
+            msg = "TickStats buckets must be sorted ascending"
+            raise ValueError(msg)
+        if not 0.0 < self.smoothing <= 1.0:
+            msg = "TickStats smoothing must be within (0, 1]"
+            raise ValueError(msg)
+        self._handler_times = deque(maxlen=self.window)
+        self._jitter = deque(maxlen=self.window)
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    @property
+    def overruns(self) -> int:
+        return self._overruns
+
+    @property
+    def oversleep_estimate(self) -> float:
+        """Smoothed amount by which sleeps wake up later than requested."""
+
+        return self._oversleep
+
+    def record_handler(self, tick: int, duration: float, budget: float) -> None:
+        """Record the handler time for ``tick`` and flag budget overruns."""
+
+        self._ticks += 1
+        self._handler_times.append(duration)
+        if duration > budget:
+            self._overruns += 1
+            if self.on_overrun is not None:
+                self.on_overrun(
+                    TickOverrun(tick=tick, duration=duration, budget=budget)
+                )
+
+    def record_wake(self, jitter: float) -> None:
+        """Record how far a wake-up landed from its deadline (late is positive)."""
+
+        self._jitter.append(jitter)
+        self._oversleep += self.smoothing * (max(0.0, jitter) - self._oversleep)
+
+    def histogram(self) -> tuple[tuple[float, int], ...]:
+        """Return ``(upper_bound, count)`` pairs for the handler durations."""
+
+        bounds = (*self.buckets, float("inf"))
+        counts = [0] * len(bounds)
+        for duration in self._handler_times:
+            for index, bound in enumerate(bounds):
+                if duration <= bound:
+                    counts[index] += 1
+                    break
+        return tuple(zip(bounds, counts))
+
+    def snapshot(self) -> TickStatsSnapshot:
+        """Summarise the current window."""
+
+        handler = sorted(self._handler_times)
+        jitter = sorted(abs(value) for value in self._jitter)
+        return TickStatsSnapshot(
+            ticks=self._ticks,
+            overruns=self._overruns,
+            handler_mean=sum(handler) / len(handler) if handler else 0.0,
+            handler_p50=_percentile(handler, 0.5),
+            handler_p95=_percentile(handler, 0.95),
+            handler_max=handler[-1] if handler else 0.0,
+            jitter_mean=sum(jitter) / len(jitter) if jitter else 0.0,
+            jitter_p95=_percentile(jitter, 0.95),
+            jitter_max=jitter[-1] if jitter else 0.0,
+            oversleep_estimate=self._oversleep,
+            histogram=self.histogram(),
+        )
+
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "OverrunCallback",
+    "TickOverrun",
+    "TickStats",
+    "TickStatsSnapshot",
+]
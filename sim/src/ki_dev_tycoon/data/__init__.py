@@ -1,5 +1,25 @@
 """Asset loading utilities."""
 
-from ki_dev_tycoon.data.loader import AssetBundle, load_assets
+from ki_dev_tycoon.data.loader import (
+    COMPILED_ASSETS_NAME,
+    AssetBundle,
+    compile_assets,
+    load_assets,
+    load_compiled_assets,
+)
+from ki_dev_tycoon.data.synthetic import (
+    SyntheticAssetSpec,
+    generate_assets,
+    write_assets,
+)
 
-__all__ = ["AssetBundle", "load_assets"]
+__all__ = [
+    "COMPILED_ASSETS_NAME",
+    "AssetBundle",
+    "SyntheticAssetSpec",
+    "compile_assets",
+    "generate_assets",
+    "load_assets",
+    "load_compiled_assets",
+    "write_assets",
+]
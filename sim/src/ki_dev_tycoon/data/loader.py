@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
+import marshal
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, TypeVar
+from typing import Any, Callable, Mapping, TypeVar
 
-import yaml
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from ki_dev_tycoon.config.schemas import (
     EventCatalogue,
@@ -23,6 +25,7 @@ from ki_dev_tycoon.config.schemas import (
 )
 
 T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
 
 ASSET_FILES: dict[str, Callable[[list[dict[str, object]]], object]] = {
     "roles.yaml": RoleCatalogue.model_validate,
@@ -32,6 +35,10 @@ ASSET_FILES: dict[str, Callable[[list[dict[str, object]]], object]] = {
     "events.yaml": EventCatalogue.model_validate,
 }
 
+COMPILED_ASSETS_NAME = "assets.kiab"
+_COMPILED_MAGIC = b"KIAB"
+_COMPILED_FORMAT = 2
+
 ALLOWED_EVENT_EFFECTS: frozenset[str] = frozenset(
     {"demand_multiplier", "quality_penalty", "reputation_bonus"}
 )
@@ -62,6 +69,8 @@ class AssetBundle:
 
 
 def _load_yaml(path: Path) -> list[dict[str, object]]:
+    import yaml
+
     if not path.exists():
         msg = f"Missing asset file: {path}"
         raise AssetLoaderError(msg)
@@ -81,8 +90,13 @@ def _load_yaml(path: Path) -> list[dict[str, object]]:
     return raw
 
 
-def _validate_catalogue(path: Path, validator: Callable[[list[dict[str, object]]], T]) -> T:
-    raw = _load_yaml(path)
+def _validate_catalogue(
+    path: Path,
+    validator: Callable[[list[dict[str, object]]], T],
+    raw: list[dict[str, object]] | None = None,
+) -> T:
+    if raw is None:
+        raw = _load_yaml(path)
     try:
         return validator(raw)
     except ValidationError as exc:
@@ -123,27 +137,23 @@ def _ensure_event_effects(events: dict[str, EventConfig]) -> None:
             raise AssetLoaderError(msg)
 
 
-def load_assets(root: Path) -> AssetBundle:
-    """Load all balancing assets located under ``root``."""
+def _build_bundle(
+    root: Path, raw: Mapping[str, list[dict[str, object]]] | None = None
+) -> AssetBundle:
+    """Validate the five catalogues, read from YAML unless ``raw`` provides them."""
 
-    root = root.expanduser().resolve()
-    roles_catalogue = _validate_catalogue(root / "roles.yaml", ASSET_FILES["roles.yaml"])
-    products_catalogue = _validate_catalogue(
-        root / "products.yaml", ASSET_FILES["products.yaml"]
-    )
-    markets_catalogue = _validate_catalogue(
-        root / "markets.yaml", ASSET_FILES["markets.yaml"]
-    )
-    research_catalogue = _validate_catalogue(
-        root / "research.yaml", ASSET_FILES["research.yaml"]
-    )
-    events_catalogue = _validate_catalogue(root / "events.yaml", ASSET_FILES["events.yaml"])
+    def catalogue(filename: str) -> Any:
+        return _validate_catalogue(
+            root / filename,
+            ASSET_FILES[filename],
+            None if raw is None else raw[filename],
+        )
 
-    roles = roles_catalogue.as_dict()
-    products = products_catalogue.as_dict()
-    markets = markets_catalogue.as_dict()
-    research = research_catalogue.as_dict()
-    events = events_catalogue.as_dict()
+    roles = catalogue("roles.yaml").as_dict()
+    products = catalogue("products.yaml").as_dict()
+    markets = catalogue("markets.yaml").as_dict()
+    research = catalogue("research.yaml").as_dict()
+    events = catalogue("events.yaml").as_dict()
 
     if not products:
         raise AssetLoaderError("At least one product must be defined")
@@ -163,3 +173,137 @@ def load_assets(root: Path) -> AssetBundle:
         research=research,
         events=events,
     )
+
+
+def _construct(model: type[M], data: Mapping[str, Any]) -> M:
+    """Rebuild ``model`` from a trusted :meth:`~BaseModel.model_dump` payload."""
+
+    values = dict(data)
+    for name, field in model.model_fields.items():
+        nested = field.annotation
+        if (
+            isinstance(nested, type)
+            and issubclass(nested, BaseModel)
+            and isinstance(values.get(name), dict)
+        ):
+            values[name] = _construct(nested, values[name])
+    return model.model_construct(**values)
+
+
+def asset_fingerprint(root: Path) -> bytes:
+    """Return a SHA-256 digest over the YAML asset files under ``root``."""
+
+    digest = hashlib.sha256()
+    for filename in ASSET_FILES:
+        path = root / filename
+        digest.update(filename.encode("utf-8"))
+        digest.update(path.read_bytes() if path.exists() else b"")
+    return digest.digest()
+
+
+def compile_assets(root: Path, output: Path | None = None) -> Path:
+    """Validate the YAML assets under ``root`` and store them in binary form.
+
+    The compiled file (``assets.kiab`` next to the YAML files by default) is
+    preferred by :func:`load_assets`, which skips YAML parsing entirely. It is
+    tied to the running Python minor version and to the YAML sources it was
+    built from. Entries are stored as Python-mode dumps of the validated
+    models so that loading can rebuild them without validating again.
+    """
+
+    import zstandard
+
+    root = root.expanduser().resolve()
+    bundle = _build_bundle(root)
+    payload: dict[str, Mapping[str, BaseModel]] = {
+        "roles.yaml": bundle.roles,
+        "products.yaml": bundle.products,
+        "markets.yaml": bundle.markets,
+        "research.yaml": bundle.research,
+        "events.yaml": bundle.events,
+    }
+    raw = {
+        filename: [entry.model_dump(exclude_unset=True) for entry in entries.values()]
+        for filename, entries in payload.items()
+    }
+    header = _COMPILED_MAGIC + bytes(
+        (_COMPILED_FORMAT, sys.version_info.major, sys.version_info.minor)
+    )
+    body = zstandard.ZstdCompressor(level=10).compress(marshal.dumps(raw))
+    target = output or root / COMPILED_ASSETS_NAME
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(header + asset_fingerprint(root) + body)
+    return target
+
+
+def load_compiled_assets(
+    path: Path, *, fingerprint: bytes | None = None
+) -> AssetBundle:
+    """Load a bundle written by :func:`compile_assets`.
+
+    When ``fingerprint`` is given the file must have been compiled from YAML
+    sources with that digest; stale or foreign files raise
+    :class:`AssetLoaderError`. The entries were validated by
+    :func:`compile_assets`, so the models are constructed without running
+    validation again.
+    """
+
+    import zstandard
+
+    try:
+        blob = path.read_bytes()
+    except OSError as exc:
+        msg = f"Failed to read compiled assets {path}"
+        raise AssetLoaderError(msg) from exc
+    header = _COMPILED_MAGIC + bytes(
+        (_COMPILED_FORMAT, sys.version_info.major, sys.version_info.minor)
+    )
+    if not blob.startswith(header):
+        msg = f"Compiled assets {path} have an unsupported format or Python version"
+        raise AssetLoaderError(msg)
+    offset = len(header) + hashlib.sha256().digest_size
+    if fingerprint is not None and blob[len(header) : offset] != fingerprint:
+        msg = f"Compiled assets {path} are out of date"
+        raise AssetLoaderError(msg)
+    try:
+        raw = marshal.loads(zstandard.ZstdDecompressor().decompress(blob[offset:]))
+    except (zstandard.ZstdError, EOFError, ValueError, TypeError) as exc:
+        msg = f"Compiled assets {path} are corrupt"
+        raise AssetLoaderError(msg) from exc
+
+    def catalogue(filename: str, model: type[M]) -> dict[str, M]:
+        return {entry["id"]: _construct(model, entry) for entry in raw[filename]}
+
+    try:
+        return AssetBundle(
+            roles=catalogue("roles.yaml", RoleConfig),
+            products=catalogue("products.yaml", ProductConfig),
+            markets=catalogue("markets.yaml", MarketConfig),
+            research=catalogue("research.yaml", ResearchNode),
+            events=catalogue("events.yaml", EventConfig),
+        )
+    except (KeyError, TypeError) as exc:
+        msg = f"Compiled assets {path} are corrupt"
+        raise AssetLoaderError(msg) from exc
+
+
+def load_assets(root: Path) -> AssetBundle:
+    """Load all balancing assets located under ``root``.
+
+    A compiled ``assets.kiab`` in ``root`` is used when it matches the YAML
+    files (or when no YAML files are present, as in packaged builds).
+    """
+
+    root = root.expanduser().resolve()
+    compiled = root / COMPILED_ASSETS_NAME
+    if compiled.is_file():
+        has_sources = any((root / filename).exists() for filename in ASSET_FILES)
+        try:
+            return load_compiled_assets(
+                compiled,
+                fingerprint=asset_fingerprint(root) if has_sources else None,
+            )
+        except AssetLoaderError:
+            if not has_sources:
+                raise
+    return _build_bundle(root)
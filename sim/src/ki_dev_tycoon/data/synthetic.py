@@ -0,0 +1,222 @@
+"""Seeded generator for large synthetic asset catalogues."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping
+
+import yaml
+from pydantic import BaseModel
+
+from ki_dev_tycoon.config.schemas import (
+    EventConfig,
+    MarketConfig,
+    ProductConfig,
+    ResearchNode,
+    ResearchUnlocks,
+    RoleConfig,
+)
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.data.loader import AssetBundle
+
+# Effect ranges mirror the hand-written ``assets/events.yaml`` entries.
+EVENT_EFFECT_RANGES: dict[str, tuple[float, float]] = {
+    "demand_multiplier": (0.85, 1.2),
+    "quality_penalty": (0.01, 0.08),
+    "reputation_bonus": (-4.0, 6.0),
+}
+UNLOCK_RANGES: dict[str, tuple[float, float]] = {
+    "quality_bonus": (0.005, 0.05),
+    "demand_bonus": (0.005, 0.05),
+    "training_bonus": (0.005, 0.04),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class SyntheticAssetSpec:
+    """Size and shape of a generated asset catalogue.
+
+    Research nodes pick up to ``max_prerequisites`` parents among the previous
+    ``prerequisite_window`` nodes, which yields a layered DAG with mostly local
+    dependencies similar to a hand-authored tech tree.
+    """
+
+    roles: int = 20
+    products: int = 100
+    markets: int = 10
+    research: int = 200
+    events: int = 20
+    seed: int = 42
+    max_required_roles: int = 3
+    max_prerequisites: int = 3
+    prerequisite_window: int = 16
+
+    def __post_init__(self) -> None:
+        for name in ("roles", "products", "markets"):
+            if getattr(self, name) <= 0:
+                msg = f"SyntheticAssetSpec requires at least one entry for {name}"
+                raise ValueError(msg)
+        for name in ("research", "events", "max_prerequisites"):
+            if getattr(self, name) < 0:
+                msg = f"SyntheticAssetSpec {name} must not be negative"
+                raise ValueError(msg)
+        if self.max_required_roles <= 0 or self.prerequisite_window <= 0:
+            msg = "SyntheticAssetSpec requires positive role and prerequisite limits"
+            raise ValueError(msg)
+
+    @classmethod
+    def scaled(cls, size: int, *, seed: int = 42) -> "SyntheticAssetSpec":
+        """Return a spec with ``size`` roles, products and research nodes."""
+
+        return cls(
+            roles=size,
+            products=size,
+            markets=max(1, size // 10),
+            research=size,
+            events=min(size, 20),
+            seed=seed,
+        )
+
+
+def _between(rng: RandomSource, lower: float, upper: float, digits: int = 3) -> float:
+    return round(lower + (upper - lower) * rng.random(), digits)
+
+
+def _sample(rng: RandomSource, population: int, count: int) -> list[int]:
+    """Return ``count`` distinct indices from ``range(population)``."""
+
+    picked: list[int] = []
+    while len(picked) < min(count, population):
+        index = rng.randint(0, population - 1)
+        if index not in picked:
+            picked.append(index)
+    return sorted(picked)
+
+
+def _roles(spec: SyntheticAssetSpec, rng: RandomSource) -> dict[str, RoleConfig]:
+    roles: dict[str, RoleConfig] = {}
+    for index in range(spec.roles):
+        role_id = f"role_{index}"
+        roles[role_id] = RoleConfig(
+            id=role_id,
+            name=f"Role {index}",
+            salary=_between(rng, 70.0, 160.0, 1),
+            hiring_difficulty=_between(rng, 0.1, 0.6),
+            training_rate=_between(rng, 0.02, 0.06),
+            productivity=_between(rng, 0.3, 0.7),
+        )
+    return roles
+
+
+def _markets(spec: SyntheticAssetSpec, rng: RandomSource) -> dict[str, MarketConfig]:
+    markets: dict[str, MarketConfig] = {}
+    for index in range(spec.markets):
+        market_id = f"market_{index}"
+        markets[market_id] = MarketConfig(
+            id=market_id,
+            name=f"Market {index}",
+            tam=rng.randint(2_000, 50_000),
+            base_demand=_between(rng, 0.005, 0.03, 4),
+            price_elasticity=_between(rng, 0.5, 1.5),
+        )
+    return markets
+
+
+def _products(spec: SyntheticAssetSpec, rng: RandomSource) -> dict[str, ProductConfig]:
+    products: dict[str, ProductConfig] = {}
+    for index in range(spec.products):
+        product_id = f"product_{index}"
+        role_count = rng.randint(1, min(spec.max_required_roles, spec.roles))
+        products[product_id] = ProductConfig(
+            id=product_id,
+            name=f"Product {index}",
+            target_market=f"market_{rng.randint(0, spec.markets - 1)}",
+            base_quality=_between(rng, 0.3, 0.55),
+            base_price=_between(rng, 5.0, 80.0, 2),
+            required_roles={
+                f"role_{role}": rng.randint(1, 3)
+                for role in _sample(rng, spec.roles, role_count)
+            },
+        )
+    return products
+
+
+def _research(spec: SyntheticAssetSpec, rng: RandomSource) -> dict[str, ResearchNode]:
+    research: dict[str, ResearchNode] = {}
+    unlock_keys = tuple(UNLOCK_RANGES)
+    for index in range(spec.research):
+        node_id = f"node_{index}"
+        window = min(index, spec.prerequisite_window)
+        parents = _sample(rng, window, rng.randint(0, spec.max_prerequisites))
+        unlock = rng.choice(unlock_keys)
+        research[node_id] = ResearchNode(
+            id=node_id,
+            name=f"Node {index}",
+            # Deeper nodes tend to be more expensive, as in the shipped tree.
+            cost=8 + index // 10 + rng.randint(0, 8),
+            unlocks=ResearchUnlocks(**{unlock: _between(rng, *UNLOCK_RANGES[unlock])}),
+            prerequisites=tuple(
+                f"node_{index - window + parent}" for parent in parents
+            ),
+        )
+    return research
+
+
+def _events(spec: SyntheticAssetSpec, rng: RandomSource) -> dict[str, EventConfig]:
+    events: dict[str, EventConfig] = {}
+    effect_keys = tuple(EVENT_EFFECT_RANGES)
+    for index in range(spec.events):
+        event_id = f"event_{index}"
+        effect = rng.choice(effect_keys)
+        events[event_id] = EventConfig(
+            id=event_id,
+            name=f"Event {index}",
+            # Heavy-tailed weights: a few common events, many rare ones.
+            weight=round(0.1 / (0.1 + rng.random()), 3),
+            effects={effect: _between(rng, *EVENT_EFFECT_RANGES[effect])},
+        )
+    return events
+
+
+def generate_assets(spec: SyntheticAssetSpec | None = None) -> AssetBundle:
+    """Return a seeded :class:`AssetBundle` that satisfies ``load_assets`` checks.
+
+    Each catalogue draws from its own namespaced stream, so changing the size
+    of one catalogue does not shift the random draws of the others.
+    """
+
+    spec = spec or SyntheticAssetSpec()
+    rng = RandomSource(seed=spec.seed)
+    return AssetBundle(
+        roles=_roles(spec, rng.namespaced("roles")),
+        products=_products(spec, rng.namespaced("products")),
+        markets=_markets(spec, rng.namespaced("markets")),
+        research=_research(spec, rng.namespaced("research")),
+        events=_events(spec, rng.namespaced("events")),
+    )
+
+
+def write_assets(bundle: AssetBundle, root: Path) -> Path:
+    """Serialise ``bundle`` into the YAML layout read by ``load_assets``."""
+
+    root.mkdir(parents=True, exist_ok=True)
+    catalogues: dict[str, Mapping[str, BaseModel]] = {
+        "roles.yaml": bundle.roles,
+        "products.yaml": bundle.products,
+        "markets.yaml": bundle.markets,
+        "research.yaml": bundle.research,
+        "events.yaml": bundle.events,
+    }
+    for filename, entries in catalogues.items():
+        payload: list[dict[str, Any]] = [
+            entry.model_dump(mode="json", exclude_none=True)
+            for entry in entries.values()
+        ]
+        (root / filename).write_text(
+            yaml.safe_dump(payload, sort_keys=False), encoding="utf-8"
+        )
+    return root
+
+
+__all__ = ["SyntheticAssetSpec", "generate_assets", "write_assets"]
@@ -1,6 +1,25 @@
 """Economy subsystem."""
 
 from .cashflow import CashflowParameters, compute_daily_cash_delta
-from .demand import project_adoption
+from .competition import (
+    CompetitionResult,
+    CompetitionState,
+    RivalMarket,
+    create_competition,
+    step_competition,
+    summarise_competition,
+)
+from .demand import offer_attractiveness, project_adoption
 
-__all__ = ["CashflowParameters", "compute_daily_cash_delta", "project_adoption"]
+__all__ = [
+    "CashflowParameters",
+    "CompetitionResult",
+    "CompetitionState",
+    "RivalMarket",
+    "compute_daily_cash_delta",
+    "create_competition",
+    "offer_attractiveness",
+    "project_adoption",
+    "step_competition",
+    "summarise_competition",
+]
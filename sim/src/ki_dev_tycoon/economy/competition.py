@@ -0,0 +1,256 @@
+"""Rival studios competing with the player for shared markets."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Mapping, Sequence
+
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.data.loader import AssetBundle
+from ki_dev_tycoon.economy.demand import offer_attractiveness
+
+DEFAULT_CHURN = 0.05
+
+# Per-tick random walk of rival quality; slightly positive so bots improve.
+_QUALITY_DRIFT = (-0.009, 0.011)
+
+
+@dataclass(slots=True, frozen=True)
+class RivalMarket:
+    """Offers of all rival studios in one market, stored column-wise.
+
+    Index ``i`` of every column describes the offer of ``company_ids[i]``;
+    keeping plain tuples per column lets a tick update a market with a few
+    list comprehensions instead of one object per offer. ``pull`` caches the
+    price and reputation part of :func:`offer_attractiveness`, which does not
+    change while rivals keep their prices.
+    """
+
+    market_id: str
+    company_ids: tuple[str, ...]
+    quality: tuple[float, ...]
+    price: tuple[float, ...]
+    reputation: tuple[float, ...]
+    adoption: tuple[int, ...]
+    pull: tuple[float, ...]
+
+    @property
+    def total_adoption(self) -> int:
+        return sum(self.adoption)
+
+
+@dataclass(slots=True, frozen=True)
+class CompetitionState:
+    """Immutable snapshot of every rival market."""
+
+    markets: tuple[RivalMarket, ...]
+
+    @property
+    def companies(self) -> tuple[str, ...]:
+        """Return the ids of all rival studios in first-seen order."""
+
+        seen: dict[str, None] = {}
+        for market in self.markets:
+            seen.update(dict.fromkeys(market.company_ids))
+        return tuple(seen)
+
+    def market(self, market_id: str) -> RivalMarket | None:
+        return next(
+            (market for market in self.markets if market.market_id == market_id), None
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class CompetitionResult:
+    """Outcome of one competitive market tick."""
+
+    state: CompetitionState
+    player_adoption: dict[str, int]
+    player_share: dict[str, float]
+
+
+def create_competition(
+    assets: AssetBundle,
+    *,
+    companies: int,
+    rng: RandomSource,
+    markets_per_company: int | None = None,
+) -> CompetitionState:
+    """Return ``companies`` seeded rival studios spread over the asset markets.
+
+    Every studio draws from its own ``company:<index>`` stream, so adding
+    studios never changes the offers of the existing ones.
+    """
+
+    if companies < 0:
+        msg = "Number of rival companies must not be negative"
+        raise ValueError(msg)
+    if markets_per_company is not None and markets_per_company <= 0:
+        msg = "Rival companies must enter at least one market"
+        raise ValueError(msg)
+    market_ids = tuple(assets.markets)
+    columns: dict[str, tuple[list[str], list[float], list[float], list[float]]] = {
+        market_id: ([], [], [], []) for market_id in market_ids
+    }
+    for index in range(companies):
+        company_rng = rng.namespaced(f"company:{index}")
+        company_id = f"studio_{index}"
+        reputation = round(30.0 + 40.0 * company_rng.random(), 3)
+        entered = market_ids
+        if markets_per_company is not None and markets_per_company < len(market_ids):
+            entered = _pick(company_rng, market_ids, markets_per_company)
+        for market_id in entered:
+            market = assets.markets[market_id]
+            ids, quality, price, reputations = columns[market_id]
+            ids.append(company_id)
+            quality.append(round(0.25 + 0.4 * company_rng.random(), 4))
+            price_cap = max(1.0, market.price_elasticity * 100)
+            price.append(round(price_cap * (0.1 + 0.5 * company_rng.random()), 2))
+            reputations.append(reputation)
+    return CompetitionState(
+        markets=tuple(
+            RivalMarket(
+                market_id=market_id,
+                company_ids=tuple(ids),
+                quality=tuple(quality),
+                price=tuple(price),
+                reputation=tuple(reputations),
+                adoption=(0,) * len(ids),
+                pull=tuple(
+                    offer_attractiveness(
+                        1.0, value, reputation, assets.markets[market_id]
+                    )
+                    for value, reputation in zip(price, reputations)
+                ),
+            )
+            for market_id, (ids, quality, price, reputations) in columns.items()
+        )
+    )
+
+
+def _pick(rng: RandomSource, values: Sequence[str], count: int) -> tuple[str, ...]:
+    picked: list[str] = []
+    while len(picked) < count:
+        value = rng.choice(values)
+        if value not in picked:
+            picked.append(value)
+    return tuple(value for value in values if value in picked)
+
+
+def step_competition(
+    competition: CompetitionState,
+    *,
+    assets: AssetBundle,
+    rng: RandomSource,
+    tick: int,
+    player_offers: Mapping[str, Sequence[tuple[str, float, float, int]]],
+    player_reputation: float,
+    demand_multiplier: float = 1.0,
+    churn: float = DEFAULT_CHURN,
+) -> CompetitionResult:
+    """Grow every rival offer and split saturated markets by attractiveness.
+
+    ``player_offers`` maps market ids to ``(product_id, quality, price,
+    adoption)`` tuples whose adoption already includes this tick's growth.
+    While a market has room, every offer keeps its own growth. Once the
+    combined adoption would exceed the TAM, the TAM is re-divided: customers
+    stay with their current offer, except for a ``churn`` fraction that
+    follows the quality/price/reputation attractiveness of all offers.
+    """
+
+    low, high = _QUALITY_DRIFT
+    span = high - low
+    markets: list[RivalMarket] = []
+    player_adoption: dict[str, int] = {}
+    player_share: dict[str, float] = {}
+    for rivals in competition.markets:
+        market = assets.markets[rivals.market_id]
+        offers = player_offers.get(rivals.market_id, ())
+        if not rivals.company_ids:
+            markets.append(rivals)
+            if offers:
+                player_adoption.update((offer[0], offer[3]) for offer in offers)
+                player_share[rivals.market_id] = 1.0
+            continue
+        rival_count = len(rivals.company_ids)
+        market_rng = rng.namespaced(f"{rivals.market_id}:{tick}")
+        drifted = [
+            value + low + span * roll
+            for value, roll in zip(rivals.quality, market_rng.randoms(rival_count))
+        ]
+        quality = [
+            0.0 if value < 0.0 else 1.0 if value > 1.0 else value for value in drifted
+        ]
+        attractiveness = [pull * value for pull, value in zip(rivals.pull, quality)]
+        scale = market.tam * market.base_demand * demand_multiplier
+        # Growth noise of +/-2.5 %, as in ``project_adoption``.
+        targets = [
+            adoption + int(scale * appeal * (0.975 + 0.05 * roll))
+            for adoption, appeal, roll in zip(
+                rivals.adoption, attractiveness, market_rng.randoms(rival_count)
+            )
+        ]
+        targets.extend(offer[3] for offer in offers)
+        attractiveness.extend(
+            offer_attractiveness(offer[1], offer[2], player_reputation, market)
+            for offer in offers
+        )
+        total_target = sum(targets)
+        if total_target > market.tam:
+            total_appeal = sum(attractiveness) or 1.0
+            stay = market.tam * (1.0 - churn) / total_target
+            switch = market.tam * churn / total_appeal
+            targets = [
+                int(target * stay + appeal * switch)
+                for target, appeal in zip(targets, attractiveness)
+            ]
+        markets.append(
+            replace(
+                rivals,
+                quality=tuple(quality),
+                adoption=tuple(targets[:rival_count]),
+            )
+        )
+        if offers:
+            player_total = 0
+            for offer, adoption in zip(offers, targets[rival_count:]):
+                player_adoption[offer[0]] = adoption
+                player_total += adoption
+            total = sum(targets)
+            player_share[rivals.market_id] = player_total / total if total else 0.0
+    return CompetitionResult(
+        state=CompetitionState(markets=tuple(markets)),
+        player_adoption=player_adoption,
+        player_share=player_share,
+    )
+
+
+def summarise_competition(
+    competition: CompetitionState, player_share: Mapping[str, float]
+) -> dict[str, dict[str, float | str | int]]:
+    """Return per-market player share, rival count and the leading rival."""
+
+    summary: dict[str, dict[str, float | str | int]] = {}
+    for rivals in competition.markets:
+        leader = ""
+        if rivals.company_ids:
+            best = max(range(len(rivals.adoption)), key=rivals.adoption.__getitem__)
+            leader = rivals.company_ids[best]
+        summary[rivals.market_id] = {
+            "player_share": round(player_share.get(rivals.market_id, 0.0), 4),
+            "rivals": len(rivals.company_ids),
+            "rival_adoption": rivals.total_adoption,
+            "leader": leader,
+        }
+    return summary
+
+
+__all__ = [
+    "DEFAULT_CHURN",
+    "CompetitionResult",
+    "CompetitionState",
+    "RivalMarket",
+    "create_competition",
+    "step_competition",
+    "summarise_competition",
+]
@@ -2,11 +2,25 @@
 
 from __future__ import annotations
 
+from ki_dev_tycoon.config.schemas import MarketConfig
 from ki_dev_tycoon.core.rng import RandomSource
 from ki_dev_tycoon.core.state import GameState, ProductState
 from ki_dev_tycoon.data.loader import AssetBundle
 
 
+def offer_attractiveness(
+    quality: float, price: float, reputation: float, market: MarketConfig
+) -> float:
+    """Return the price, quality and reputation pull of one offer in ``market``.
+
+    Uses the same factors as :func:`project_adoption` so that competing offers
+    are ranked the way the single-studio growth model rewards them.
+    """
+
+    price_factor = max(0.1, 1.0 - price / max(1.0, market.price_elasticity * 100))
+    return price_factor * max(0.0, quality) * (0.5 + reputation / 100)
+
+
 def project_adoption(
     state: GameState,
     *,
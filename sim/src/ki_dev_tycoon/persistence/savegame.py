@@ -27,6 +27,7 @@ class TeamMemberModel(BaseModel):
     role_id: str
     skill: float = Field(ge=0.0, le=1.0)
     training_progress: float = Field(ge=0.0, le=1.0)
+    salary: float | None = Field(default=None, ge=0.0)
 
     @classmethod
     def from_member(cls, member: TeamMember) -> "TeamMemberModel":
@@ -34,6 +35,7 @@ class TeamMemberModel(BaseModel):
             role_id=member.role_id,
             skill=member.skill,
             training_progress=member.training_progress,
+            salary=member.salary,
         )
 
     def to_member(self) -> TeamMember:
@@ -41,6 +43,7 @@ class TeamMemberModel(BaseModel):
             role_id=self.role_id,
             skill=float(self.skill),
             training_progress=float(self.training_progress),
+            salary=None if self.salary is None else float(self.salary),
         )
 
 
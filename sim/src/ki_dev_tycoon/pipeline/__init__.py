@@ -0,0 +1,60 @@
+"""Ordered tick pipeline shared by every simulation front-end."""
+
+from ki_dev_tycoon.pipeline.context import TickContext
+from ki_dev_tycoon.pipeline.fast_forward import FastForward, SteadyTick
+from ki_dev_tycoon.pipeline.macro import RESOLUTIONS, MacroEngine, MacroTick, Resolution
+from ki_dev_tycoon.pipeline.profiling import TRACE_FORMATS, StageProfiler, TraceFormat
+from ki_dev_tycoon.pipeline.runner import TickHook, TickPipeline
+from ki_dev_tycoon.pipeline.stopping import (
+    Bankruptcy,
+    Stagnation,
+    StopCondition,
+    StopMonitor,
+    StopReason,
+    TargetReached,
+)
+from ki_dev_tycoon.pipeline.systems import (
+    AchievementSystem,
+    CompetitionSystem,
+    DeferredSystem,
+    EventSystem,
+    FinanceSystem,
+    HiringSystem,
+    MarketSystem,
+    ResearchSystem,
+    TickSystem,
+    TrainingSystem,
+    default_systems,
+)
+
+__all__ = [
+    "RESOLUTIONS",
+    "TRACE_FORMATS",
+    "AchievementSystem",
+    "Bankruptcy",
+    "CompetitionSystem",
+    "DeferredSystem",
+    "EventSystem",
+    "FastForward",
+    "FinanceSystem",
+    "HiringSystem",
+    "MacroEngine",
+    "MacroTick",
+    "MarketSystem",
+    "ResearchSystem",
+    "Resolution",
+    "StageProfiler",
+    "Stagnation",
+    "SteadyTick",
+    "StopCondition",
+    "StopMonitor",
+    "StopReason",
+    "TargetReached",
+    "TickContext",
+    "TickHook",
+    "TickPipeline",
+    "TickSystem",
+    "TraceFormat",
+    "TrainingSystem",
+    "default_systems",
+]
@@ -0,0 +1,61 @@
+"""Per-tick scratch space passed through the pipeline systems."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ki_dev_tycoon.achievements import AchievementSnapshot, AchievementTracker
+from ki_dev_tycoon.config.schemas import EventConfig
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.core.state import GameState, TeamMember
+from ki_dev_tycoon.data.loader import AssetBundle
+
+if TYPE_CHECKING:
+    from ki_dev_tycoon.economy.competition import CompetitionState
+    from ki_dev_tycoon.pipeline.profiling import StageProfiler
+    from ki_dev_tycoon.team.labor_market import LaborMarket
+
+
+@dataclass(slots=True)
+class TickContext:
+    """Mutable working set for a single tick.
+
+    Systems read and replace ``state`` and record what happened during the tick
+    (hires, research completions, sampled event, revenue) so that hooks can
+    observe the outcome without re-deriving it.
+    """
+
+    state: GameState
+    assets: AssetBundle
+    rng: RandomSource
+    achievement_tracker: AchievementTracker
+    operating_costs: float
+    product_ids: tuple[str, ...]
+    quality_bonus: float = 0.0
+    demand_bonus: float = 0.0
+    training_bonus: float = 0.0
+    hired: tuple[TeamMember, ...] = ()
+    completed_research: tuple[str, ...] = ()
+    event: EventConfig | None = None
+    demand_multiplier: float = 1.0
+    quality_penalty: float = 0.0
+    revenue: float = 0.0
+    cash_delta: float = 0.0
+    unlocked: tuple[AchievementSnapshot, ...] = ()
+    profiler: StageProfiler | None = None
+    competition: CompetitionState | None = None
+    market_share: dict[str, float] | None = None
+    labor_market: LaborMarket | None = None
+    open_positions: dict[str, int] | None = None
+
+    @property
+    def tick(self) -> int:
+        """Return the tick currently being processed."""
+
+        return self.state.tick
+
+    def stream(self, namespace: str) -> RandomSource:
+        """Return the deterministic RNG stream of ``namespace`` for this tick."""
+
+        return self.rng.namespaced(f"{namespace}:{self.state.tick}")
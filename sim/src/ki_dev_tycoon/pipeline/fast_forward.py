@@ -0,0 +1,222 @@
+"""Closed-form advancement of steady-state stretches of the built-in pipeline."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Callable
+
+from ki_dev_tycoon.achievements import AchievementSnapshot, AchievementTracker
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.core.state import GameState, ProductState
+from ki_dev_tycoon.data.loader import AssetBundle
+from ki_dev_tycoon.pipeline.runner import TickPipeline
+from ki_dev_tycoon.pipeline.systems import (
+    AchievementSystem,
+    EventSystem,
+    FinanceSystem,
+    HiringSystem,
+    MarketSystem,
+    ResearchSystem,
+    TrainingSystem,
+    aggregate_research_bonuses,
+    compute_research_points,
+    fully_staffed,
+    pick_event,
+)
+from ki_dev_tycoon.research import progress_research
+
+# Shorter stretches are cheaper to step than to plan.
+MIN_STRETCH = 4
+
+_STEADY_SYSTEMS = (
+    HiringSystem,
+    TrainingSystem,
+    ResearchSystem,
+    EventSystem,
+    MarketSystem,
+    FinanceSystem,
+    AchievementSystem,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class SteadyTick:
+    """End-of-tick outcome of one fast-forwarded tick."""
+
+    state: GameState
+    revenue: float
+    unlocked: tuple[AchievementSnapshot, ...]
+
+
+class FastForward:
+    """Advance the built-in pipeline through steady stretches in closed form.
+
+    A stretch is steady while every product has saturated its market's TAM,
+    the team is fully staffed and no skill-up changes a skill, and research
+    either has nothing left to select or is still short of completing its
+    active node. Such a tick leaves adoption and revenue unchanged; it only
+    samples an event, re-applies its quality penalty and moves cash and
+    reputation. :meth:`advance` draws the event and reputation rolls of the
+    whole stretch in one batch and repeats the systems' float operations in
+    the same order, so states are identical to stepwise execution.
+    """
+
+    def __init__(self, pipeline: TickPipeline) -> None:
+        self._pipeline = pipeline
+        systems = pipeline.systems
+        self._supported = tuple(type(system) for system in systems) == _STEADY_SYSTEMS
+        self._training: TrainingSystem | None = None
+        self._market: MarketSystem | None = None
+        if self._supported:
+            training, market = systems[1], systems[4]
+            assert isinstance(training, TrainingSystem)
+            assert isinstance(market, MarketSystem)
+            self._training = training
+            self._market = market
+
+    def steady_ticks(
+        self,
+        state: GameState,
+        *,
+        assets: AssetBundle,
+        product_ids: tuple[str, ...],
+        limit: int,
+    ) -> int:
+        """Return how many ticks after ``state`` can be fast-forwarded.
+
+        Returns ``0`` unless at least :data:`MIN_STRETCH` ticks are steady.
+        """
+
+        training = self._training
+        if training is None or limit < MIN_STRETCH or self._pipeline.hooks:
+            return 0
+        _, _, training_bonus = aggregate_research_bonuses(state.research, assets)
+        if not training.scheduler.tracks(state.team, state.tick, training_bonus):
+            return 0
+        for product in state.products:
+            market = assets.markets[assets.products[product.product_id].target_market]
+            if product.adoption != market.tam:
+                return 0
+        if not fully_staffed(state.team, assets, product_ids):
+            return 0
+        stable = training.scheduler.stable_until()
+        if stable is not None:
+            limit = min(limit, stable - state.tick - 1)
+        limit = min(limit, self._research_horizon(state, assets, limit))
+        return limit if limit >= MIN_STRETCH else 0
+
+    def advance(
+        self,
+        state: GameState,
+        ticks: int,
+        *,
+        assets: AssetBundle,
+        rng: RandomSource,
+        achievement_tracker: AchievementTracker,
+        operating_costs: float,
+        stop: Callable[[GameState], bool] | None = None,
+    ) -> list[SteadyTick]:
+        """Return the outcomes of the next ``ticks`` ticks after ``state``.
+
+        ``ticks`` must not exceed :meth:`steady_ticks`; the pipeline's
+        systems are left as if they had processed every returned tick.
+        ``stop`` is called with every end-of-tick state and ends the stretch
+        early once it returns ``True``.
+        """
+
+        training, market = self._training, self._market
+        assert training is not None and market is not None
+        first = state.tick + 1
+        tick_range = range(first, first + ticks)
+        quality_bonus, _, _ = aggregate_research_bonuses(state.research, assets)
+        cache = market.quality_cache(assets, state.products)
+        products: dict[float, tuple[ProductState, ...]] = {}
+        revenue = 0.0
+        for product in state.products:
+            revenue += product.adoption * product.price
+        salary_cost = sum(
+            member.daily_salary(assets.roles[member.role_id].salary)
+            for member in state.team.members
+        )
+        cash_delta = revenue - salary_cost - operating_costs
+        direction = 1 if cash_delta >= 0 else -1
+        event_rolls = rng.namespaced_randoms(f"events:{tick}" for tick in tick_range)
+        reputation_rolls = rng.namespaced_randoms(
+            f"reputation:{tick}" for tick in tick_range
+        )
+        research = state.research
+        research_points = compute_research_points(state.team)
+        advance_research = research.active is not None and research_points > 0
+        outcomes: list[SteadyTick] = []
+        for tick, event_roll, reputation_roll in zip(
+            tick_range, event_rolls, reputation_rolls
+        ):
+            event = pick_event(event_roll, assets)
+            effects = event.effects if event is not None else {}
+            penalty = effects.get("quality_penalty", 0.0)
+            penalised = products.get(penalty)
+            if penalised is None:
+                qualities = cache.qualities(state.team, quality_bonus, penalty)
+                penalised = products[penalty] = tuple(
+                    product.update_quality(quality)
+                    for product, quality in zip(state.products, qualities)
+                )
+            if advance_research:
+                research = progress_research(
+                    research, assets=assets, research_points=research_points
+                ).state
+            # apply_reputation_delta / apply_cash_delta, folded into one copy.
+            reputation = state.reputation
+            if event is not None and effects.get("reputation_bonus", 0.0):
+                reputation = _clamp_reputation(reputation + effects["reputation_bonus"])
+            jitter = (reputation_roll - 0.5) * 0.2
+            state = replace(
+                state,
+                tick=tick,
+                cash=max(0.0, state.cash + cash_delta),
+                reputation=_clamp_reputation(reputation + (direction * 0.5 + jitter)),
+                research=research,
+                products=penalised,
+            )
+            unlocked = achievement_tracker.evaluate(state)
+            if unlocked:
+                state = state.add_achievements(unlocked)
+            outcomes.append(SteadyTick(state=state, revenue=revenue, unlocked=unlocked))
+            if stop is not None and stop(state):
+                break
+        if outcomes:
+            # Leave the quality cache on the penalty of the last tick, as the
+            # market stage would have.
+            cache.qualities(state.team, quality_bonus, penalty)
+            training.scheduler.skip_to(state.tick)
+        return outcomes
+
+    def _research_horizon(
+        self, state: GameState, assets: AssetBundle, limit: int
+    ) -> int:
+        """Return how many ticks research keeps its bonuses unchanged."""
+
+        research = state.research
+        points = compute_research_points(state.team)
+        if points <= 0:
+            return limit
+        if research.active is None:
+            idle = progress_research(research, assets=assets, research_points=points)
+            return limit if idle.state is research else 0
+        node = assets.research.get(research.active)
+        if node is None:
+            return 0
+        delta = min(1.0, points / float(node.cost))
+        progress = research.progress
+        for steady in range(limit):
+            progress = max(0.0, min(1.0, progress + delta))
+            if progress >= 1.0:
+                return steady
+        return limit
+
+
+def _clamp_reputation(value: float) -> float:
+    return max(0.0, min(100.0, value))
+
+
+__all__ = ["MIN_STRETCH", "FastForward", "SteadyTick"]
@@ -0,0 +1,353 @@
+"""Coarse weekly or monthly macro-ticks for quick what-if previews."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, replace
+from typing import Iterator, Literal
+
+from ki_dev_tycoon.achievements import AchievementSnapshot, AchievementTracker
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.core.state import GameState, ProductState, ResearchState, TeamState
+from ki_dev_tycoon.data.loader import AssetBundle
+from ki_dev_tycoon.pipeline.systems import (
+    aggregate_research_bonuses,
+    compute_research_points,
+    fully_staffed,
+)
+from ki_dev_tycoon.products.kernel import ProductKernel
+from ki_dev_tycoon.research import progress_research
+from ki_dev_tycoon.team.hiring import ensure_minimum_staff
+from ki_dev_tycoon.team.training import train_team_for
+
+Resolution = Literal["daily", "weekly", "monthly"]
+
+RESOLUTIONS: dict[str, int] = {"daily": 1, "weekly": 7, "monthly": 30}
+
+
+def resolution_days(resolution: str) -> int:
+    """Return the number of days one tick covers at ``resolution``."""
+
+    try:
+        return RESOLUTIONS[resolution]
+    except KeyError:
+        msg = (
+            f"Unknown resolution '{resolution}', "
+            f"expected one of: {', '.join(RESOLUTIONS)}"
+        )
+        raise ValueError(msg) from None
+
+
+@dataclass(slots=True, frozen=True)
+class EventOutlook:
+    """Expected daily event effects, one ``(probability, ...)`` row per event."""
+
+    # (probability, demand_multiplier, quality_penalty) per outcome.
+    outcomes: tuple[tuple[float, float, float], ...]
+    reputation_bonus: float
+
+    @classmethod
+    def from_assets(cls, assets: AssetBundle) -> "EventOutlook":
+        total_weight = sum(event.weight for event in assets.events.values())
+        if total_weight <= 0:
+            return cls(outcomes=((1.0, 1.0, 0.0),), reputation_bonus=0.0)
+        outcomes = []
+        reputation_bonus = 0.0
+        for event in assets.events.values():
+            probability = event.weight / total_weight
+            effects = event.effects
+            outcomes.append(
+                (
+                    probability,
+                    effects.get("demand_multiplier", 1.0),
+                    effects.get("quality_penalty", 0.0),
+                )
+            )
+            reputation_bonus += probability * effects.get("reputation_bonus", 0.0)
+        return cls(outcomes=tuple(outcomes), reputation_bonus=reputation_bonus)
+
+    def quality(self, raw: float) -> tuple[float, float]:
+        """Return the expected quality and demand-weighted quality for ``raw``."""
+
+        quality = 0.0
+        weighted = 0.0
+        for probability, multiplier, penalty in self.outcomes:
+            penalised = max(0.0, raw - penalty) if penalty else raw
+            quality += probability * penalised
+            weighted += probability * penalised * multiplier
+        return quality, weighted
+
+
+@dataclass(slots=True, frozen=True)
+class MacroTick:
+    """Outcome of one macro-tick covering ``days`` daily ticks."""
+
+    state: GameState
+    days: int
+    revenue: float
+    unlocked: tuple[AchievementSnapshot, ...]
+
+
+class MacroEngine:
+    """Advance a game state by whole weeks or months at a time.
+
+    A macro-tick of ``days`` days keeps the exact parts of the daily pipeline
+    that are cheap to keep and replaces the random ones by their expectation:
+
+    * hiring draws from the same per-day streams until the team is staffed,
+      and training is advanced in closed form between hires
+      (:func:`~ki_dev_tycoon.team.train_team_for`), so the team matches the
+      daily engine while the research training bonus stays the same;
+    * research progresses once per day with the points of the trained team;
+    * events contribute their probability-weighted demand multiplier,
+      quality penalty and reputation bonus, and the demand noise averages out;
+    * every product grows by its expected daily growth from the reputation
+      at the start of the macro-tick; adoption and revenue follow the capped
+      arithmetic series in closed form;
+    * cash and reputation move by the summed daily deltas, the reputation
+      jitter is dropped, and achievements are evaluated once at the end.
+
+    Rivals and candidate pools are not modelled.
+    """
+
+    def __init__(
+        self,
+        assets: AssetBundle,
+        *,
+        operating_costs: float,
+        common_random_numbers: bool = False,
+    ) -> None:
+        self._assets = assets
+        self._operating_costs = operating_costs
+        self._common_random_numbers = common_random_numbers
+        self._events = EventOutlook.from_assets(assets)
+        self._kernel: ProductKernel | None = None
+
+    def run(
+        self,
+        state: GameState,
+        ticks: int,
+        *,
+        days: int,
+        rng: RandomSource,
+        achievement_tracker: AchievementTracker,
+    ) -> Iterator[MacroTick]:
+        """Yield macro-ticks of ``days`` days until ``ticks`` days are covered.
+
+        The last macro-tick is shortened so that exactly ``ticks`` days pass.
+        """
+
+        remaining = ticks
+        while remaining > 0:
+            outcome = self.step(
+                state,
+                min(days, remaining),
+                rng=rng,
+                achievement_tracker=achievement_tracker,
+            )
+            yield outcome
+            state = outcome.state
+            remaining -= outcome.days
+
+    def step(
+        self,
+        state: GameState,
+        days: int,
+        *,
+        rng: RandomSource,
+        achievement_tracker: AchievementTracker,
+    ) -> MacroTick:
+        """Return the state ``days`` days after ``state``."""
+
+        if days <= 0:
+            msg = "A macro-tick must cover at least one day"
+            raise ValueError(msg)
+        assets = self._assets
+        product_ids = tuple(product.product_id for product in state.products)
+        first = state.tick + 1
+        end = state.tick + days
+
+        _, _, training_bonus = aggregate_research_bonuses(state.research, assets)
+        team = state.team
+        trained_through = state.tick
+        for tick in range(first, end + 1):
+            if fully_staffed(team, assets, product_ids):
+                break
+            hired = ensure_minimum_staff(
+                team,
+                assets=assets,
+                rng=rng.namespaced(f"hiring:{tick}"),
+                product_ids=product_ids,
+                keyed=self._common_random_numbers,
+            ).team
+            if hired is not team:
+                team = _train(team, assets, training_bonus, tick - 1 - trained_through)
+                team = TeamState(
+                    members=team.members + hired.members[len(team.members) :]
+                )
+                trained_through = tick - 1
+        team = _train(team, assets, training_bonus, end - trained_through)
+
+        # Research bonuses are constant between completions: split the
+        # macro-tick into spans of (days, research state in effect).
+        research = state.research
+        points = compute_research_points(team)
+        spans: list[tuple[int, ResearchState]] = []
+        span_start = 0
+        for day in range(days):
+            result = progress_research(research, assets=assets, research_points=points)
+            if result.completed and day > span_start:
+                spans.append((day - span_start, research))
+                span_start = day
+            if result.state is research and research.active is None:
+                break
+            research = result.state
+        spans.append((days - span_start, research))
+
+        kernel = self._kernel
+        if kernel is None or not kernel.matches(assets, state.products):
+            kernel = self._kernel = ProductKernel.build(assets, product_ids)
+        salary_cost = sum(
+            member.daily_salary(assets.roles[member.role_id].salary)
+            for member in team.members
+        )
+        products = state.products
+        cash = state.cash
+        reputation = state.reputation
+        revenue = 0.0
+        for span_days, span_research in spans:
+            costs = span_days * (salary_cost + self._operating_costs)
+            products, span_revenue, reputation = self._span(
+                kernel,
+                team,
+                products,
+                span_research,
+                reputation=reputation,
+                costs=costs,
+                days=span_days,
+            )
+            cash = max(0.0, cash + span_revenue - costs)
+            revenue += span_revenue
+        state = replace(
+            state,
+            tick=end,
+            cash=cash,
+            reputation=reputation,
+            team=team,
+            products=products,
+            research=research,
+        )
+        unlocked = achievement_tracker.evaluate(state)
+        if unlocked:
+            state = state.add_achievements(unlocked)
+        return MacroTick(
+            state=state, days=days, revenue=revenue / days, unlocked=unlocked
+        )
+
+    def _span(
+        self,
+        kernel: ProductKernel,
+        team: TeamState,
+        products: tuple[ProductState, ...],
+        research: ResearchState,
+        *,
+        reputation: float,
+        costs: float,
+        days: int,
+    ) -> tuple[tuple[ProductState, ...], float, float]:
+        """Return products, revenue and reputation after ``days`` steady days."""
+
+        quality_bonus, demand_bonus, _ = aggregate_research_bonuses(
+            research, self._assets
+        )
+        # (product, expected quality, growth per day at reputation factor 1).
+        outlook = []
+        for index, (product, raw) in enumerate(
+            zip(products, kernel.quality(team, quality_bonus))
+        ):
+            market = kernel.market_index[index]
+            quality, weighted_quality = self._events.quality(raw)
+            outlook.append(
+                (
+                    product,
+                    quality,
+                    kernel.market_tam[market]
+                    * (kernel.market_demand[market] + demand_bonus)
+                    * max(0.1, 1.0 - product.price / kernel.market_price_scale[market])
+                    * weighted_quality,
+                )
+            )
+        grown, revenue = _grow(kernel, outlook, 0.5 + reputation / 100, days)
+        end = self._reputation(reputation, revenue - costs, days)
+        # Growth follows the reputation drift; re-evaluate at the span mean.
+        grown, revenue = _grow(kernel, outlook, 0.5 + (reputation + end) / 200, days)
+        return grown, revenue, self._reputation(reputation, revenue - costs, days)
+
+    def _reputation(self, reputation: float, cash_delta: float, days: int) -> float:
+        direction = 1 if cash_delta >= 0 else -1
+        reputation += days * (self._events.reputation_bonus + direction * 0.5)
+        return max(0.0, min(100.0, reputation))
+
+
+def _grow(
+    kernel: ProductKernel,
+    outlook: list[tuple[ProductState, float, float]],
+    reputation_factor: float,
+    days: int,
+) -> tuple[tuple[ProductState, ...], float]:
+    """Return the products after ``days`` days of growth and their revenue."""
+
+    products = []
+    revenue = 0.0
+    for index, (product, quality, growth) in enumerate(outlook):
+        tam = kernel.market_tam[kernel.market_index[index]]
+        adoption, adopted_days = _adoption_series(
+            min(product.adoption, tam), max(0.0, growth * reputation_factor), tam, days
+        )
+        revenue += adopted_days * product.price
+        products.append(
+            ProductState(
+                product_id=product.product_id,
+                quality=quality,
+                adoption=adoption,
+                price=product.price,
+            )
+        )
+    return tuple(products), revenue
+
+
+def _train(
+    team: TeamState, assets: AssetBundle, training_bonus: float, days: int
+) -> TeamState:
+    if days <= 0:
+        return team
+    return train_team_for(
+        team, assets=assets, training_bonus=training_bonus, days=days
+    ).team
+
+
+def _adoption_series(
+    adoption: int, growth: float, tam: int, days: int
+) -> tuple[int, float]:
+    """Return the final adoption and the adoption summed over ``days`` days.
+
+    Adoption grows by ``growth`` per day until it reaches ``tam``.
+    """
+
+    if growth <= 0 or adoption >= tam:
+        return adoption, float(adoption * days)
+    # Days on which adoption is still below the TAM.
+    rising = min(days, max(0, math.ceil((tam - adoption) / growth) - 1))
+    summed = rising * adoption + growth * rising * (rising + 1) / 2
+    summed += (days - rising) * tam
+    return min(tam, adoption + int(days * growth)), summed
+
+
+__all__ = [
+    "RESOLUTIONS",
+    "EventOutlook",
+    "MacroEngine",
+    "MacroTick",
+    "Resolution",
+    "resolution_days",
+]
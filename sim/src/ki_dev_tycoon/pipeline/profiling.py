@@ -0,0 +1,135 @@
+"""Opt-in timing of the individual tick pipeline stages."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Literal
+
+TraceFormat = Literal["chrome", "speedscope"]
+TRACE_FORMATS: tuple[TraceFormat, ...] = ("chrome", "speedscope")
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+class StageProfiler:
+    """Accumulate ``perf_counter_ns`` durations per pipeline stage.
+
+    Totals and call counts are always kept. With ``trace=True`` every span is
+    stored as well so that it can be exported as a Chrome trace or speedscope
+    profile; leave it off for long runs where only the breakdown matters.
+    """
+
+    def __init__(self, *, trace: bool = False) -> None:
+        self._totals: dict[str, int] = {}
+        self._calls: dict[str, int] = {}
+        self._spans: list[tuple[str, int, int, int]] | None = [] if trace else None
+
+    @property
+    def tracing(self) -> bool:
+        return self._spans is not None
+
+    def record(self, stage: str, tick: int, start_ns: int, end_ns: int) -> None:
+        """Add the span ``[start_ns, end_ns)`` of ``stage`` during ``tick``."""
+
+        self._totals[stage] = self._totals.get(stage, 0) + (end_ns - start_ns)
+        self._calls[stage] = self._calls.get(stage, 0) + 1
+        if self._spans is not None:
+            self._spans.append((stage, tick, start_ns, end_ns))
+
+    def breakdown(self) -> dict[str, dict[str, float]]:
+        """Return calls, total milliseconds and mean microseconds per stage.
+
+        ``share`` relates each stage to the accumulated ``tick`` time when the
+        caller recorded whole ticks.
+        """
+
+        tick_total = self._totals.get("tick", 0)
+        breakdown: dict[str, dict[str, float]] = {}
+        for stage, total in self._totals.items():
+            calls = self._calls[stage]
+            breakdown[stage] = {
+                "calls": float(calls),
+                "total_ms": round(total / 1_000_000, 4),
+                "mean_us": round(total / calls / 1_000, 3),
+                "share": round(total / tick_total, 4) if tick_total else 0.0,
+            }
+        return breakdown
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Return the recorded spans in the Chrome ``about:tracing`` format."""
+
+        spans = self._require_spans()
+        origin = min((span[2] for span in spans), default=0)
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "name": stage,
+                    "cat": "tick",
+                    "ph": "X",
+                    "ts": (start - origin) / 1_000,
+                    "dur": (end - start) / 1_000,
+                    "pid": 1,
+                    "tid": 1,
+                    "args": {"tick": tick},
+                }
+                for stage, tick, start, end in spans
+            ],
+        }
+
+    def speedscope(self, name: str = "ki-sim") -> dict[str, Any]:
+        """Return the recorded spans as an evented speedscope profile."""
+
+        spans = sorted(self._require_spans(), key=lambda span: (span[2], -span[3]))
+        origin = spans[0][2] if spans else 0
+        frames: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+        open_spans: list[tuple[int, int]] = []
+        for stage, _, start, end in spans:
+            while open_spans and open_spans[-1][1] <= start:
+                frame, closed_at = open_spans.pop()
+                events.append({"type": "C", "frame": frame, "at": closed_at - origin})
+            frame = frames.setdefault(stage, len(frames))
+            events.append({"type": "O", "frame": frame, "at": start - origin})
+            open_spans.append((frame, end))
+        while open_spans:
+            frame, closed_at = open_spans.pop()
+            events.append({"type": "C", "frame": frame, "at": closed_at - origin})
+        end_value = events[-1]["at"] if events else 0
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "shared": {"frames": [{"name": stage} for stage in frames]},
+            "profiles": [
+                {
+                    "type": "evented",
+                    "name": name,
+                    "unit": "nanoseconds",
+                    "startValue": 0,
+                    "endValue": end_value,
+                    "events": events,
+                }
+            ],
+            "name": name,
+            "exporter": "ki-dev-tycoon",
+        }
+
+    def write_trace(self, path: Path, *, format: TraceFormat = "chrome") -> Path:
+        """Write the recorded spans to ``path`` in the requested ``format``."""
+
+        if format not in TRACE_FORMATS:
+            msg = f"Unknown trace format '{format}'"
+            raise ValueError(msg)
+        payload = self.chrome_trace() if format == "chrome" else self.speedscope()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        return path
+
+    def _require_spans(self) -> list[tuple[str, int, int, int]]:
+        if self._spans is None:
+            msg = "StageProfiler was created without trace=True"
+            raise RuntimeError(msg)
+        return self._spans
+
+
+__all__ = ["TRACE_FORMATS", "StageProfiler", "TraceFormat"]
@@ -0,0 +1,156 @@
+"""Execution of the ordered tick systems."""
+
+from __future__ import annotations
+
+from time import perf_counter_ns
+from typing import Callable, Iterable, Sequence
+
+from ki_dev_tycoon.achievements import AchievementTracker
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.core.state import GameState
+from ki_dev_tycoon.data.loader import AssetBundle
+from ki_dev_tycoon.economy.competition import CompetitionState
+from ki_dev_tycoon.pipeline.context import TickContext
+from ki_dev_tycoon.pipeline.profiling import StageProfiler
+from ki_dev_tycoon.pipeline.systems import (
+    DeferredSystem,
+    TickSystem,
+    aggregate_research_bonuses,
+    default_systems,
+)
+from ki_dev_tycoon.team.labor_market import LaborMarket
+
+TickHook = Callable[[TickContext], None]
+
+
+class TickPipeline:
+    """Run an ordered list of systems and notify hooks after every tick."""
+
+    def __init__(
+        self,
+        systems: Sequence[TickSystem] | None = None,
+        *,
+        hooks: Iterable[TickHook] = (),
+    ) -> None:
+        self._systems: tuple[TickSystem, ...] = tuple(
+            systems if systems is not None else default_systems()
+        )
+        names = [system.name for system in self._systems]
+        if len(set(names)) != len(names):
+            msg = f"Tick system names must be unique: {names}"
+            raise ValueError(msg)
+        self._deferred: tuple[DeferredSystem, ...] = tuple(
+            system for system in self._systems if isinstance(system, DeferredSystem)
+        )
+        self._hooks: list[TickHook] = list(hooks)
+        self._bonuses: (
+            tuple[frozenset[str], AssetBundle, tuple[float, float, float]] | None
+        ) = None
+
+    @property
+    def systems(self) -> tuple[TickSystem, ...]:
+        """Return the systems in execution order."""
+
+        return self._systems
+
+    @property
+    def hooks(self) -> tuple[TickHook, ...]:
+        """Return the registered hooks in notification order."""
+
+        return tuple(self._hooks)
+
+    def add_hook(self, hook: TickHook) -> None:
+        """Register ``hook`` to observe every completed tick context."""
+
+        if hook not in self._hooks:
+            self._hooks.append(hook)
+
+    def remove_hook(self, hook: TickHook) -> None:
+        """Unregister ``hook`` if present."""
+
+        try:
+            self._hooks.remove(hook)
+        except ValueError:  # hook not registered
+            return
+
+    def materialise(self, state: GameState) -> GameState:
+        """Return the end-of-tick ``state`` with all deferred updates applied.
+
+        Systems such as :class:`TrainingSystem` only touch entities when
+        something noteworthy happens; every state handed to hooks or returned
+        to callers passes through here first.
+        """
+
+        for system in self._deferred:
+            state = system.materialise(state)
+        return state
+
+    def run(
+        self,
+        state: GameState,
+        *,
+        assets: AssetBundle,
+        rng: RandomSource,
+        achievement_tracker: AchievementTracker,
+        operating_costs: float,
+        product_ids: tuple[str, ...],
+        profiler: StageProfiler | None = None,
+        competition: CompetitionState | None = None,
+        labor_market: LaborMarket | None = None,
+    ) -> TickContext:
+        """Process one tick starting from ``state`` and return its context.
+
+        With a ``profiler`` every system (and the hook fan-out) is timed as a
+        stage named after the system. ``competition`` and ``labor_market``
+        carry the rival studios and candidate pools into the tick; their
+        updated snapshots are left on the context. ``context.state`` is
+        materialised for hooks; without hooks it may hold deferred values, so
+        observe it through :meth:`materialise`.
+        """
+
+        bonuses = self._bonuses
+        if (
+            bonuses is None
+            or bonuses[0] is not state.research.unlocked
+            or bonuses[1] is not assets
+        ):
+            bonuses = self._bonuses = (
+                state.research.unlocked,
+                assets,
+                aggregate_research_bonuses(state.research, assets),
+            )
+        quality_bonus, demand_bonus, training_bonus = bonuses[2]
+        context = TickContext(
+            state=state,
+            assets=assets,
+            rng=rng,
+            achievement_tracker=achievement_tracker,
+            operating_costs=operating_costs,
+            product_ids=product_ids,
+            quality_bonus=quality_bonus,
+            demand_bonus=demand_bonus,
+            training_bonus=training_bonus,
+            profiler=profiler,
+            competition=competition,
+            labor_market=labor_market,
+        )
+        if profiler is None:
+            for system in self._systems:
+                system.process(context)
+            if self._hooks:
+                context.state = self.materialise(context.state)
+                for hook in list(self._hooks):
+                    hook(context)
+            return context
+        tick = state.tick
+        for system in self._systems:
+            started = perf_counter_ns()
+            system.process(context)
+            profiler.record(system.name, tick, started, perf_counter_ns())
+        if self._hooks:
+            started = perf_counter_ns()
+            context.state = self.materialise(context.state)
+            for hook in list(self._hooks):
+                hook(context)
+            profiler.record("hooks", tick, started, perf_counter_ns())
+        return context
@@ -0,0 +1,150 @@
+"""Stop conditions that end a simulation run once its outcome is decided."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Protocol, Sequence
+
+from ki_dev_tycoon.core.state import GameState
+from ki_dev_tycoon.data.loader import AssetBundle
+
+
+class StopCondition(Protocol):
+    """Predicate that stops a run after holding for ``patience`` ticks in a row.
+
+    :meth:`holds` sees the end-of-tick state, before deferred training
+    progress is filled in, and runs once per tick, so it should stay cheap.
+    """
+
+    @property
+    def name(self) -> str:
+        """Identifier reported in :class:`StopReason`."""
+
+    @property
+    def patience(self) -> int:
+        """Consecutive ticks the condition must hold before the run stops."""
+
+    def holds(self, state: GameState, assets: AssetBundle) -> bool:
+        """Return whether the condition is met by ``state``."""
+
+
+@dataclass(slots=True, frozen=True)
+class Bankruptcy:
+    """Cash has been pinned at zero for ``patience`` ticks."""
+
+    patience: int = 30
+    name: str = "bankruptcy"
+
+    def holds(self, state: GameState, assets: AssetBundle) -> bool:
+        return state.cash <= 0.0
+
+
+@dataclass(slots=True, frozen=True)
+class TargetReached:
+    """Every given cash, reputation and total adoption target is met."""
+
+    cash: float | None = None
+    reputation: float | None = None
+    adoption: int | None = None
+    patience: int = 1
+    name: str = "target_reached"
+
+    def __post_init__(self) -> None:
+        if self.cash is None and self.reputation is None and self.adoption is None:
+            msg = "TargetReached needs at least one of cash, reputation or adoption"
+            raise ValueError(msg)
+
+    def holds(self, state: GameState, assets: AssetBundle) -> bool:
+        if self.cash is not None and state.cash < self.cash:
+            return False
+        if self.reputation is not None and state.reputation < self.reputation:
+            return False
+        if self.adoption is not None:
+            adoption = sum(product.adoption for product in state.products)
+            if adoption < self.adoption:
+                return False
+        return True
+
+
+@dataclass(slots=True, frozen=True)
+class Stagnation:
+    """All research is unlocked and every product has saturated its market.
+
+    From then on a tick only moves cash and reputation along a fixed trend.
+    """
+
+    patience: int = 100
+    name: str = "stagnation"
+
+    def holds(self, state: GameState, assets: AssetBundle) -> bool:
+        research = state.research
+        if research.active is not None:
+            return False
+        for product in state.products:
+            market = assets.markets[assets.products[product.product_id].target_market]
+            if product.adoption < market.tam:
+                return False
+        return all(node_id in research.unlocked for node_id in assets.research)
+
+
+@dataclass(slots=True, frozen=True)
+class StopReason:
+    """Condition that ended a run and the tick it fired on."""
+
+    condition: str
+    tick: int
+
+    def to_dict(self) -> dict[str, str | int]:
+        return {"condition": self.condition, "tick": self.tick}
+
+
+class StopMonitor:
+    """Track how long each condition has held and report the first to fire."""
+
+    def __init__(self, conditions: Sequence[StopCondition]) -> None:
+        for condition in conditions:
+            if condition.patience <= 0:
+                msg = f"Stop condition '{condition.name}' needs a positive patience"
+                raise ValueError(msg)
+        self._conditions = tuple(conditions)
+        self._streaks = [0] * len(self._conditions)
+        self._reason: StopReason | None = None
+
+    def __bool__(self) -> bool:
+        return bool(self._conditions)
+
+    @property
+    def reason(self) -> StopReason | None:
+        return self._reason
+
+    def check(
+        self, state: GameState, assets: AssetBundle, *, ticks: int = 1
+    ) -> StopReason | None:
+        """Record ``state`` and return the stop reason once a condition fires.
+
+        ``ticks`` is the number of ticks ``state`` advanced by, e.g. the days
+        of a macro-tick, and counts towards every condition's patience.
+        """
+
+        if self._reason is not None:
+            return self._reason
+        streaks = self._streaks
+        for index, condition in enumerate(self._conditions):
+            if not condition.holds(state, assets):
+                streaks[index] = 0
+                continue
+            streaks[index] += ticks
+            if streaks[index] >= condition.patience:
+                self._reason = StopReason(condition=condition.name, tick=state.tick)
+                return self._reason
+        return None
+
+
+__all__ = [
+    "Bankruptcy",
+    "Stagnation",
+    "StopCondition",
+    "StopMonitor",
+    "StopReason",
+    "TargetReached",
+]
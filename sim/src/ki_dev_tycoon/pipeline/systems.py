@@ -0,0 +1,460 @@
+"""Built-in tick systems executed in order by :class:`TickPipeline`."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from time import perf_counter_ns
+from typing import Protocol, Sequence, runtime_checkable
+
+from ki_dev_tycoon.config.schemas import EventConfig
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.core.state import (
+    GameState,
+    ProductState,
+    ResearchState,
+    TeamState,
+)
+from ki_dev_tycoon.data.loader import AssetBundle
+from ki_dev_tycoon.economy import step_competition
+from ki_dev_tycoon.pipeline.context import TickContext
+from ki_dev_tycoon.products import ProductKernel, QualityCache
+from ki_dev_tycoon.research import progress_research
+from ki_dev_tycoon.team import (
+    TrainingScheduler,
+    ensure_minimum_staff,
+    hire_from_pool,
+    refresh_labor_market,
+    staffing_requirements,
+)
+
+
+class TickSystem(Protocol):
+    """Single stage of the tick pipeline."""
+
+    name: str
+
+    def process(self, context: TickContext) -> None:
+        """Apply the system to ``context`` in place."""
+
+
+@runtime_checkable
+class DeferredSystem(TickSystem, Protocol):
+    """Tick system that defers per-entity updates until the state is observed.
+
+    ``materialise`` returns ``state`` -- the outcome of the system's last
+    processed tick -- with the deferred values filled in.
+    """
+
+    def materialise(self, state: GameState) -> GameState:
+        """Return ``state`` with the system's deferred updates applied."""
+
+
+def aggregate_research_bonuses(
+    state: ResearchState, assets: AssetBundle
+) -> tuple[float, float, float]:
+    """Return the summed quality, demand and training bonuses of unlocked nodes."""
+
+    quality_bonus = 0.0
+    demand_bonus = 0.0
+    training_bonus = 0.0
+    for node_id in state.unlocked:
+        node = assets.research.get(node_id)
+        if node is None:
+            continue
+        unlocks = node.unlocks
+        quality_bonus += unlocks.quality_bonus or 0.0
+        demand_bonus += unlocks.demand_bonus or 0.0
+        training_bonus += unlocks.training_bonus or 0.0
+    return quality_bonus, demand_bonus, training_bonus
+
+
+def compute_research_points(team: TeamState) -> float:
+    """Return the research points generated by ``team`` in one tick."""
+
+    points = 0.0
+    for member in team.members:
+        if member.role_id == "data_scientist":
+            points += member.skill * 2.0
+        elif member.role_id == "engineer":
+            points += member.skill * 0.75
+        else:
+            points += member.skill * 0.25
+    return points
+
+
+def sample_event(rng: RandomSource, assets: AssetBundle) -> EventConfig | None:
+    """Draw a weighted random event or ``None`` if no event applies."""
+
+    if sum(event.weight for event in assets.events.values()) <= 0:
+        return None
+    return pick_event(rng.random(), assets)
+
+
+def pick_event(roll: float, assets: AssetBundle) -> EventConfig | None:
+    """Return the event selected by a uniform ``roll`` in ``[0, 1)``."""
+
+    total_weight = sum(event.weight for event in assets.events.values())
+    if total_weight <= 0:
+        return None
+    roll *= total_weight
+    accumulator = 0.0
+    for event in assets.events.values():
+        accumulator += event.weight
+        if roll <= accumulator:
+            return event
+    return None
+
+
+class HiringSystem:
+    """Fill open positions required by the product portfolio.
+
+    With a labor market on the context, hires come from its candidate pools,
+    which are topped up whenever their refresh interval has elapsed. Once a
+    team is fully staffed, hiring is skipped until the team, the portfolio or
+    a pool refresh could open a position again.
+    """
+
+    name = "hiring"
+
+    def __init__(self, *, common_random_numbers: bool = False) -> None:
+        self._common_random_numbers = common_random_numbers
+        self._staffed: tuple[TeamState, AssetBundle, tuple[str, ...]] | None = None
+
+    def process(self, context: TickContext) -> None:
+        market = context.labor_market
+        team = context.state.team
+        staffed = self._staffed
+        if (
+            staffed is not None
+            and staffed[0] is team
+            and staffed[1] is context.assets
+            and staffed[2] == context.product_ids
+            and (market is None or not market.refresh_due(context.tick))
+        ):
+            context.hired = ()
+            if market is not None:
+                context.open_positions = {}
+            return
+        self._staffed = None
+        if market is not None:
+            if market.refresh_due(context.tick):
+                market = refresh_labor_market(
+                    market,
+                    assets=context.assets,
+                    rng=context.rng.namespaced("labor"),
+                    tick=context.tick,
+                )
+            pooled = hire_from_pool(
+                team,
+                market=market,
+                assets=context.assets,
+                rng=context.stream("hiring"),
+                product_ids=context.product_ids,
+                keyed=self._common_random_numbers,
+            )
+            context.state = context.state.update_team(pooled.hiring.team)
+            context.hired = pooled.hiring.hired
+            context.labor_market = pooled.market
+            context.open_positions = pooled.deficits
+        else:
+            result = ensure_minimum_staff(
+                team,
+                assets=context.assets,
+                rng=context.stream("hiring"),
+                product_ids=context.product_ids,
+                keyed=self._common_random_numbers,
+            )
+            context.state = context.state.update_team(result.team)
+            context.hired = result.hired
+        team = context.state.team
+        if fully_staffed(team, context.assets, context.product_ids):
+            self._staffed = (team, context.assets, context.product_ids)
+
+
+def fully_staffed(
+    team: TeamState, assets: AssetBundle, product_ids: tuple[str, ...]
+) -> bool:
+    """Return whether ``team`` covers the head count of every product role."""
+
+    counts: dict[str, int] = {}
+    for member in team.members:
+        counts[member.role_id] = counts.get(member.role_id, 0) + 1
+    return all(
+        counts.get(role_id, 0) >= required
+        for role_id, required in staffing_requirements(assets, product_ids).items()
+    )
+
+
+class TrainingSystem:
+    """Advance training progress using the research training bonus.
+
+    Skill-ups are scheduled as discrete events by a :class:`TrainingScheduler`,
+    so a tick only touches the members that level up. The systems after
+    training see stale ``training_progress`` values; :meth:`materialise`
+    fills them in before hooks and callers observe the state.
+    """
+
+    name = "training"
+
+    def __init__(self) -> None:
+        self._scheduler = TrainingScheduler()
+
+    @property
+    def scheduler(self) -> TrainingScheduler:
+        return self._scheduler
+
+    def process(self, context: TickContext) -> None:
+        team = self._scheduler.advance(
+            context.state.team,
+            assets=context.assets,
+            training_bonus=context.training_bonus,
+            tick=context.tick,
+        )
+        if team is not context.state.team:
+            context.state = context.state.update_team(team)
+
+    def materialise(self, state: GameState) -> GameState:
+        team = self._scheduler.materialise(state.team, state.tick)
+        return state if team is state.team else state.update_team(team)
+
+
+class ResearchSystem:
+    """Convert team skill into research progress and refresh bonuses.
+
+    Research points are cached per team object, and once no node can be
+    researched any more the system stops re-scanning the tree every tick.
+    """
+
+    name = "research"
+
+    def __init__(self) -> None:
+        self._points: tuple[TeamState, float] | None = None
+        self._exhausted: tuple[ResearchState, AssetBundle] | None = None
+
+    def process(self, context: TickContext) -> None:
+        state = context.state
+        exhausted = self._exhausted
+        if (
+            exhausted is not None
+            and exhausted[0] is state.research
+            and exhausted[1] is context.assets
+        ):
+            context.completed_research = ()
+            return
+        cached = self._points
+        if cached is None or cached[0] is not state.team:
+            cached = self._points = (state.team, compute_research_points(state.team))
+        research_points = cached[1]
+        result = progress_research(
+            state.research,
+            assets=context.assets,
+            research_points=research_points,
+        )
+        if (
+            research_points > 0
+            and result.state is state.research
+            and state.research.active is None
+        ):
+            # Nothing left to select: progress cannot change until the
+            # research state itself is replaced.
+            self._exhausted = (state.research, context.assets)
+        context.state = state.update_research(result.state)
+        context.completed_research = result.completed
+        if result.completed:
+            (
+                context.quality_bonus,
+                context.demand_bonus,
+                context.training_bonus,
+            ) = aggregate_research_bonuses(context.state.research, context.assets)
+
+
+class EventSystem:
+    """Sample the random event of the tick and apply its direct effects."""
+
+    name = "events"
+
+    def process(self, context: TickContext) -> None:
+        event = sample_event(context.stream("events"), context.assets)
+        context.event = event
+        effects = event.effects if event is not None else {}
+        context.demand_multiplier = effects.get("demand_multiplier", 1.0)
+        context.quality_penalty = effects.get("quality_penalty", 0.0)
+        reputation_bonus = effects.get("reputation_bonus", 0.0)
+        if reputation_bonus:
+            context.state = context.state.apply_reputation_delta(reputation_bonus)
+
+
+class MarketSystem:
+    """Update product quality and adoption and accumulate revenue.
+
+    The whole portfolio is evaluated in one pass by a :class:`ProductKernel`,
+    which is built on first use and rebuilt only when assets or products
+    change. Qualities come from a :class:`QualityCache`, so only products
+    whose inputs changed since the previous tick are re-evaluated.
+    """
+
+    name = "market"
+
+    def __init__(self) -> None:
+        self._quality_cache: QualityCache | None = None
+
+    def quality_cache(
+        self, assets: AssetBundle, products: Sequence[ProductState]
+    ) -> QualityCache:
+        """Return the quality cache for ``products``, rebuilding it if needed."""
+
+        cache = self._quality_cache
+        if cache is None or not cache.kernel.matches(assets, products):
+            kernel = ProductKernel.build(
+                assets, [product.product_id for product in products]
+            )
+            cache = self._quality_cache = QualityCache(kernel)
+        return cache
+
+    def process(self, context: TickContext) -> None:
+        state = context.state
+        profiler = context.profiler
+        started = perf_counter_ns() if profiler is not None else 0
+        cache = self.quality_cache(context.assets, state.products)
+        kernel = cache.kernel
+        qualities = cache.qualities(
+            state.team, context.quality_bonus, context.quality_penalty
+        )
+        products = [
+            product.update_quality(quality)
+            for product, quality in zip(state.products, qualities)
+        ]
+        if profiler is not None:
+            measured = perf_counter_ns()
+            profiler.record("market.quality", state.tick, started, measured)
+            started = measured
+        adoption = kernel.adoption(
+            products,
+            reputation=state.reputation,
+            rng=context.stream("demand"),
+            tick=state.tick,
+            demand_bonus=context.demand_bonus,
+            demand_multiplier=context.demand_multiplier,
+        )
+        products = [
+            product.update_adoption(value) for product, value in zip(products, adoption)
+        ]
+        if profiler is not None:
+            profiler.record("market.adoption", state.tick, started, perf_counter_ns())
+        context.state = replace(state, products=tuple(products))
+        total_revenue = 0.0
+        for product in products:
+            total_revenue += product.adoption * product.price
+        context.revenue = total_revenue
+
+
+class CompetitionSystem:
+    """Split saturated markets between the studio and its rival studios.
+
+    Runs after :class:`MarketSystem` and is a no-op without rivals on the
+    context; otherwise product adoption and revenue are replaced by the
+    competitive outcome.
+    """
+
+    name = "competition"
+
+    def process(self, context: TickContext) -> None:
+        competition = context.competition
+        if competition is None:
+            return
+        state = context.state
+        assets = context.assets
+        offers: dict[str, list[tuple[str, float, float, int]]] = {}
+        for product in state.products:
+            market_id = assets.products[product.product_id].target_market
+            offers.setdefault(market_id, []).append(
+                (product.product_id, product.quality, product.price, product.adoption)
+            )
+        result = step_competition(
+            competition,
+            assets=assets,
+            rng=context.rng.namespaced("competition"),
+            tick=state.tick,
+            player_offers=offers,
+            player_reputation=state.reputation,
+            demand_multiplier=context.demand_multiplier,
+        )
+        products = tuple(
+            product.update_adoption(
+                result.player_adoption.get(product.product_id, product.adoption)
+            )
+            for product in state.products
+        )
+        context.state = replace(state, products=products)
+        context.revenue = sum(product.adoption * product.price for product in products)
+        context.competition = result.state
+        context.market_share = result.player_share
+
+
+class FinanceSystem:
+    """Book revenue against salaries and costs and drift the reputation."""
+
+    name = "finance"
+
+    def __init__(self) -> None:
+        self._salaries: tuple[TeamState, AssetBundle, float] | None = None
+
+    def process(self, context: TickContext) -> None:
+        state = context.state
+        cached = self._salaries
+        if (
+            cached is None
+            or cached[0] is not state.team
+            or cached[1] is not context.assets
+        ):
+            cached = self._salaries = (
+                state.team,
+                context.assets,
+                sum(
+                    member.daily_salary(context.assets.roles[member.role_id].salary)
+                    for member in state.team.members
+                ),
+            )
+        salary_cost = cached[2]
+        cash_delta = context.revenue - salary_cost - context.operating_costs
+        state = state.apply_cash_delta(cash_delta)
+        direction = 1 if cash_delta >= 0 else -1
+        jitter = (context.stream("reputation").random() - 0.5) * 0.2
+        context.state = state.apply_reputation_delta(direction * 0.5 + jitter)
+        context.cash_delta = cash_delta
+
+
+class AchievementSystem:
+    """Evaluate achievement conditions against the end-of-tick state."""
+
+    name = "achievements"
+
+    def process(self, context: TickContext) -> None:
+        unlocked = context.achievement_tracker.evaluate(context.state)
+        if unlocked:
+            context.state = context.state.add_achievements(unlocked)
+        context.unlocked = unlocked
+
+
+def default_systems(
+    *, competition: bool = False, common_random_numbers: bool = False
+) -> tuple[TickSystem, ...]:
+    """Return the built-in systems in their canonical execution order.
+
+    ``competition`` inserts :class:`CompetitionSystem` after the market stage.
+    ``common_random_numbers`` switches hiring to keyed rolls (see
+    :func:`~ki_dev_tycoon.team.ensure_minimum_staff`).
+    """
+
+    market: tuple[TickSystem, ...] = (MarketSystem(),)
+    if competition:
+        market += (CompetitionSystem(),)
+    return (
+        HiringSystem(common_random_numbers=common_random_numbers),
+        TrainingSystem(),
+        ResearchSystem(),
+        EventSystem(),
+        *market,
+        FinanceSystem(),
+        AchievementSystem(),
+    )
@@ -1,5 +1,6 @@
 """Product subsystem exports."""
 
+from ki_dev_tycoon.products.kernel import ProductKernel, QualityCache, role_averages
 from ki_dev_tycoon.products.quality import compute_quality
 
-__all__ = ["compute_quality"]
+__all__ = ["ProductKernel", "QualityCache", "compute_quality", "role_averages"]
@@ -0,0 +1,235 @@
+"""Batched quality and adoption updates for a whole product portfolio."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping, Sequence
+
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.core.state import ProductState, TeamState
+from ki_dev_tycoon.data.loader import AssetBundle
+
+
+def role_averages(team: TeamState) -> dict[str, float]:
+    """Return the average skill per role, summed in member order."""
+
+    totals: dict[str, float] = {}
+    counts: dict[str, int] = {}
+    for member in team.members:
+        totals[member.role_id] = totals.get(member.role_id, 0) + member.skill
+        counts[member.role_id] = counts.get(member.role_id, 0) + 1
+    return {role_id: totals[role_id] / counts[role_id] for role_id in totals}
+
+
+@dataclass(slots=True, frozen=True)
+class ProductKernel:
+    """Column-wise view of the portfolio for one-pass tick updates.
+
+    Asset lookups are resolved once when the kernel is built: every product
+    keeps its role terms and the index of its market, and market constants
+    live in per-market columns. :meth:`quality` and :meth:`adoption` then
+    evaluate all products with the same floating point operations, in the
+    same order, as :func:`~ki_dev_tycoon.products.compute_quality` and
+    :func:`~ki_dev_tycoon.economy.project_adoption`, so results are identical
+    to the scalar functions.
+    """
+
+    assets: AssetBundle
+    product_ids: tuple[str, ...]
+    base_quality: tuple[float, ...]
+    # (role_id, productivity, weight / role count) per required role.
+    role_terms: tuple[tuple[tuple[str, float, float], ...], ...]
+    market_index: tuple[int, ...]
+    market_tam: tuple[int, ...]
+    market_demand: tuple[float, ...]
+    market_price_scale: tuple[float, ...]
+
+    @classmethod
+    def build(cls, assets: AssetBundle, product_ids: Sequence[str]) -> "ProductKernel":
+        """Resolve the asset data of ``product_ids`` into kernel columns."""
+
+        market_ids: dict[str, int] = {}
+        role_terms = []
+        market_index = []
+        for product_id in product_ids:
+            config = assets.products[product_id]
+            share_base = max(1, len(config.required_roles))
+            role_terms.append(
+                tuple(
+                    (role_id, assets.roles[role_id].productivity, weight / share_base)
+                    for role_id, weight in config.required_roles.items()
+                )
+            )
+            market_index.append(
+                market_ids.setdefault(config.target_market, len(market_ids))
+            )
+        markets = [assets.markets[market_id] for market_id in market_ids]
+        return cls(
+            assets=assets,
+            product_ids=tuple(product_ids),
+            base_quality=tuple(
+                assets.products[product_id].base_quality for product_id in product_ids
+            ),
+            role_terms=tuple(role_terms),
+            market_index=tuple(market_index),
+            market_tam=tuple(market.tam for market in markets),
+            market_demand=tuple(market.base_demand for market in markets),
+            market_price_scale=tuple(
+                max(1.0, market.price_elasticity * 100) for market in markets
+            ),
+        )
+
+    def matches(self, assets: AssetBundle, products: Sequence[ProductState]) -> bool:
+        """Return whether the kernel was built for ``assets`` and ``products``."""
+
+        return (
+            self.assets is assets
+            and len(products) == len(self.product_ids)
+            and all(
+                product.product_id == product_id
+                for product, product_id in zip(products, self.product_ids)
+            )
+        )
+
+    def quality(self, team: TeamState, research_quality_bonus: float) -> list[float]:
+        """Return the clamped quality of every product for ``team``."""
+
+        averages = role_averages(team)
+        return [
+            self.quality_at(index, averages, research_quality_bonus)
+            for index in range(len(self.product_ids))
+        ]
+
+    def quality_at(
+        self, index: int, averages: Mapping[str, float], research_quality_bonus: float
+    ) -> float:
+        """Return the clamped quality of product ``index`` for given role averages."""
+
+        quality = self.base_quality[index] + research_quality_bonus
+        for role_id, productivity, share in self.role_terms[index]:
+            quality += averages.get(role_id, 0.0) * productivity * share
+        return max(0.0, min(1.0, quality))
+
+    def adoption(
+        self,
+        products: Sequence[ProductState],
+        *,
+        reputation: float,
+        rng: RandomSource,
+        tick: int,
+        demand_bonus: float,
+        demand_multiplier: float,
+    ) -> list[int]:
+        """Return the new adoption of every product.
+
+        ``rng`` is the tick's demand stream; each product draws the first
+        value of its ``<product_id>:<tick>`` child stream, in one batch.
+        """
+
+        rolls = rng.namespaced_randoms(
+            f"{product_id}:{tick}" for product_id in self.product_ids
+        )
+        reputation_factor = 0.5 + reputation / 100
+        tams = self.market_tam
+        demands = self.market_demand
+        price_scales = self.market_price_scale
+        adoption: list[int] = []
+        for product, index, roll in zip(products, self.market_index, rolls):
+            tam = tams[index]
+            price_factor = max(0.1, 1.0 - product.price / price_scales[index])
+            growth = int(
+                tam
+                * (demands[index] + demand_bonus)
+                * price_factor
+                * max(0.0, product.quality)
+                * reputation_factor
+                * demand_multiplier
+                * (1.0 + (roll - 0.5) * 0.05)
+            )
+            adoption.append(min(tam, product.adoption + max(0, growth)))
+        return adoption
+
+
+class QualityCache:
+    """Per-product qualities that are recomputed only when an input changed.
+
+    The cache remembers the inputs of the last evaluation: the team object,
+    the average skill of every role, the research quality bonus and the
+    event quality penalty. A new team only dirties the products that require
+    a role whose average actually moved; a new bonus dirties every product;
+    a new penalty is re-applied without recomputing the raw qualities.
+    ``recomputed`` reports how many products the last call re-evaluated.
+    """
+
+    def __init__(self, kernel: ProductKernel) -> None:
+        self.kernel = kernel
+        products_by_role: dict[str, list[int]] = {}
+        for index, terms in enumerate(kernel.role_terms):
+            for role_id, _, _ in terms:
+                products_by_role.setdefault(role_id, []).append(index)
+        self._products_by_role = {
+            role_id: tuple(indices) for role_id, indices in products_by_role.items()
+        }
+        self._team: TeamState | None = None
+        self._averages: dict[str, float] = {}
+        self._bonus: float | None = None
+        self._penalty = 0.0
+        self._raw: list[float] = []
+        self._qualities: list[float] = []
+        self.recomputed = 0
+
+    def qualities(
+        self, team: TeamState, research_quality_bonus: float, quality_penalty: float
+    ) -> list[float]:
+        """Return every product's quality after the event ``quality_penalty``.
+
+        The returned list is owned by the cache and must not be mutated.
+        """
+
+        self.recomputed = 0
+        kernel = self.kernel
+        if research_quality_bonus != self._bonus:
+            averages = role_averages(team)
+            self._raw = [
+                kernel.quality_at(index, averages, research_quality_bonus)
+                for index in range(len(kernel.product_ids))
+            ]
+            self.recomputed = len(self._raw)
+            dirty: set[int] | None = None
+        elif team is not self._team:
+            averages = role_averages(team)
+            previous = self._averages
+            dirty = set()
+            for role_id in previous.keys() | averages.keys():
+                if averages.get(role_id) != previous.get(role_id):
+                    dirty.update(self._products_by_role.get(role_id, ()))
+            for index in dirty:
+                self._raw[index] = kernel.quality_at(
+                    index, averages, research_quality_bonus
+                )
+            self.recomputed = len(dirty)
+        else:
+            averages = self._averages
+            dirty = set()
+        if dirty is None or quality_penalty != self._penalty:
+            self._qualities = _penalised(self._raw, quality_penalty)
+        else:
+            for index in dirty:
+                raw = self._raw[index]
+                self._qualities[index] = (
+                    max(0.0, raw - quality_penalty) if quality_penalty else raw
+                )
+        self._team = team
+        self._averages = averages
+        self._bonus = research_quality_bonus
+        self._penalty = quality_penalty
+        return self._qualities
+
+
+def _penalised(qualities: Sequence[float], penalty: float) -> list[float]:
+    if not penalty:
+        return list(qualities)
+    return [max(0.0, quality - penalty) for quality in qualities]
+
+
+__all__ = ["ProductKernel", "QualityCache", "role_averages"]
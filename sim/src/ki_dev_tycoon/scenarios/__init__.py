@@ -0,0 +1,41 @@
+"""What-if scenario exploration on top of the simulation kernel."""
+
+from ki_dev_tycoon.scenarios.design import (
+    HalvingResult,
+    Parameter,
+    Trial,
+    apply_parameters,
+    latin_hypercube,
+    run_design,
+    sobol,
+    successive_halving,
+)
+from ki_dev_tycoon.scenarios.paired import (
+    PairedComparison,
+    compare_paired,
+    summarise_pairs,
+    t_quantile,
+)
+from ki_dev_tycoon.scenarios.sweep import DEFAULT_PERCENTILES, KpiBands, run_sweep
+from ki_dev_tycoon.scenarios.tree import ScenarioBranch, ScenarioTree, run_scenario_tree
+
+__all__ = [
+    "DEFAULT_PERCENTILES",
+    "HalvingResult",
+    "KpiBands",
+    "PairedComparison",
+    "Parameter",
+    "ScenarioBranch",
+    "ScenarioTree",
+    "Trial",
+    "apply_parameters",
+    "compare_paired",
+    "latin_hypercube",
+    "run_design",
+    "run_scenario_tree",
+    "run_sweep",
+    "sobol",
+    "successive_halving",
+    "summarise_pairs",
+    "t_quantile",
+]
@@ -0,0 +1,404 @@
+"""Space-filling experiment designs and successive halving for balance sweeps."""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, fields, replace
+from typing import Callable, Mapping, Sequence
+
+from ki_dev_tycoon.app import SimulationConfig, SimulationResult, run_simulation
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.data.loader import AssetBundle, load_assets
+
+Objective = Callable[[SimulationResult], float]
+DesignPoint = Mapping[str, float]
+
+# ``<kind>.<field>`` or ``<kind>.<id>.<field>`` parameters address these
+# AssetBundle catalogues.
+ASSET_KINDS: dict[str, str] = {
+    "role": "roles",
+    "product": "products",
+    "market": "markets",
+    "research": "research",
+    "event": "events",
+}
+# Numeric SimulationConfig fields a parameter may sweep; run identity (ticks,
+# seed) and non-numeric switches stay fixed.
+_CONFIG_INT_FIELDS = frozenset(
+    item.name
+    for item in fields(SimulationConfig)
+    if item.type == "int" and item.name not in {"ticks", "seed"}
+)
+_CONFIG_FLOAT_FIELDS = frozenset(
+    item.name for item in fields(SimulationConfig) if item.type == "float"
+)
+
+# Primitive polynomials (degree, coefficients) and initial direction numbers
+# for Sobol dimensions 2.. (Joe & Kuo, new-joe-kuo-6.21201).
+_SOBOL_DIRECTIONS: tuple[tuple[int, int, tuple[int, ...]], ...] = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+)
+_SOBOL_BITS = 32
+
+
+@dataclass(slots=True, frozen=True)
+class Parameter:
+    """Numeric parameter swept uniformly over ``[low, high]``.
+
+    ``name`` is either a numeric :class:`SimulationConfig` field such as
+    ``operating_costs`` or an asset field: ``market.base_demand`` sets the
+    field on every market, ``market.casual.base_demand`` on one market only.
+    Integer fields are rounded.
+    """
+
+    name: str
+    low: float
+    high: float
+
+    def __post_init__(self) -> None:
+        if not self.low <= self.high:
+            msg = f"Parameter '{self.name}' needs low <= high"
+            raise ValueError(msg)
+        parts = self.name.split(".")
+        if len(parts) == 1:
+            _check_config_field(self.name)
+        elif parts[0] not in ASSET_KINDS or len(parts) > 3:
+            msg = (
+                f"Asset parameter '{self.name}' must look like <kind>.<field> or "
+                f"<kind>.<id>.<field> with kind one of: {', '.join(ASSET_KINDS)}"
+            )
+            raise ValueError(msg)
+
+    def scale(self, unit: float) -> float:
+        """Map ``unit`` in ``[0, 1)`` onto the parameter range."""
+
+        return self.low + unit * (self.high - self.low)
+
+
+def _check_config_field(name: str) -> None:
+    if name not in _CONFIG_INT_FIELDS and name not in _CONFIG_FLOAT_FIELDS:
+        msg = f"'{name}' is not a sweepable SimulationConfig field"
+        raise ValueError(msg)
+
+
+def latin_hypercube(
+    parameters: Sequence[Parameter], samples: int, *, seed: int = 0
+) -> list[dict[str, float]]:
+    """Return ``samples`` points that hit every 1/``samples`` stratum of each range once."""
+
+    _check_design(parameters, samples)
+    rng = RandomSource(seed).namespaced("design:lhs")
+    columns = []
+    for _ in parameters:
+        keys = rng.randoms(samples)
+        strata = sorted(range(samples), key=keys.__getitem__)
+        jitter = rng.randoms(samples)
+        columns.append(
+            [(stratum + offset) / samples for stratum, offset in zip(strata, jitter)]
+        )
+    return [
+        {
+            parameter.name: parameter.scale(column[row])
+            for parameter, column in zip(parameters, columns)
+        }
+        for row in range(samples)
+    ]
+
+
+def sobol(
+    parameters: Sequence[Parameter], samples: int, *, skip: int = 0
+) -> list[dict[str, float]]:
+    """Return points ``skip`` .. ``skip + samples - 1`` of the Sobol sequence.
+
+    Any power-of-two prefix of the sequence is balanced: each axis is split
+    into that many equal strata holding one point each. Supports up to 13
+    parameters.
+    """
+
+    _check_design(parameters, samples)
+    if len(parameters) > len(_SOBOL_DIRECTIONS) + 1:
+        msg = f"Sobol designs support at most {len(_SOBOL_DIRECTIONS) + 1} parameters"
+        raise ValueError(msg)
+    if skip < 0:
+        msg = "Sobol designs cannot skip a negative number of points"
+        raise ValueError(msg)
+    directions = [_sobol_directions(dimension) for dimension in range(len(parameters))]
+    state = [0] * len(parameters)
+    for index in range(skip):
+        _sobol_step(state, directions, index)
+    points = []
+    for index in range(skip, skip + samples):
+        points.append(
+            {
+                parameter.name: parameter.scale(value / 2**_SOBOL_BITS)
+                for parameter, value in zip(parameters, state)
+            }
+        )
+        _sobol_step(state, directions, index)
+    return points
+
+
+def _sobol_directions(dimension: int) -> list[int]:
+    if dimension == 0:
+        return [1 << (_SOBOL_BITS - bit) for bit in range(1, _SOBOL_BITS + 1)]
+    degree, coefficients, initial = _SOBOL_DIRECTIONS[dimension - 1]
+    numbers = list(initial)
+    for bit in range(degree, _SOBOL_BITS):
+        value = numbers[bit - degree] ^ (numbers[bit - degree] << degree)
+        for offset in range(1, degree):
+            if (coefficients >> (degree - 1 - offset)) & 1:
+                value ^= numbers[bit - offset] << offset
+        numbers.append(value)
+    return [number << (_SOBOL_BITS - bit) for bit, number in enumerate(numbers, 1)]
+
+
+def _sobol_step(state: list[int], directions: list[list[int]], index: int) -> None:
+    # Gray-code update: flip the direction number of the lowest zero bit.
+    bit = (~index & (index + 1)).bit_length() - 1
+    for dimension, numbers in enumerate(directions):
+        state[dimension] ^= numbers[bit]
+
+
+def _check_design(parameters: Sequence[Parameter], samples: int) -> None:
+    if not parameters:
+        msg = "Experiment designs need at least one parameter"
+        raise ValueError(msg)
+    if samples <= 0:
+        msg = "Experiment designs need a positive number of samples"
+        raise ValueError(msg)
+    names = [parameter.name for parameter in parameters]
+    if len(set(names)) != len(names):
+        msg = "Experiment design parameters must have unique names"
+        raise ValueError(msg)
+
+
+def apply_parameters(
+    config: SimulationConfig, assets: AssetBundle, point: DesignPoint
+) -> tuple[SimulationConfig, AssetBundle]:
+    """Return ``config`` and ``assets`` with the values of ``point`` applied.
+
+    Integer config fields are rounded, and asset values are validated by the
+    asset schemas again.
+    """
+
+    config = replace(config)
+    catalogues = {
+        attribute: dict(getattr(assets, attribute))
+        for attribute in ASSET_KINDS.values()
+    }
+    for name, value in point.items():
+        parts = name.split(".")
+        if len(parts) == 1:
+            _check_config_field(name)
+            if name in _CONFIG_INT_FIELDS:
+                setattr(config, name, int(round(value)))
+            else:
+                setattr(config, name, float(value))
+            continue
+        catalogue = catalogues[ASSET_KINDS[parts[0]]]
+        field_name = parts[-1]
+        if len(parts) == 3:
+            if parts[1] not in catalogue:
+                msg = f"Unknown {parts[0]} '{parts[1]}' in parameter '{name}'"
+                raise ValueError(msg)
+            targets = [parts[1]]
+        else:
+            targets = list(catalogue)
+        for entry_id in targets:
+            entry = catalogue[entry_id]
+            current = getattr(entry, field_name, None)
+            if not isinstance(current, (int, float)) or isinstance(current, bool):
+                msg = f"'{name}' does not address a numeric asset field"
+                raise TypeError(msg)
+            updated = round(value) if isinstance(current, int) else value
+            catalogue[entry_id] = type(entry).model_validate(
+                {**entry.model_dump(), field_name: updated}
+            )
+    return config, replace(assets, **catalogues)
+
+
+def final_cash(result: SimulationResult) -> float:
+    """Default objective: cash at the end of the run."""
+
+    return result.cash
+
+
+@dataclass(slots=True, frozen=True)
+class Trial:
+    """Mean objective of one design point over the evaluated seeds."""
+
+    point: DesignPoint
+    score: float
+    ticks: int
+    seeds: int
+
+
+def _evaluate(
+    config: SimulationConfig,
+    assets: AssetBundle,
+    point: DesignPoint,
+    seeds: Sequence[int],
+    objective: Objective,
+) -> Trial:
+    config, assets = apply_parameters(config, assets, point)
+    scores = [
+        objective(run_simulation(replace(config, seed=seed), assets=assets))
+        for seed in seeds
+    ]
+    return Trial(
+        point=dict(point),
+        score=sum(scores) / len(scores),
+        ticks=config.ticks,
+        seeds=len(seeds),
+    )
+
+
+def _evaluate_job(
+    config: SimulationConfig,
+    assets: AssetBundle | None,
+    point: DesignPoint,
+    seeds: Sequence[int],
+    objective: Objective,
+) -> Trial:
+    """Process pool entrypoint; loads the asset bundle inside the worker."""
+
+    bundle = assets or load_assets(config.resolve_asset_root())
+    return _evaluate(config, bundle, point, seeds, objective)
+
+
+def run_design(
+    config: SimulationConfig,
+    points: Sequence[DesignPoint],
+    *,
+    objective: Objective = final_cash,
+    seeds: Sequence[int] | None = None,
+    executor: Executor | None = None,
+    assets: AssetBundle | None = None,
+) -> list[Trial]:
+    """Simulate every design point and return one :class:`Trial` per point.
+
+    Each point runs once per seed (default: ``config.seed``) and is scored by
+    the mean ``objective``. With an ``executor`` every point becomes one job;
+    the objective must then be picklable, i.e. a module-level function.
+    Custom ``assets`` are shipped to the workers, otherwise each worker loads
+    the bundle from ``config.asset_root``.
+    """
+
+    seeds = tuple(seeds) if seeds is not None else (config.seed,)
+    if not seeds:
+        msg = "Experiment runs need at least one seed"
+        raise ValueError(msg)
+    config = replace(config, asset_root=config.resolve_asset_root())
+    if executor is None:
+        bundle = assets or load_assets(config.resolve_asset_root())
+        return [_evaluate(config, bundle, point, seeds, objective) for point in points]
+    futures: list[Future[Trial]] = [
+        executor.submit(_evaluate_job, config, assets, point, seeds, objective)
+        for point in points
+    ]
+    return [future.result() for future in futures]
+
+
+@dataclass(slots=True, frozen=True)
+class HalvingResult:
+    """Trials of every successive-halving rung, best first within a rung."""
+
+    rungs: tuple[tuple[Trial, ...], ...]
+
+    @property
+    def best(self) -> Trial:
+        return self.rungs[-1][0]
+
+    @property
+    def simulations(self) -> int:
+        """Number of simulation runs spent across all rungs."""
+
+        return sum(trial.seeds for rung in self.rungs for trial in rung)
+
+    @property
+    def simulated_ticks(self) -> int:
+        """Number of ticks simulated across all runs of all rungs."""
+
+        return sum(trial.seeds * trial.ticks for rung in self.rungs for trial in rung)
+
+
+def successive_halving(
+    config: SimulationConfig,
+    points: Sequence[DesignPoint],
+    *,
+    min_ticks: int,
+    eta: int = 3,
+    objective: Objective = final_cash,
+    seeds: Sequence[int] | None = None,
+    executor: Executor | None = None,
+    assets: AssetBundle | None = None,
+) -> HalvingResult:
+    """Race ``points`` on growing horizons and keep the best ``1/eta`` each rung.
+
+    The first rung simulates every point for ``min_ticks`` ticks; each later
+    rung multiplies the horizon by ``eta`` (capped at ``config.ticks``) and
+    only re-runs the survivors. The last rung always covers ``config.ticks``,
+    a lone survivor skips straight to it.
+    """
+
+    if eta < 2:
+        msg = "Successive halving needs eta >= 2"
+        raise ValueError(msg)
+    if not 0 < min_ticks <= config.ticks:
+        msg = "Successive halving needs 0 < min_ticks <= config.ticks"
+        raise ValueError(msg)
+    if not points:
+        msg = "Successive halving needs at least one design point"
+        raise ValueError(msg)
+    bundle = (
+        assets
+        if executor is not None
+        else assets or load_assets(config.resolve_asset_root())
+    )
+    survivors = list(points)
+    ticks = min_ticks
+    rungs: list[tuple[Trial, ...]] = []
+    while True:
+        trials = run_design(
+            replace(config, ticks=ticks),
+            survivors,
+            objective=objective,
+            seeds=seeds,
+            executor=executor,
+            assets=bundle,
+        )
+        ranked = tuple(sorted(trials, key=lambda trial: trial.score, reverse=True))
+        rungs.append(ranked)
+        if ticks >= config.ticks:
+            break
+        survivors = [trial.point for trial in ranked[: max(1, len(ranked) // eta)]]
+        # Once a single point is left there is nothing to race any more.
+        ticks = config.ticks if len(survivors) == 1 else min(config.ticks, ticks * eta)
+    return HalvingResult(rungs=tuple(rungs))
+
+
+__all__ = [
+    "ASSET_KINDS",
+    "DesignPoint",
+    "HalvingResult",
+    "Objective",
+    "Parameter",
+    "Trial",
+    "apply_parameters",
+    "final_cash",
+    "latin_hypercube",
+    "run_design",
+    "sobol",
+    "successive_halving",
+]
@@ -0,0 +1,187 @@
+"""Streaming per-tick KPI bands over many seeded simulation runs."""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, Future, as_completed
+from dataclasses import dataclass, field, replace
+from itertools import islice
+from typing import Iterable, Iterator, Mapping, Sequence
+
+from ki_dev_tycoon.app import SimulationConfig, run_simulation
+from ki_dev_tycoon.data.loader import AssetBundle, load_assets
+from ki_dev_tycoon.pipeline.stopping import StopCondition
+from ki_dev_tycoon.utils.sketches import QuantileSketch, RunningStats
+
+DEFAULT_PERCENTILES: tuple[float, ...] = (5.0, 50.0, 95.0)
+
+
+@dataclass(slots=True)
+class KpiBands:
+    """Per-tick quantile sketches and running moments of every KPI.
+
+    History rows are folded in as they arrive and then dropped, so memory
+    depends on the number of ticks and KPIs but not on the number of runs.
+    Bands built by different workers combine with :meth:`merge`; the
+    percentiles of the merged bands equal those of a single aggregator that
+    saw every run, whatever the merge order.
+    """
+
+    relative_accuracy: float = 0.01
+    runs: int = 0
+    ticks: dict[int, dict[str, tuple[QuantileSketch, RunningStats]]] = field(
+        default_factory=dict
+    )
+
+    def add_run(self, history: Iterable[Mapping[str, float]]) -> None:
+        """Fold the KPI history rows of one run."""
+
+        for row in history:
+            self.add_row(row)
+        self.runs += 1
+
+    def add_row(self, row: Mapping[str, float]) -> None:
+        kpis = self.ticks.setdefault(int(row["tick"]), {})
+        for name, value in row.items():
+            if name == "tick":
+                continue
+            summary = kpis.get(name)
+            if summary is None:
+                summary = kpis[name] = (
+                    QuantileSketch(relative_accuracy=self.relative_accuracy),
+                    RunningStats(),
+                )
+            summary[0].add(value)
+            summary[1].add(value)
+
+    def merge(self, other: "KpiBands") -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            msg = "Only KPI bands with the same relative accuracy can merge"
+            raise ValueError(msg)
+        for tick, incoming in other.ticks.items():
+            kpis = self.ticks.setdefault(tick, {})
+            for name, (sketch, stats) in incoming.items():
+                summary = kpis.get(name)
+                if summary is None:
+                    summary = kpis[name] = (
+                        QuantileSketch(relative_accuracy=self.relative_accuracy),
+                        RunningStats(),
+                    )
+                summary[0].merge(sketch)
+                summary[1].merge(stats)
+        self.runs += other.runs
+
+    def bands(
+        self, kpi: str, percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> list[dict[str, float]]:
+        """Return one row per tick with the mean, spread and percentiles of ``kpi``.
+
+        Rows hold ``tick``, ``runs`` (runs that reached the tick), ``mean``,
+        ``stddev`` and ``p<percentile>`` columns, e.g. ``p5``, ``p50``, ``p95``.
+        """
+
+        for percentile in percentiles:
+            if not 0.0 <= percentile <= 100.0:
+                msg = f"Percentile {percentile} is outside [0, 100]"
+                raise ValueError(msg)
+        rows = []
+        for tick in sorted(self.ticks):
+            summary = self.ticks[tick].get(kpi)
+            if summary is None:
+                continue
+            sketch, stats = summary
+            row = {
+                "tick": float(tick),
+                "runs": float(stats.count),
+                "mean": stats.mean,
+                "stddev": stats.stddev,
+            }
+            for percentile in percentiles:
+                row[f"p{percentile:g}"] = sketch.quantile(percentile / 100)
+            rows.append(row)
+        if not rows and self.ticks:
+            msg = f"Unknown KPI '{kpi}'"
+            raise ValueError(msg)
+        return rows
+
+
+def _batches(seeds: Iterable[int], size: int) -> Iterator[list[int]]:
+    iterator = iter(seeds)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _sweep_batch(
+    config: SimulationConfig,
+    seeds: Sequence[int],
+    assets: AssetBundle,
+    stop_conditions: Sequence[StopCondition],
+    relative_accuracy: float,
+) -> KpiBands:
+    bands = KpiBands(relative_accuracy=relative_accuracy)
+    for seed in seeds:
+        result = run_simulation(
+            replace(config, seed=seed),
+            assets=assets,
+            capture_history=True,
+            stop_conditions=stop_conditions,
+        )
+        bands.add_run(result.history or ())
+    return bands
+
+
+def _sweep_job(
+    config: SimulationConfig,
+    seeds: Sequence[int],
+    assets: AssetBundle | None,
+    stop_conditions: Sequence[StopCondition],
+    relative_accuracy: float,
+) -> KpiBands:
+    """Process pool entrypoint; loads a missing asset bundle inside the worker."""
+
+    assets = assets or load_assets(config.resolve_asset_root())
+    return _sweep_batch(config, seeds, assets, stop_conditions, relative_accuracy)
+
+
+def run_sweep(
+    config: SimulationConfig,
+    seeds: Iterable[int],
+    *,
+    executor: Executor | None = None,
+    assets: AssetBundle | None = None,
+    batch_size: int = 256,
+    stop_conditions: Sequence[StopCondition] = (),
+    relative_accuracy: float = 0.01,
+) -> KpiBands:
+    """Simulate ``config`` once per seed and fold every history into KPI bands.
+
+    No :class:`SimulationResult` outlives its own run. With an ``executor``
+    (e.g. :class:`concurrent.futures.ProcessPoolExecutor`) every batch of
+    ``batch_size`` seeds becomes one job that returns its own bands, which are
+    merged as soon as they complete.
+    """
+
+    if batch_size <= 0:
+        msg = "Sweeps require a positive batch size"
+        raise ValueError(msg)
+    config = replace(config, asset_root=config.resolve_asset_root())
+    bands = KpiBands(relative_accuracy=relative_accuracy)
+    if executor is None:
+        bundle = assets or load_assets(config.resolve_asset_root())
+        for batch in _batches(seeds, batch_size):
+            bands.merge(
+                _sweep_batch(config, batch, bundle, stop_conditions, relative_accuracy)
+            )
+        return bands
+
+    futures: list[Future[KpiBands]] = [
+        executor.submit(
+            _sweep_job, config, batch, assets, stop_conditions, relative_accuracy
+        )
+        for batch in _batches(seeds, batch_size)
+    ]
+    for future in as_completed(futures):
+        bands.merge(future.result())
+    return bands
+
+
+__all__ = ["DEFAULT_PERCENTILES", "KpiBands", "run_sweep"]
@@ -0,0 +1,173 @@
+"""Scenario trees that share a simulated prefix between what-if variants."""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field, replace
+from typing import Any, Mapping
+
+from ki_dev_tycoon.app import (
+    SimulationConfig,
+    SimulationResult,
+    SimulationSession,
+    SimulationSnapshot,
+)
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.data.loader import AssetBundle, load_assets
+
+OVERRIDABLE_FIELDS: frozenset[str] = frozenset(
+    {"daily_active_users", "arp_dau", "operating_costs"}
+)
+PATH_SEPARATOR = "/"
+
+
+@dataclass(slots=True, frozen=True)
+class ScenarioBranch:
+    """What-if variant forked from the final state of its parent.
+
+    Overrides are applied at the fork tick before the branch simulates its own
+    ``ticks``. Children fork again from the end of this branch.
+    """
+
+    name: str
+    ticks: int
+    config_overrides: Mapping[str, Any] = field(default_factory=dict)
+    price_overrides: Mapping[str, float] = field(default_factory=dict)
+    reseed: bool = False
+    children: tuple["ScenarioBranch", ...] = ()
+
+    def __post_init__(self) -> None:
+        if not self.name or PATH_SEPARATOR in self.name:
+            msg = f"Scenario branch names must be non-empty without '/': {self.name!r}"
+            raise ValueError(msg)
+        if self.ticks < 0:
+            msg = f"Scenario branch {self.name} cannot run a negative number of ticks"
+            raise ValueError(msg)
+        invalid = set(self.config_overrides).difference(OVERRIDABLE_FIELDS)
+        if invalid:
+            msg = f"Scenario branch {self.name} overrides unsupported fields: {sorted(invalid)}"
+            raise ValueError(msg)
+        _ensure_unique_names(self.children)
+
+
+@dataclass(slots=True, frozen=True)
+class ScenarioTree:
+    """Shared prefix of ``config.ticks`` ticks followed by forked branches."""
+
+    config: SimulationConfig
+    branches: tuple[ScenarioBranch, ...]
+
+    def __post_init__(self) -> None:
+        if self.config.ticks <= 0:
+            msg = "Scenario trees require a prefix of at least one tick"
+            raise ValueError(msg)
+        _ensure_unique_names(self.branches)
+
+
+def _ensure_unique_names(branches: tuple[ScenarioBranch, ...]) -> None:
+    seen: set[str] = set()
+    for branch in branches:
+        if branch.name in seen:
+            msg = f"Duplicate scenario branch name: {branch.name}"
+            raise ValueError(msg)
+        seen.add(branch.name)
+
+
+def _branch_config(
+    parent: SimulationConfig, branch: ScenarioBranch, path: str
+) -> SimulationConfig:
+    """Return the configuration used by ``branch`` after the fork."""
+
+    config = replace(parent, ticks=branch.ticks, **dict(branch.config_overrides))
+    if branch.reseed:
+        # Derive the child seed from the parent so re-runs stay reproducible
+        # while sibling branches receive decorrelated RNG streams.
+        child_seed = RandomSource(parent.seed).namespaced(f"scenario:{path}").seed
+        config = replace(config, seed=child_seed)
+    return config
+
+
+def _run_branch(
+    snapshot: SimulationSnapshot,
+    branch: ScenarioBranch,
+    path: str,
+    assets: AssetBundle,
+    capture_history: bool,
+) -> dict[str, SimulationResult]:
+    """Simulate ``branch`` and its descendants from ``snapshot`` depth-first."""
+
+    config = _branch_config(snapshot.config, branch, path)
+    session = SimulationSession(
+        config,
+        assets=assets,
+        capture_history=capture_history,
+        initial_state=snapshot.state,
+        history=snapshot.history,
+        competition=snapshot.competition,
+        labor_market=snapshot.labor_market,
+    )
+    session.apply_overrides(prices=branch.price_overrides)
+    session.advance(branch.ticks)
+    results = {path: session.result()}
+    if branch.children:
+        fork = session.snapshot()
+        for child in branch.children:
+            child_path = f"{path}{PATH_SEPARATOR}{child.name}"
+            results.update(
+                _run_branch(fork, child, child_path, assets, capture_history)
+            )
+    return results
+
+
+def _run_branch_job(
+    snapshot: SimulationSnapshot,
+    branch: ScenarioBranch,
+    assets: AssetBundle | None,
+    capture_history: bool,
+) -> dict[str, SimulationResult]:
+    """Process pool entrypoint; loads a missing asset bundle inside the worker."""
+
+    assets = assets or load_assets(snapshot.config.resolve_asset_root())
+    return _run_branch(snapshot, branch, branch.name, assets, capture_history)
+
+
+def run_scenario_tree(
+    tree: ScenarioTree,
+    *,
+    executor: Executor | None = None,
+    assets: AssetBundle | None = None,
+    capture_history: bool = False,
+) -> dict[str, SimulationResult]:
+    """Simulate the shared prefix once and evaluate every branch from it.
+
+    Branches run in-process against the shared immutable prefix state unless an
+    ``executor`` (e.g. :class:`concurrent.futures.ProcessPoolExecutor`) is
+    supplied, in which case each top-level branch subtree becomes one job.
+
+    Returns:
+        Mapping of ``/``-separated branch paths to their results. The key ``""``
+        holds the result of the shared prefix. With ``capture_history`` the
+        history of each branch includes the prefix ticks.
+    """
+
+    config = replace(tree.config, asset_root=tree.config.resolve_asset_root())
+    bundle = assets or load_assets(config.resolve_asset_root())
+    prefix = SimulationSession(config, assets=bundle, capture_history=capture_history)
+    prefix.advance(config.ticks)
+    snapshot = prefix.snapshot()
+    results = {"": prefix.result()}
+
+    if executor is None:
+        for branch in tree.branches:
+            results.update(
+                _run_branch(snapshot, branch, branch.name, bundle, capture_history)
+            )
+        return results
+
+    futures: list[Future[dict[str, SimulationResult]]] = [
+        executor.submit(_run_branch_job, snapshot, branch, assets, capture_history)
+        for branch in tree.branches
+    ]
+    for future in futures:
+        results.update(future.result())
+    return results
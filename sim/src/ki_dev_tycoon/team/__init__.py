@@ -1,11 +1,43 @@
 """Team subsystem helpers."""
 
-from ki_dev_tycoon.team.hiring import HiringResult, ensure_minimum_staff
-from ki_dev_tycoon.team.training import TrainingResult, train_team
+from ki_dev_tycoon.team.hiring import (
+    HiringResult,
+    ensure_minimum_staff,
+    staffing_requirements,
+)
+from ki_dev_tycoon.team.labor_market import (
+    Candidate,
+    LaborMarket,
+    PoolHiringResult,
+    create_labor_market,
+    draw_candidates,
+    hire_from_pool,
+    refresh_labor_market,
+)
+from ki_dev_tycoon.team.training import (
+    TrainingResult,
+    TrainingScheduler,
+    ticks_to_skill_up,
+    train_team,
+    train_team_for,
+    training_progress_after,
+)
 
 __all__ = [
+    "Candidate",
     "HiringResult",
+    "LaborMarket",
+    "PoolHiringResult",
     "TrainingResult",
+    "TrainingScheduler",
+    "create_labor_market",
+    "draw_candidates",
     "ensure_minimum_staff",
+    "hire_from_pool",
+    "refresh_labor_market",
+    "staffing_requirements",
+    "ticks_to_skill_up",
     "train_team",
+    "train_team_for",
+    "training_progress_after",
 ]
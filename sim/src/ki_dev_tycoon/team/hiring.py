@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 
 from ki_dev_tycoon.core.rng import RandomSource
@@ -23,29 +24,64 @@ class HiringResult:
         return 0.0
 
 
+def staffing_requirements(
+    assets: AssetBundle, product_ids: tuple[str, ...]
+) -> dict[str, int]:
+    """Return the head count each role needs to staff every product.
+
+    Staff is shared between products, so a role needs the largest count any
+    single product requires. Roles keep their first-seen order.
+    """
+
+    required: dict[str, int] = {}
+    for product_id in product_ids:
+        for role_id, count in assets.products[product_id].required_roles.items():
+            if count > required.get(role_id, 0):
+                required[role_id] = count
+    return required
+
+
 def ensure_minimum_staff(
     team: TeamState,
     *,
     assets: AssetBundle,
     rng: RandomSource,
     product_ids: tuple[str, ...],
+    keyed: bool = False,
 ) -> HiringResult:
-    """Ensure that each product has the required number of staff for every role."""
+    """Ensure that each product has the required number of staff for every role.
+
+    Role head counts are computed once and hires are appended in a single
+    step, so a tick stays linear in the team size however many people it hires.
+
+    By default the hire rolls are consumed from ``rng`` in order. With
+    ``keyed`` each roll comes from the ``<role_id>:<slot>`` child stream of
+    the head-count slot being filled, so the rolls of one role do not shift
+    when the products or the requirements of other roles change.
+    """
 
     hired: list[TeamMember] = []
-    updated_team = team
+    counts = Counter(member.role_id for member in team.members)
 
     for product_id in product_ids:
         product = assets.products[product_id]
         for role_id, required in product.required_roles.items():
-            members = updated_team.members_by_role(role_id)
-            while len(members) < required:
-                role = assets.roles[role_id]
+            difficulty = assets.roles[role_id].hiring_difficulty
+            while counts[role_id] < required:
                 # Probability of successful hire is inverse of difficulty.
-                if rng.random() < role.hiring_difficulty:
+                roll = (
+                    rng.namespaced_randoms((f"{role_id}:{counts[role_id]}",))[0]
+                    if keyed
+                    else rng.random()
+                )
+                if roll < difficulty:
                     break
-                new_member = TeamMember(role_id=role_id, skill=0.4, training_progress=0.0)
-                updated_team = updated_team.add_member(new_member)
-                hired.append(new_member)
-                members = updated_team.members_by_role(role_id)
-    return HiringResult(team=updated_team, hired=tuple(hired))
+                hired.append(
+                    TeamMember(role_id=role_id, skill=0.4, training_progress=0.0)
+                )
+                counts[role_id] += 1
+    if not hired:
+        return HiringResult(team=team, hired=())
+    return HiringResult(
+        team=TeamState(members=team.members + tuple(hired)), hired=tuple(hired)
+    )
@@ -0,0 +1,218 @@
+"""Candidate pools per role and batched hiring from them."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+
+from ki_dev_tycoon.config.schemas import RoleConfig
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.core.state import TeamMember, TeamState
+from ki_dev_tycoon.data.loader import AssetBundle
+from ki_dev_tycoon.team.hiring import HiringResult, staffing_requirements
+
+DEFAULT_REFRESH_INTERVAL = 7
+
+
+@dataclass(slots=True, frozen=True)
+class Candidate:
+    """Applicant available on the labor market for a single role."""
+
+    role_id: str
+    skill: float
+    salary_expectation: float
+
+    def acceptance_chance(self, role: RoleConfig) -> float:
+        """Return the probability that the candidate accepts an offer for ``role``.
+
+        Applicants expecting more than the role's budgeted salary are harder to
+        win over.
+        """
+
+        willingness = 1.0 - role.hiring_difficulty
+        if self.salary_expectation <= role.salary:
+            return willingness
+        return willingness * role.salary / self.salary_expectation
+
+
+@dataclass(slots=True, frozen=True)
+class LaborMarket:
+    """Immutable candidate pools keyed by role, best candidates first.
+
+    ``size`` is the number of candidates each role holds right after a
+    refresh; hires shrink a pool until the next refresh tops it up again
+    every ``refresh_interval`` ticks.
+    """
+
+    pools: dict[str, tuple[Candidate, ...]]
+    size: int
+    refresh_interval: int = DEFAULT_REFRESH_INTERVAL
+    refreshed_tick: int = 0
+
+    def pool(self, role_id: str) -> tuple[Candidate, ...]:
+        return self.pools.get(role_id, ())
+
+    def refresh_due(self, tick: int) -> bool:
+        return tick - self.refreshed_tick >= self.refresh_interval
+
+
+def draw_candidates(
+    role: RoleConfig, *, count: int, rng: RandomSource
+) -> tuple[Candidate, ...]:
+    """Return ``count`` applicants for ``role`` sorted by descending skill.
+
+    Skill follows a triangular distribution around ``0.3 + 0.2 *
+    productivity``; stronger applicants expect a higher salary.
+    """
+
+    rolls = rng.randoms(3 * count)
+    centre = 0.3 + 0.2 * role.productivity
+    candidates = []
+    for index in range(count):
+        first, second, third = rolls[3 * index : 3 * index + 3]
+        skill = min(1.0, max(0.05, centre + (first + second - 1.0) * 0.3))
+        expectation = role.salary * (0.75 + 0.5 * skill + 0.2 * third)
+        candidates.append(
+            Candidate(
+                role_id=role.id,
+                skill=round(skill, 4),
+                salary_expectation=round(expectation, 2),
+            )
+        )
+    candidates.sort(key=lambda candidate: -candidate.skill)
+    return tuple(candidates)
+
+
+def create_labor_market(
+    assets: AssetBundle,
+    *,
+    size: int,
+    rng: RandomSource,
+    refresh_interval: int = DEFAULT_REFRESH_INTERVAL,
+    tick: int = 0,
+) -> LaborMarket:
+    """Return a labor market with ``size`` candidates for every role."""
+
+    if size <= 0:
+        msg = "Candidate pools need at least one candidate per role"
+        raise ValueError(msg)
+    if refresh_interval <= 0:
+        msg = "Candidate pools need a positive refresh interval"
+        raise ValueError(msg)
+    return LaborMarket(
+        pools={
+            role_id: draw_candidates(
+                role, count=size, rng=rng.namespaced(f"{role_id}:{tick}")
+            )
+            for role_id, role in assets.roles.items()
+        },
+        size=size,
+        refresh_interval=refresh_interval,
+        refreshed_tick=tick,
+    )
+
+
+def refresh_labor_market(
+    market: LaborMarket, *, assets: AssetBundle, rng: RandomSource, tick: int
+) -> LaborMarket:
+    """Top every pool up to ``market.size`` with newly drawn applicants."""
+
+    pools: dict[str, tuple[Candidate, ...]] = {}
+    for role_id, role in assets.roles.items():
+        pool = market.pool(role_id)
+        missing = market.size - len(pool)
+        if missing > 0:
+            fresh = draw_candidates(
+                role, count=missing, rng=rng.namespaced(f"{role_id}:{tick}")
+            )
+            pool = tuple(sorted(pool + fresh, key=lambda candidate: -candidate.skill))
+        pools[role_id] = pool
+    return replace(market, pools=pools, refreshed_tick=tick)
+
+
+@dataclass(slots=True, frozen=True)
+class PoolHiringResult:
+    """Hiring outcome together with the remaining candidate pools."""
+
+    hiring: HiringResult
+    market: LaborMarket
+    deficits: dict[str, int]
+
+
+def hire_from_pool(
+    team: TeamState,
+    *,
+    market: LaborMarket,
+    assets: AssetBundle,
+    rng: RandomSource,
+    product_ids: tuple[str, ...],
+    keyed: bool = False,
+) -> PoolHiringResult:
+    """Fill all staffing deficits from the candidate pools in one pass.
+
+    Deficits are computed once from the team's role counts. For every role
+    the best ``deficit`` candidates receive an offer and accept according to
+    :meth:`Candidate.acceptance_chance`; candidates who decline stay in the
+    pool. Hires are paid their salary expectation. ``deficits`` reports the
+    positions still open afterwards.
+
+    As in :func:`ensure_minimum_staff`, ``keyed`` draws each acceptance roll
+    from the ``<role_id>:<slot>`` child stream of the head-count slot offered
+    instead of consuming ``rng`` in order.
+    """
+
+    counts: dict[str, int] = {}
+    for member in team.members:
+        counts[member.role_id] = counts.get(member.role_id, 0) + 1
+    hired: list[TeamMember] = []
+    pools = dict(market.pools)
+    deficits: dict[str, int] = {}
+    for role_id, required in staffing_requirements(assets, product_ids).items():
+        deficit = required - counts.get(role_id, 0)
+        if deficit <= 0:
+            continue
+        role = assets.roles[role_id]
+        pool = pools.get(role_id, ())
+        offered = pool[:deficit]
+        if keyed:
+            filled = counts.get(role_id, 0)
+            rolls = rng.namespaced_randoms(
+                f"{role_id}:{filled + slot}" for slot in range(len(offered))
+            )
+        else:
+            rolls = rng.randoms(len(offered))
+        declined: list[Candidate] = []
+        for candidate, roll in zip(offered, rolls):
+            if roll < candidate.acceptance_chance(role):
+                hired.append(
+                    TeamMember(
+                        role_id=role_id,
+                        skill=candidate.skill,
+                        salary=candidate.salary_expectation,
+                    )
+                )
+            else:
+                declined.append(candidate)
+        pools[role_id] = tuple(declined) + pool[deficit:]
+        open_positions = deficit - (len(offered) - len(declined))
+        if open_positions:
+            deficits[role_id] = open_positions
+    updated_team = team
+    if hired:
+        updated_team = TeamState(members=team.members + tuple(hired))
+    return PoolHiringResult(
+        hiring=HiringResult(team=updated_team, hired=tuple(hired)),
+        market=replace(market, pools=pools),
+        deficits=deficits,
+    )
+
+
+__all__ = [
+    "DEFAULT_REFRESH_INTERVAL",
+    "Candidate",
+    "LaborMarket",
+    "PoolHiringResult",
+    "create_labor_market",
+    "draw_candidates",
+    "hire_from_pool",
+    "refresh_labor_market",
+]
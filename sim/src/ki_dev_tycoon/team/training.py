@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+import sys
+from dataclasses import dataclass, replace
+from functools import lru_cache
 
+from ki_dev_tycoon.core.scheduler import EventScheduler
 from ki_dev_tycoon.core.state import TeamMember, TeamState
 from ki_dev_tycoon.data.loader import AssetBundle
 
@@ -40,3 +44,370 @@ def train_team(
         updated_members.append(progressed)
         total_skill_gain += skill_gain
     return TrainingResult(team=TeamState(members=tuple(updated_members)), total_skill_gain=total_skill_gain)
+
+
+def training_progress_after(start: float, rate: float, ticks: int) -> tuple[int, float]:
+    """Apply up to ``ticks`` training ticks at ``rate`` to the progress ``start``.
+
+    Returns ``(applied, progress)``. The additions are clamped exactly like
+    :meth:`TeamMember.advance_training`, and the walk stops at the tick that
+    reaches 1.0 (the skill-up), so ``progress == 1.0`` exactly when tick
+    ``applied`` levels the member up. Inside a floating-point binade every
+    addition moves by the same rounded step, so the binade is crossed in one
+    jump and the cost is ``O(log(1 / rate))`` instead of ``O(ticks)``.
+
+    Raises:
+        ValueError: If ``rate`` is not positive, as progress would never complete.
+    """
+
+    if rate <= 0:
+        msg = "Training progress requires a positive training rate"
+        raise ValueError(msg)
+    progress = start
+    applied = 0
+    previous: float | None = None
+    while applied < ticks:
+        advanced = max(0.0, min(1.0, progress + rate))
+        applied += 1
+        if advanced >= 1.0:
+            return applied, advanced
+        step = advanced - progress
+        if step == 0.0:
+            # Rounding swallows the rate: progress never moves again.
+            return ticks, progress
+        exponent = math.frexp(advanced)[1]
+        if math.frexp(progress)[1] != exponent:
+            previous = None
+        elif step != previous:
+            # Only the first step after a round-half-even tie may differ.
+            previous = step
+        else:
+            # Progress is a multiple of the binade's ulp and every further
+            # addition that stays below the binade's top adds ``step`` exactly.
+            ulp = math.ulp(advanced)
+            units = int(advanced / ulp)
+            top = int(math.ldexp(1.0, exponent) / ulp)
+            jump = min((top - 1 - units) // int(step / ulp), ticks - applied)
+            if jump > 0:
+                advanced += jump * step
+                applied += jump
+        progress = advanced
+    return ticks, progress
+
+
+def ticks_to_skill_up(start: float, rate: float) -> int | None:
+    """Return how many ticks at ``rate`` take the progress ``start`` to 1.0.
+
+    ``None`` means rounding stalls the progress below 1.0 for good.
+    """
+
+    ticks, progress = training_progress_after(start, rate, sys.maxsize)
+    return ticks if progress >= 1.0 else None
+
+
+# Skill-up counts shared between train_team_for calls and training schedulers;
+# rates rarely change, so a small LRU covers the usual start values.
+_cached_skill_up = lru_cache(maxsize=1024)(ticks_to_skill_up)
+
+
+def train_team_for(
+    team: TeamState,
+    *,
+    assets: AssetBundle,
+    training_bonus: float,
+    days: int,
+) -> TrainingResult:
+    """Advance training by ``days`` ticks at a constant bonus in closed form.
+
+    The team equals the result of ``days`` successive :func:`train_team`
+    calls: every member's skill-ups are counted from the exact number of
+    ticks each skill-up takes instead of being stepped tick by tick.
+    """
+
+    if days < 0:
+        msg = "Training cannot advance by a negative number of days"
+        raise ValueError(msg)
+    updated_members: list[TeamMember] = []
+    skill_ups = 0
+    for member in team.members:
+        role = assets.roles.get(member.role_id)
+        if role is None or days == 0:
+            updated_members.append(member)
+            continue
+        rate = role.training_rate + training_bonus
+        levels = 0
+        if rate > 0:
+            first = _cached_skill_up(member.training_progress, rate)
+            if first is None or days < first:
+                _, progress = training_progress_after(
+                    member.training_progress, rate, days
+                )
+            else:
+                cycle = _cached_skill_up(0.0, rate)
+                remaining = days - first
+                levels = 1
+                if cycle is not None:
+                    levels += remaining // cycle
+                    remaining %= cycle
+                _, progress = training_progress_after(0.0, rate, remaining)
+        else:
+            # Progress can only fall to zero; step until it settles.
+            progress = member.training_progress
+            for _ in range(days):
+                advanced = max(0.0, min(1.0, progress + rate))
+                if advanced >= 1.0:
+                    advanced = 0.0
+                    levels += 1
+                if advanced == progress == 0.0:
+                    break
+                progress = advanced
+        skill = member.skill
+        for _ in range(levels):
+            # TeamMember.gain_skill without the intermediate copies.
+            skill = max(0.0, min(1.0, skill + 0.05))
+            if skill >= 1.0:
+                break
+        if skill == member.skill and progress == member.training_progress:
+            updated_members.append(member)
+        else:
+            updated_members.append(
+                replace(member, skill=skill, training_progress=progress)
+            )
+        skill_ups += levels
+    return TrainingResult(
+        team=TeamState(members=tuple(updated_members)),
+        total_skill_gain=0.05 * skill_ups,
+    )
+
+
+class TrainingScheduler:
+    """Discrete-event training: members are only touched when they skill up.
+
+    Every member gets an anchor -- its progress after some tick and its
+    training rate -- and a skill-up event at the exact following tick in
+    an :class:`EventScheduler`. :meth:`advance` anchors new hires and applies
+    the due skill-ups, so a tick costs ``O(due events)`` instead of rebuilding
+    every member. Members that are not due keep a stale ``training_progress``
+    until :meth:`materialise` fills in the current values, which are identical
+    to ticking :func:`train_team`.
+    """
+
+    def __init__(self) -> None:
+        self._events: EventScheduler[int] = EventScheduler()
+        # (tick, rate, progress) per tracked member; ``rate`` is ``None`` for
+        # roles without asset data.
+        self._anchors: list[tuple[int, float | None, float]] = []
+        self._members: tuple[TeamMember, ...] = ()
+        self._materialised: tuple[TeamMember, ...] | None = None
+        self._tick: int | None = None
+        self._assets: AssetBundle | None = None
+        self._bonus: float | None = None
+        self._rates: dict[str, float] = {}
+
+    @property
+    def pending(self) -> int:
+        """Return the number of scheduled skill-up events."""
+
+        return len(self._events)
+
+    def advance(
+        self,
+        team: TeamState,
+        *,
+        assets: AssetBundle,
+        training_bonus: float,
+        tick: int,
+    ) -> TeamState:
+        """Train ``team`` for ``tick`` and return the (possibly unchanged) team."""
+
+        members = team.members
+        known = self._known_prefix(members)
+        last_tick = self._tick
+        if (
+            assets is not self._assets
+            or known is None
+            or last_tick is None
+            or tick != last_tick + 1
+        ):
+            self._reset(assets, training_bonus)
+            known = 0
+        elif training_bonus != self._bonus:
+            self._reanchor(members[:known], training_bonus, tick - 1)
+        for index in range(known, len(members)):
+            member = members[index]
+            self._anchor(index, member.role_id, tick - 1, member.training_progress)
+
+        due = self._events.pop_due(tick)
+        if due:
+            updated = list(members)
+            changed = False
+            for index in due:
+                member = updated[index]
+                levelled = member.reset_training().gain_skill(0.05)
+                # Members at the skill cap keep their object: progress is
+                # deferred anyway, so the team stays unchanged for the caches
+                # of later systems.
+                if levelled.skill != member.skill:
+                    updated[index] = levelled
+                    changed = True
+                self._anchor(index, member.role_id, tick, 0.0)
+            if changed:
+                members = tuple(updated)
+                team = TeamState(members=members)
+        self._members = members
+        self._materialised = None
+        self._tick = tick
+        return team
+
+    def materialise(self, team: TeamState, tick: int) -> TeamState:
+        """Return ``team`` with the training progress every member has after ``tick``."""
+
+        members = team.members
+        known = self._known_prefix(members)
+        if not known or tick != self._tick:
+            return team
+        updated = list(members)
+        changed = False
+        for index in range(known):
+            progress = self._progress(index, tick)
+            if progress != members[index].training_progress:
+                updated[index] = replace(members[index], training_progress=progress)
+                changed = True
+        if not changed:
+            return team
+        materialised = tuple(updated)
+        # The materialised members describe the same anchors, so a team built
+        # from them is still recognised by the next ``advance``.
+        self._materialised = materialised[:known]
+        return TeamState(members=materialised)
+
+    def tracks(self, team: TeamState, tick: int, training_bonus: float) -> bool:
+        """Return whether ``team`` is exactly the team trained up to ``tick``.
+
+        ``training_bonus`` must also match the bonus the schedule was planned
+        with; otherwise the next :meth:`advance` re-plans every member.
+        """
+
+        return (
+            tick == self._tick
+            and training_bonus == self._bonus
+            and self._known_prefix(team.members) == len(team.members)
+        )
+
+    def stable_until(self) -> int | None:
+        """Return the first tick at which a skill-up changes a member's skill.
+
+        Skill-ups of members at the skill cap only reset their progress;
+        ``None`` means no scheduled skill-up changes the team any more.
+        """
+
+        earliest: int | None = None
+        for index, member in enumerate(self._members):
+            if member.gain_skill(0.05).skill == member.skill:
+                continue
+            event = self._events.tick_of(index)
+            if event is not None and (earliest is None or event < earliest):
+                earliest = event
+        return earliest
+
+    def skip_to(self, tick: int) -> None:
+        """Advance the tracked team to ``tick`` without rebuilding it.
+
+        Only valid while :meth:`stable_until` lies beyond ``tick``: the due
+        skill-ups then merely restart the members' progress, so each member
+        is re-anchored at its last skill-up in closed form.
+
+        Raises:
+            ValueError: If a skill-up before ``tick`` would change the team.
+        """
+
+        stable = self.stable_until()
+        if self._tick is None or (stable is not None and stable <= tick):
+            msg = "Training can only skip ticks without skill changes"
+            raise ValueError(msg)
+        for index, member in enumerate(self._members):
+            event = self._events.tick_of(index)
+            if event is None or event > tick:
+                continue
+            cycle = _cached_skill_up(0.0, self._rates[member.role_id])
+            if cycle is not None:
+                event += (tick - event) // cycle * cycle
+            self._anchor(index, member.role_id, event, 0.0)
+        self._tick = tick
+        self._materialised = None
+
+    def _known_prefix(self, members: tuple[TeamMember, ...]) -> int | None:
+        """Return how many leading members are tracked, or ``None`` if unknown."""
+
+        for tracked in (self._members, self._materialised):
+            if tracked is None:
+                continue
+            if members is tracked or members[: len(tracked)] == tracked:
+                return len(tracked)
+        return None
+
+    def _reset(self, assets: AssetBundle, training_bonus: float) -> None:
+        self._events.clear()
+        self._anchors.clear()
+        self._members = ()
+        self._materialised = None
+        self._tick = None
+        self._assets = assets
+        self._set_bonus(training_bonus)
+
+    def _set_bonus(self, training_bonus: float) -> None:
+        assets = self._assets
+        assert assets is not None
+        self._bonus = training_bonus
+        self._rates = {
+            role_id: role.training_rate + training_bonus
+            for role_id, role in assets.roles.items()
+        }
+
+    def _reanchor(
+        self, members: tuple[TeamMember, ...], training_bonus: float, tick: int
+    ) -> None:
+        """Re-plan every tracked member after the training rate changed."""
+
+        current = [self._progress(index, tick) for index in range(len(members))]
+        self._set_bonus(training_bonus)
+        for index, (member, progress) in enumerate(zip(members, current)):
+            self._anchor(index, member.role_id, tick, progress)
+
+    def _anchor(self, index: int, role_id: str, tick: int, progress: float) -> None:
+        rate = self._rates.get(role_id)
+        due = None
+        if rate is not None and rate > 0:
+            due = _cached_skill_up(progress, rate)
+        if due is None:
+            self._events.cancel(index)
+        else:
+            self._events.schedule(index, tick + due)
+        anchor = (tick, rate, progress)
+        if index < len(self._anchors):
+            self._anchors[index] = anchor
+        else:
+            self._anchors.append(anchor)
+
+    def _progress(self, index: int, tick: int) -> float:
+        anchor_tick, rate, progress = self._anchors[index]
+        if rate is None:
+            return progress
+        if rate > 0:
+            return training_progress_after(progress, rate, tick - anchor_tick)[1]
+        for _ in range(tick - anchor_tick):
+            advanced = max(0.0, min(1.0, progress + rate))
+            if advanced == progress:
+                break
+            progress = advanced
+        return progress
+
+
+__all__ = [
+    "TrainingResult",
+    "TrainingScheduler",
+    "ticks_to_skill_up",
+    "train_team",
+    "train_team_for",
+    "training_progress_after",
+]
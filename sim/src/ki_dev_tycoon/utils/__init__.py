@@ -1,5 +1,15 @@
 """Utility helpers for KI Dev Tycoon."""
 
 from .logging import configure_logging, get_logger
+from .memory import AllocationTracker, ObjectFootprint, object_footprint
+from .sketches import QuantileSketch, RunningStats
 
-__all__ = ["configure_logging", "get_logger"]
+__all__ = [
+    "AllocationTracker",
+    "ObjectFootprint",
+    "QuantileSketch",
+    "RunningStats",
+    "configure_logging",
+    "get_logger",
+    "object_footprint",
+]
@@ -0,0 +1,138 @@
+"""Memory accounting for simulation objects and ``tracemalloc`` reports."""
+
+from __future__ import annotations
+
+import dataclasses
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from types import FunctionType, ModuleType
+from typing import Any, Iterator, Mapping
+
+_CONTAINERS = (list, tuple, set, frozenset)
+_OPAQUE = (type, ModuleType, FunctionType)
+
+
+@dataclass(slots=True)
+class TypeFootprint:
+    """Number of instances and bytes attributed to a single type."""
+
+    count: int = 0
+    bytes: int = 0
+
+
+@dataclass(slots=True)
+class ObjectFootprint:
+    """Deep size of an object graph, broken down by type name.
+
+    Every object is counted once, so structure shared between states (e.g.
+    unchanged team members reused by the next tick) is not double counted.
+    """
+
+    total_bytes: int = 0
+    objects: int = 0
+    by_type: dict[str, TypeFootprint] = field(default_factory=dict)
+
+    def bytes_of(self, type_name: str) -> int:
+        entry = self.by_type.get(type_name)
+        return entry.bytes if entry is not None else 0
+
+    def to_dict(self) -> dict[str, Any]:
+        ordered = sorted(self.by_type.items(), key=lambda item: -item[1].bytes)
+        return {
+            "bytes": self.total_bytes,
+            "objects": self.objects,
+            "types": {
+                name: {"count": entry.count, "bytes": entry.bytes}
+                for name, entry in ordered
+            },
+        }
+
+
+def _referents(obj: Any) -> Iterator[Any]:
+    if isinstance(obj, dict):
+        yield from obj.keys()
+        yield from obj.values()
+    elif isinstance(obj, _CONTAINERS):
+        yield from obj
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        for item in dataclasses.fields(obj):
+            yield getattr(obj, item.name)
+    elif hasattr(obj, "__dict__") and not isinstance(obj, _OPAQUE):
+        yield from vars(obj).values()
+
+
+def object_footprint(*roots: Any) -> ObjectFootprint:
+    """Return the deep ``sys.getsizeof`` footprint of ``roots`` and their contents."""
+
+    footprint = ObjectFootprint()
+    seen: set[int] = set()
+    stack = list(roots)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _OPAQUE):
+            continue
+        seen.add(id(obj))
+        size = sys.getsizeof(obj)
+        entry = footprint.by_type.setdefault(type(obj).__name__, TypeFootprint())
+        entry.count += 1
+        entry.bytes += size
+        footprint.total_bytes += size
+        footprint.objects += 1
+        stack.extend(_referents(obj))
+    return footprint
+
+
+class AllocationTracker:
+    """Measure allocations between :meth:`start` and :meth:`stop` via ``tracemalloc``.
+
+    Tracing that was already active (``python -X tracemalloc``) is left running.
+    """
+
+    def __init__(self, *, top: int = 10) -> None:
+        self._top = top
+        self._owns_tracing = False
+        self._baseline = 0
+
+    def start(self) -> None:
+        self._owns_tracing = not tracemalloc.is_tracing()
+        if self._owns_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+
+    def stop(self, objects: Mapping[str, Any] | None = None) -> dict[str, Any]:
+        """Stop tracing and return peak/retained bytes plus the top allocation sites.
+
+        ``objects`` maps labels to live objects whose deep footprint is added
+        to the report under ``"objects"``.
+        """
+
+        # Unreachable cycles would otherwise show up as retained memory.
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        statistics = tracemalloc.take_snapshot().statistics("lineno")
+        if self._owns_tracing:
+            tracemalloc.stop()
+        report: dict[str, Any] = {
+            "peak_bytes": max(0, peak - self._baseline),
+            "retained_bytes": max(0, current - self._baseline),
+            "top_allocations": [
+                {
+                    "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    "bytes": stat.size,
+                    "count": stat.count,
+                }
+                for stat in statistics[: self._top]
+            ],
+        }
+        if objects:
+            report["objects"] = {
+                label: object_footprint(value).to_dict()
+                for label, value in objects.items()
+            }
+        return report
+
+
+__all__ = ["AllocationTracker", "ObjectFootprint", "TypeFootprint", "object_footprint"]
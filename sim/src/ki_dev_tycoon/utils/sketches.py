@@ -0,0 +1,169 @@
+"""Mergeable streaming summaries for aggregating many simulation runs."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class RunningStats:
+    """Count, mean and variance of a stream (Welford's algorithm).
+
+    :meth:`merge` combines partial results from different workers with Chan's
+    parallel update, so the order in which streams are merged only affects
+    floating point rounding.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: "RunningStats") -> None:
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the values seen so far."""
+
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+@dataclass(slots=True)
+class QuantileSketch:
+    """Relative-error quantile sketch with exact merges (DDSketch).
+
+    Values are counted in logarithmic buckets whose width is chosen so that
+    :meth:`quantile` is within ``relative_accuracy`` of the true value (clamped
+    to the exact minimum and maximum). Merging adds bucket counts, so merging
+    sketches of disjoint streams in any order yields exactly the sketch of the
+    combined stream.
+
+    Only the ``max_buckets`` consecutive bucket indices below the largest one
+    are kept per sign; buckets closer to zero are folded into the lowest kept
+    one. The window is anchored at the largest index seen, so folding commutes
+    with merging as well and memory stays bounded however many values arrive.
+    """
+
+    relative_accuracy: float = 0.01
+    max_buckets: int = 2048
+    count: int = 0
+    zeros: int = 0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+    positive: dict[int, int] = field(default_factory=dict)
+    negative: dict[int, int] = field(default_factory=dict)
+    _log_gamma: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.relative_accuracy < 1.0:
+            msg = "QuantileSketch relative_accuracy must be within (0, 1)"
+            raise ValueError(msg)
+        if self.max_buckets <= 0:
+            msg = "QuantileSketch requires a positive max_buckets"
+            raise ValueError(msg)
+        gamma = (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+        self._log_gamma = math.log(gamma)
+
+    def add(self, value: float) -> None:
+        if math.isnan(value):
+            msg = "QuantileSketch cannot add NaN"
+            raise ValueError(msg)
+        self.count += 1
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        if value == 0.0:
+            self.zeros += 1
+            return
+        store = self.positive if value > 0 else self.negative
+        index = math.ceil(math.log(abs(value)) / self._log_gamma)
+        hits = store.get(index)
+        if hits is not None:
+            store[index] = hits + 1
+            return
+        store[index] = 1
+        self._collapse(store)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        if (
+            other.relative_accuracy != self.relative_accuracy
+            or other.max_buckets != self.max_buckets
+        ):
+            msg = "Only sketches with the same accuracy and bucket limit can merge"
+            raise ValueError(msg)
+        if other.count == 0:
+            return
+        self.count += other.count
+        self.zeros += other.zeros
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        for store, incoming in (
+            (self.positive, other.positive),
+            (self.negative, other.negative),
+        ):
+            for index, hits in incoming.items():
+                store[index] = store.get(index, 0) + hits
+            self._collapse(store)
+
+    def quantile(self, q: float) -> float:
+        """Return the value at quantile ``q`` (``0 <= q <= 1``)."""
+
+        if not 0.0 <= q <= 1.0:
+            msg = "Quantiles must be within [0, 1]"
+            raise ValueError(msg)
+        if self.count == 0:
+            msg = "Cannot take a quantile of an empty sketch"
+            raise ValueError(msg)
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return self._clamp(-self._value(index))
+        seen += self.zeros
+        if seen > rank:
+            return self._clamp(0.0)
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return self._clamp(self._value(index))
+        return self.maximum
+
+    def _value(self, index: int) -> float:
+        # Midpoint (in relative terms) of the bucket (gamma**(i-1), gamma**i].
+        return 2 * math.exp(index * self._log_gamma) / (1 + math.exp(self._log_gamma))
+
+    def _clamp(self, value: float) -> float:
+        return min(self.maximum, max(self.minimum, value))
+
+    def _collapse(self, store: dict[int, int]) -> None:
+        if not store:
+            return
+        floor = max(store) - self.max_buckets + 1
+        folded = 0
+        for index in [index for index in store if index < floor]:
+            folded += store.pop(index)
+        if folded:
+            store[floor] = store.get(floor, 0) + folded
+
+
+__all__ = ["QuantileSketch", "RunningStats"]
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 
 from fastapi.testclient import TestClient
 
 from ki_dev_tycoon.api import AchievementDTO, SimulationStateDTO, create_app
+from ki_dev_tycoon.api.app import SimulationRepository
 from ki_dev_tycoon.app import SimulationConfig, run_simulation
 from ki_dev_tycoon.core.state import GameState
 from ki_dev_tycoon.data import load_assets
@@ -67,6 +69,19 @@ def test_simulate_endpoint_accepts_overrides() -> None:
     assert len(history_payload) == 5
 
 
+def test_simulate_endpoint_supports_coarse_previews() -> None:
+    app = create_app(config=_config())
+    client = TestClient(app)
+
+    response = client.post("/simulate", json={"ticks": 60, "resolution": "monthly"})
+    assert response.status_code == 200
+    assert SimulationStateDTO.model_validate(response.json()).tick == 60
+    assert [row["tick"] for row in client.get("/history").json()] == [30.0, 60.0]
+
+    invalid = client.post("/simulate", json={"resolution": "hourly"})
+    assert invalid.status_code == 422
+
+
 def test_state_endpoint_can_load_savegame(tmp_path: Path) -> None:
     config = _config()
     result = run_simulation(config)
@@ -82,3 +97,41 @@ def test_state_endpoint_can_load_savegame(tmp_path: Path) -> None:
     payload = SimulationStateDTO.model_validate(response.json())
     assert payload.tick == state.tick
     assert abs(payload.cash - state.cash) < 1e-6
+
+
+def test_state_endpoint_supports_conditional_requests() -> None:
+    app = create_app(config=_config())
+    client = TestClient(app)
+
+    first = client.get("/state")
+    etag = first.headers["ETag"]
+    assert etag.startswith(f'"{_config().ticks}-')
+
+    cached = client.get("/state", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+
+    client.post("/simulate", json={"ticks": 4})
+    refreshed = client.get("/state", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != etag
+
+
+def test_caches_ignore_values_computed_across_a_refresh() -> None:
+    repo = SimulationRepository(_config())
+    snapshot = repo._snapshot
+    ticks = iter((4, 5))
+
+    def refresh_midway() -> tuple[int, GameState]:
+        taken = snapshot()
+        repo.refresh(config_override=replace(_config(), ticks=next(ticks, 5)))
+        return taken
+
+    repo._snapshot = refresh_midway  # type: ignore[method-assign]
+    assert repo.state_etag().startswith(f'"{_config().ticks}-')
+    assert repo.build_state_dto().tick == 4
+    repo._snapshot = snapshot  # type: ignore[method-assign]
+
+    assert repo.state_etag().startswith('"5-')
+    assert repo.build_state_dto().tick == 5
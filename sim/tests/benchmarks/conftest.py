@@ -0,0 +1,141 @@
+"""Shared fixtures and the scaling gate for the benchmark suite."""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from typing import Any, Iterator
+
+import pytest
+
+from ki_dev_tycoon.core.state import (
+    GameState,
+    ProductState,
+    ResearchState,
+    TeamMember,
+    TeamState,
+)
+from ki_dev_tycoon.data import AssetBundle, SyntheticAssetSpec, generate_assets
+
+SCALES: tuple[int, ...] = (10, 100, 1000)
+# Staff of the ``product_state`` fixture, kept fixed across scales.
+FIXED_TEAM_SIZE = 100
+
+_TIMINGS: dict[str, dict[int, float]] = defaultdict(dict)
+
+
+def synthetic_state(bundle: AssetBundle, members: int) -> GameState:
+    """Return a mid-game state with ``members`` staff spread across all roles."""
+
+    role_ids = list(bundle.roles)
+    team = TeamState(
+        members=tuple(
+            TeamMember(
+                role_id=role_ids[index % len(role_ids)],
+                skill=0.3 + (index % 7) / 10,
+                training_progress=(index % 10) / 10,
+            )
+            for index in range(members)
+        )
+    )
+    products = tuple(
+        ProductState(
+            product_id=product.id,
+            quality=product.base_quality,
+            adoption=100,
+            price=product.base_price,
+        )
+        for product in bundle.products.values()
+    )
+    research_ids = list(bundle.research)
+    unlocked = frozenset(research_ids[: len(research_ids) // 2])
+    return GameState(
+        tick=100,
+        cash=250_000.0,
+        reputation=55.0,
+        team=team,
+        products=products,
+        research=ResearchState(
+            unlocked=unlocked, active=None, progress=0.0, backlog=()
+        ),
+    )
+
+
+@pytest.fixture(params=SCALES, ids=lambda scale: f"n{scale}")
+def scale(request: pytest.FixtureRequest) -> int:
+    return int(request.param)
+
+
+_BUNDLES: dict[int, AssetBundle] = {}
+
+
+@pytest.fixture
+def bundle(scale: int) -> AssetBundle:
+    if scale not in _BUNDLES:
+        _BUNDLES[scale] = generate_assets(SyntheticAssetSpec.scaled(scale))
+    return _BUNDLES[scale]
+
+
+@pytest.fixture
+def state(bundle: AssetBundle, scale: int) -> GameState:
+    return synthetic_state(bundle, members=scale)
+
+
+@pytest.fixture
+def product_state(bundle: AssetBundle) -> GameState:
+    """Return a state whose team stays fixed, so only the product count scales."""
+
+    return synthetic_state(bundle, members=FIXED_TEAM_SIZE)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> Iterator[None]:
+    """Remember the mean time of scaled benchmarks for the scaling gate."""
+
+    yield
+    funcargs = getattr(item, "funcargs", {})
+    benchmark = funcargs.get("benchmark")
+    scale = funcargs.get("scale")
+    if benchmark is None or scale is None or benchmark.disabled:
+        return
+    stats = getattr(benchmark, "stats", None)
+    if stats is not None:
+        group = benchmark.group or getattr(item, "originalname", item.name)
+        _TIMINGS[group][scale] = stats.stats.mean
+
+
+def scaling_exponents() -> dict[str, float]:
+    """Return the log-log slope between the two largest measured scales."""
+
+    exponents: dict[str, float] = {}
+    for group, timings in _TIMINGS.items():
+        if len(timings) < 2:
+            continue
+        small, large = sorted(timings)[-2:]
+        if timings[small] <= 0:
+            continue
+        exponents[group] = math.log(timings[large] / timings[small]) / math.log(
+            large / small
+        )
+    return exponents
+
+
+def pytest_terminal_summary(
+    terminalreporter: Any, exitstatus: int, config: pytest.Config
+) -> None:
+    exponents = scaling_exponents()
+    if not exponents:
+        return
+    limit = config.getoption("--scaling-limit", default=None)
+    terminalreporter.section("benchmark scaling")
+    for group, exponent in sorted(exponents.items()):
+        flag = " (!)" if limit is not None and exponent > limit else ""
+        terminalreporter.write_line(f"{group:<28} n^{exponent:.2f}{flag}")
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    limit = session.config.getoption("--scaling-limit", default=None)
+    if limit is None:
+        return
+    if any(exponent > limit for exponent in scaling_exponents().values()):
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
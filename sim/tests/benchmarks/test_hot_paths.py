@@ -0,0 +1,270 @@
+"""Benchmarks for the individual simulation hot paths at 10/100/1000 entities."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ki_dev_tycoon.achievements import AchievementTracker, default_definitions
+from ki_dev_tycoon.api import create_app
+from ki_dev_tycoon.app import SimulationConfig
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.core.state import GameState, TeamState
+from ki_dev_tycoon.data import load_assets, write_assets
+from ki_dev_tycoon.data.loader import AssetBundle
+from ki_dev_tycoon.economy import (
+    create_competition,
+    project_adoption,
+    step_competition,
+)
+from ki_dev_tycoon.persistence import SavegameModel, decode_savegame, encode_savegame
+from ki_dev_tycoon.products import ProductKernel, compute_quality
+from ki_dev_tycoon.research import progress_research
+from ki_dev_tycoon.team import (
+    TrainingScheduler,
+    create_labor_market,
+    ensure_minimum_staff,
+    hire_from_pool,
+    train_team,
+)
+
+
+@pytest.mark.benchmark(group="rng_namespaced")
+def test_rng_namespaced(benchmark: Any, scale: int) -> None:
+    rng = RandomSource(seed=42)
+    namespaces = [f"demand:{index}" for index in range(scale)]
+
+    def derive() -> None:
+        for namespace in namespaces:
+            rng.namespaced(namespace)
+
+    benchmark(derive)
+
+
+@pytest.mark.benchmark(group="compute_quality")
+def test_compute_quality(
+    benchmark: Any, bundle: AssetBundle, product_state: GameState
+) -> None:
+    # Each call averages the team, so the team stays fixed and only the number
+    # of products grows.
+    def run() -> list[float]:
+        return [
+            compute_quality(
+                product_state,
+                product=product,
+                assets=bundle,
+                research_quality_bonus=0.05,
+            )
+            for product in product_state.products
+        ]
+
+    qualities = benchmark(run)
+    assert all(0.0 <= quality <= 1.0 for quality in qualities)
+
+
+@pytest.mark.benchmark(group="project_adoption")
+def test_project_adoption(
+    benchmark: Any, bundle: AssetBundle, state: GameState
+) -> None:
+    rng = RandomSource(seed=7)
+
+    def run() -> int:
+        return sum(
+            project_adoption(
+                state,
+                product=product,
+                assets=bundle,
+                rng=rng.namespaced(product.product_id),
+                demand_bonus=0.0,
+                demand_multiplier=1.0,
+            )
+            for product in state.products
+        )
+
+    assert benchmark(run) > 0
+
+
+@pytest.mark.benchmark(group="step_competition")
+def test_step_competition(
+    benchmark: Any, bundle: AssetBundle, state: GameState, scale: int
+) -> None:
+    # One market per studio keeps the number of rival offers linear in ``scale``.
+    competition = create_competition(
+        bundle, companies=scale, rng=RandomSource(seed=5), markets_per_company=1
+    )
+    offers: dict[str, list[tuple[str, float, float, int]]] = {}
+    for product in state.products:
+        market_id = bundle.products[product.product_id].target_market
+        offers.setdefault(market_id, []).append(
+            (product.product_id, product.quality, product.price, product.adoption)
+        )
+
+    result = benchmark(
+        lambda: step_competition(
+            competition,
+            assets=bundle,
+            rng=RandomSource(seed=6),
+            tick=state.tick,
+            player_offers=offers,
+            player_reputation=state.reputation,
+        )
+    )
+    assert len(result.player_adoption) == scale
+
+
+@pytest.mark.benchmark(group="product_kernel")
+def test_product_kernel(benchmark: Any, bundle: AssetBundle, state: GameState) -> None:
+    kernel = ProductKernel.build(bundle, tuple(bundle.products))
+    rng = RandomSource(seed=7)
+
+    def run() -> int:
+        kernel.quality(state.team, 0.05)
+        return sum(
+            kernel.adoption(
+                state.products,
+                reputation=state.reputation,
+                rng=rng,
+                tick=state.tick,
+                demand_bonus=0.0,
+                demand_multiplier=1.0,
+            )
+        )
+
+    assert benchmark(run) > 0
+
+
+@pytest.mark.benchmark(group="ensure_minimum_staff")
+def test_ensure_minimum_staff(
+    benchmark: Any, bundle: AssetBundle, state: GameState
+) -> None:
+    product_ids = tuple(bundle.products)
+
+    def run() -> int:
+        result = ensure_minimum_staff(
+            state.team,
+            assets=bundle,
+            rng=RandomSource(seed=3),
+            product_ids=product_ids,
+        )
+        return len(result.team.members)
+
+    assert benchmark(run) >= len(state.team.members)
+
+
+@pytest.mark.benchmark(group="hire_from_pool")
+def test_hire_from_pool(benchmark: Any, bundle: AssetBundle) -> None:
+    product_ids = tuple(bundle.products)
+    market = create_labor_market(bundle, size=4, rng=RandomSource(seed=3))
+
+    def run() -> int:
+        # An empty studio has to staff every product in a single tick.
+        result = hire_from_pool(
+            TeamState(members=()),
+            market=market,
+            assets=bundle,
+            rng=RandomSource(seed=4),
+            product_ids=product_ids,
+        )
+        return len(result.hiring.hired)
+
+    assert benchmark(run) > 0
+
+
+@pytest.mark.benchmark(group="train_team")
+def test_train_team(benchmark: Any, bundle: AssetBundle, state: GameState) -> None:
+    result = benchmark(
+        lambda: train_team(state.team, assets=bundle, training_bonus=0.01)
+    )
+    assert len(result.team.members) == len(state.team.members)
+
+
+@pytest.mark.benchmark(group="training_scheduler")
+def test_training_scheduler(
+    benchmark: Any, bundle: AssetBundle, state: GameState
+) -> None:
+    scheduler = TrainingScheduler()
+    ticks = iter(range(1, 10**9))
+    team = state.team
+
+    def run() -> int:
+        nonlocal team
+        team = scheduler.advance(
+            team, assets=bundle, training_bonus=0.01, tick=next(ticks)
+        )
+        return scheduler.pending
+
+    # Per-tick cost follows the due skill-ups, not the team size.
+    assert benchmark(run) == len(state.team.members)
+
+
+@pytest.mark.benchmark(group="progress_research")
+def test_progress_research(
+    benchmark: Any, bundle: AssetBundle, state: GameState
+) -> None:
+    result = benchmark(
+        lambda: progress_research(state.research, assets=bundle, research_points=5.0)
+    )
+    assert result.state.active is not None
+
+
+@pytest.mark.benchmark(group="achievements_evaluate")
+def test_achievement_evaluate(benchmark: Any, state: GameState) -> None:
+    definitions = default_definitions()
+
+    def run() -> int:
+        return len(AchievementTracker(definitions).evaluate(state))
+
+    benchmark(run)
+
+
+@pytest.mark.benchmark(group="encode_savegame")
+def test_encode_savegame(benchmark: Any, state: GameState) -> None:
+    save = SavegameModel.from_state(state)
+
+    assert benchmark(lambda: encode_savegame(save))
+
+
+@pytest.mark.benchmark(group="decode_savegame")
+def test_decode_savegame(benchmark: Any, state: GameState) -> None:
+    payload = encode_savegame(SavegameModel.from_state(state))
+
+    decoded = benchmark(lambda: decode_savegame(payload))
+    assert decoded.to_state().tick == state.tick
+
+
+@pytest.mark.benchmark(group="load_assets")
+def test_load_assets(
+    benchmark: Any, bundle: AssetBundle, scale: int, tmp_path: Path
+) -> None:
+    root = write_assets(bundle, tmp_path / "assets")
+
+    loaded = benchmark(lambda: load_assets(root))
+    assert len(loaded.products) == scale
+
+
+@pytest.mark.benchmark(group="api_state")
+def test_api_state(
+    benchmark: Any, bundle: AssetBundle, scale: int, tmp_path: Path
+) -> None:
+    root = write_assets(bundle, tmp_path / "assets")
+    config = SimulationConfig(
+        ticks=1,
+        seed=42,
+        daily_active_users=5_000,
+        arp_dau=0.12,
+        operating_costs=450.0,
+        asset_root=root,
+    )
+    app = create_app(config=config)
+    client = TestClient(app)
+
+    # Refreshing drops the cached ETag and DTO, so every round builds and
+    # serialises the state again.
+    response = benchmark.pedantic(
+        lambda: client.get("/state"), setup=app.state.repository.refresh, rounds=20
+    )
+    assert response.status_code == 200
+    assert len(response.json()["projects"]) == scale
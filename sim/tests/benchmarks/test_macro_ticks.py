@@ -0,0 +1,54 @@
+"""Speed and accuracy of coarse macro-ticks against the daily engine."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import replace
+
+import pytest
+
+from ki_dev_tycoon.app import SimulationConfig, run_simulation
+from ki_dev_tycoon.data import load_assets
+
+# Documented bound on the relative error of the final cash after one year,
+# worst case over SEEDS (see README, "Grobe Auflösung").
+ERROR_BOUNDS = {"weekly": 0.015, "monthly": 0.025}
+SEEDS = range(10)
+
+CONFIG = SimulationConfig(
+    ticks=365,
+    seed=0,
+    daily_active_users=5_000,
+    arp_dau=0.12,
+    operating_costs=450.0,
+)
+ASSETS = load_assets(CONFIG.resolve_asset_root())
+
+
+def _timed(config: SimulationConfig) -> tuple[float, float]:
+    started = time.perf_counter()
+    result = run_simulation(config, assets=ASSETS)
+    return time.perf_counter() - started, result.cash
+
+
+@pytest.mark.benchmark(group="macro_ticks")
+@pytest.mark.parametrize("resolution", ["weekly", "monthly"])
+def test_macro_ticks_against_daily_engine(benchmark, resolution: str) -> None:
+    """A year of macro-ticks stays within the documented cash error bound."""
+
+    coarse = replace(CONFIG, resolution=resolution)
+    result = benchmark(lambda: run_simulation(coarse, assets=ASSETS))
+
+    daily_seconds = coarse_seconds = 0.0
+    worst = 0.0
+    for seed in SEEDS:
+        elapsed, daily_cash = _timed(replace(CONFIG, seed=seed))
+        daily_seconds += elapsed
+        elapsed, coarse_cash = _timed(replace(coarse, seed=seed))
+        coarse_seconds += elapsed
+        worst = max(worst, abs(coarse_cash - daily_cash) / daily_cash)
+    benchmark.extra_info["speedup"] = round(daily_seconds / coarse_seconds, 1)
+    benchmark.extra_info["max_relative_cash_error"] = round(worst, 4)
+
+    assert result.final_tick == CONFIG.ticks
+    assert worst <= ERROR_BOUNDS[resolution]
@@ -0,0 +1,69 @@
+"""Memory budgets for the long-lived simulation structures."""
+
+from __future__ import annotations
+
+import pytest
+
+from ki_dev_tycoon.app import SimulationConfig, run_simulation
+from ki_dev_tycoon.core.state import GameState
+from ki_dev_tycoon.utils.memory import object_footprint
+
+# Deep bytes per entity, measured with ``object_footprint`` (CPython 3.11,
+# 64 bit) plus roughly 15% headroom.
+BYTES_PER_TEAM_MEMBER = 192
+BYTES_PER_PRODUCT = 256
+BYTES_PER_HISTORY_TICK = 448
+# Retained tracemalloc bytes per tick with history (session plus result copy).
+RETAINED_BYTES_PER_HISTORY_TICK = 768
+# Without history the retained memory must not grow with the run length.
+MAX_RETAINED_GROWTH = 16 * 1024
+
+
+def _config(ticks: int) -> SimulationConfig:
+    return SimulationConfig(
+        ticks=ticks,
+        seed=7,
+        daily_active_users=5_000,
+        arp_dau=0.12,
+        operating_costs=450.0,
+    )
+
+
+def test_team_member_budget(state: GameState, scale: int) -> None:
+    footprint = object_footprint(state.team)
+
+    assert footprint.by_type["TeamMember"].count == scale
+    assert footprint.total_bytes / scale <= BYTES_PER_TEAM_MEMBER
+
+
+def test_product_budget(state: GameState) -> None:
+    footprint = object_footprint(state.products)
+
+    assert footprint.total_bytes / len(state.products) <= BYTES_PER_PRODUCT
+
+
+def test_history_tick_budget() -> None:
+    ticks = 500
+    result = run_simulation(_config(ticks), capture_history=True)
+
+    footprint = object_footprint(result.history)
+    assert footprint.total_bytes / ticks <= BYTES_PER_HISTORY_TICK
+
+
+@pytest.mark.parametrize("capture_history", [False, True], ids=["plain", "history"])
+def test_retained_memory_per_tick(capture_history: bool) -> None:
+    short, long = 100, 1_000
+    retained = {
+        ticks: run_simulation(
+            _config(ticks), capture_history=capture_history, track_memory=True
+        ).memory[
+            "retained_bytes"
+        ]  # type: ignore[index]
+        for ticks in (short, long)
+    }
+
+    growth = retained[long] - retained[short]
+    if capture_history:
+        assert growth / (long - short) <= RETAINED_BYTES_PER_HISTORY_TICK
+    else:
+        assert growth <= MAX_RETAINED_GROWTH
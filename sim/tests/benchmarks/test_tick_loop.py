@@ -23,3 +23,23 @@ def test_tick_loop_benchmark(benchmark) -> None:
 
     assert result.final_tick == config.ticks
     assert result.cash != 0
+
+
+@pytest.mark.benchmark(group="tick_loop_endurance")
+def test_endurance_run_benchmark(benchmark) -> None:
+    """100k ticks: saturated stretches are fast-forwarded in closed form."""
+
+    config = SimulationConfig(
+        ticks=100_000,
+        seed=42,
+        daily_active_users=5_000,
+        arp_dau=0.12,
+        operating_costs=450.0,
+    )
+
+    result = benchmark.pedantic(
+        lambda: run_simulation(config, capture_history=True), rounds=1, iterations=1
+    )
+
+    assert result.final_tick == config.ticks
+    assert result.history is not None and len(result.history) == config.ticks
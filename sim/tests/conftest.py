@@ -0,0 +1,24 @@
+"""Command-line options shared by the whole test suite."""
+
+from __future__ import annotations
+
+import pytest
+
+# Upper bound for the log-log slope between the two largest benchmark scales.
+# Linear hot paths sit around 1.0, quadratic ones around 2.0.
+DEFAULT_SCALING_LIMIT = 1.5
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    # Registered here rather than in tests/benchmarks/conftest.py: pytest only
+    # accepts options from the rootdir's conftest files when parsing the
+    # command line, so a nested plugin breaks ``pytest tests --scaling-limit``.
+    parser.addoption(
+        "--scaling-limit",
+        type=float,
+        default=None,
+        help=(
+            "Fail the run when a benchmarked hot path scales worse than n**LIMIT "
+            f"between the two largest sizes (suggested: {DEFAULT_SCALING_LIMIT})."
+        ),
+    )
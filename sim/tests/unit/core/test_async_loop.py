@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import pytest
+
+from ki_dev_tycoon.app import SimulationConfig, SimulationSession, run_simulation
+from ki_dev_tycoon.core.async_loop import AsyncTickLoop
+from ki_dev_tycoon.core.loop import TickLoop
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.core.time import TickClock
+
+
+def _loop(**kwargs: float) -> TickLoop:
+    return TickLoop(clock=TickClock(), rng=RandomSource(seed=1), **kwargs)  # type: ignore[arg-type]
+
+
+def test_async_loop_yields_between_batches() -> None:
+    trace: List[str] = []
+    driver = AsyncTickLoop(_loop(), batch_size=2)
+
+    async def other() -> None:
+        for _ in range(3):
+            trace.append("other")
+            await asyncio.sleep(0)
+
+    async def scenario() -> int:
+        ticks = driver.advance(6, lambda tick, _: trace.append(f"tick{tick}"))
+        processed, _ = await asyncio.gather(ticks, other())
+        return processed
+
+    assert asyncio.run(scenario()) == 6
+    assert trace.index("other") < trace.index("tick3")
+    assert [item for item in trace if item != "other"] == [
+        f"tick{tick}" for tick in range(1, 7)
+    ]
+
+
+def test_async_loop_pause_resume_and_cancel() -> None:
+    processed: List[int] = []
+    driver = AsyncTickLoop(_loop(), batch_size=1)
+
+    def handler(tick: int, _: RandomSource) -> None:
+        processed.append(tick)
+        if tick == 2:
+            driver.pause()
+
+    async def scenario() -> int:
+        task = asyncio.create_task(driver.advance(10, handler))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert driver.paused
+        assert processed == [1, 2]
+        driver.resume()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        driver.cancel()
+        return await task
+
+    total = asyncio.run(scenario())
+    assert driver.cancelled
+    assert total == len(processed)
+    assert 2 < total < 10
+
+
+def test_async_loop_run_paces_with_event_loop_sleep() -> None:
+    now = [0.0]
+    loop = _loop(time_source=lambda: now[0], tick_duration=0.01)
+    driver = AsyncTickLoop(loop)
+    processed: List[int] = []
+
+    def handler(tick: int, _: RandomSource) -> None:
+        processed.append(tick)
+
+    async def scenario() -> int:
+        async def clock() -> None:
+            while len(processed) < 3:
+                now[0] += 0.005
+                await asyncio.sleep(0)
+
+        ticks, _ = await asyncio.gather(driver.run(3, handler), clock())
+        return ticks
+
+    assert asyncio.run(scenario()) == 3
+    assert processed == [1, 2, 3]
+
+
+def test_session_advance_async_matches_synchronous_run() -> None:
+    config = SimulationConfig(
+        ticks=12, seed=3, daily_active_users=1_000, arp_dau=0.1, operating_costs=80.0
+    )
+    session = SimulationSession(config, capture_history=True)
+
+    assert asyncio.run(session.advance_async(12)) == 12
+    assert session.result() == run_simulation(config, capture_history=True)
+
+    with pytest.raises(ValueError):
+        asyncio.run(session.advance_async(1, driver=AsyncTickLoop(_loop())))
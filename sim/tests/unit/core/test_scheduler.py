@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from ki_dev_tycoon.core.scheduler import EventScheduler
+
+
+def test_pop_due_returns_keys_in_tick_then_schedule_order() -> None:
+    scheduler: EventScheduler[str] = EventScheduler()
+    scheduler.schedule("late", 9)
+    scheduler.schedule("b", 4)
+    scheduler.schedule("a", 4)
+    scheduler.schedule("early", 2)
+
+    assert scheduler.next_tick() == 2
+    assert scheduler.pop_due(1) == []
+    assert scheduler.pop_due(4) == ["early", "b", "a"]
+    assert len(scheduler) == 1
+    assert scheduler.tick_of("late") == 9
+
+
+def test_rescheduling_and_cancelling_drop_stale_entries() -> None:
+    scheduler: EventScheduler[int] = EventScheduler()
+    scheduler.schedule(1, 3)
+    scheduler.schedule(2, 5)
+    scheduler.schedule(1, 8)
+    scheduler.cancel(2)
+
+    assert 2 not in scheduler
+    assert scheduler.next_tick() == 8
+    assert scheduler.pop_due(7) == []
+    assert scheduler.pop_due(8) == [1]
+    assert len(scheduler) == 0
+    assert scheduler.next_tick() is None
+
+
+def test_clear_removes_every_event() -> None:
+    scheduler: EventScheduler[int] = EventScheduler()
+    for key in range(5):
+        scheduler.schedule(key, key)
+    scheduler.clear()
+
+    assert len(scheduler) == 0
+    assert scheduler.pop_due(10) == []
@@ -7,7 +7,7 @@ from typing import Deque, List
 import pytest
 from hypothesis import given, strategies as st
 
-from ki_dev_tycoon.core.loop import TickLoop
+from ki_dev_tycoon.core.loop import MAX_SPEED, TickLoop
 from ki_dev_tycoon.core.rng import RandomSource
 from ki_dev_tycoon.core.time import TickClock
 
@@ -77,3 +77,75 @@ def test_tick_loop_rng_stream_is_deterministic(seed: int, deltas: List[float]) -
     second = run_once()
 
     assert first == second
+
+
+def test_tick_loop_defers_ticks_beyond_catch_up_budget() -> None:
+    clock = TickClock()
+    loop = TickLoop(clock=clock, rng=RandomSource(seed=3), max_ticks_per_step=2)
+
+    assert loop.advance_by(2.5, lambda *_: None) == 2
+    assert loop.advance_by(0.0, lambda *_: None) == 2
+    assert loop.advance_by(0.0, lambda *_: None) == 1
+    assert clock.current_tick() == 5
+    assert loop.dropped_ticks == 0
+
+
+def test_tick_loop_drops_ticks_beyond_catch_up_budget() -> None:
+    clock = TickClock()
+    loop = TickLoop(
+        clock=clock, rng=RandomSource(seed=3), max_ticks_per_step=2, catch_up="drop"
+    )
+
+    assert loop.advance_by(2.75, lambda *_: None) == 2
+    assert loop.dropped_ticks == 3
+    assert loop.advance_by(0.25, lambda *_: None) == 1
+    assert clock.current_tick() == 3
+
+
+def test_tick_loop_applies_time_dilation() -> None:
+    samples: Deque[float] = deque([0.0, 0.1, 0.2])
+    sleeps: List[float] = []
+    processed: List[int] = []
+    loop = TickLoop(
+        clock=TickClock(),
+        rng=RandomSource(seed=4),
+        time_source=samples.popleft,
+        sleep=sleeps.append,
+        time_scale=10.0,
+    )
+
+    loop.run(4, lambda tick, _: processed.append(tick))
+
+    assert processed == [1, 2, 3, 4]
+    assert sleeps == [pytest.approx(0.05)]
+
+
+def test_tick_loop_max_speed_ignores_wall_clock() -> None:
+    processed: List[int] = []
+    loop = TickLoop(
+        clock=TickClock(),
+        rng=RandomSource(seed=5),
+        time_source=lambda: 0.0,
+        sleep=lambda _: pytest.fail("max speed must not sleep"),
+        time_scale=MAX_SPEED,
+        max_ticks_per_step=3,
+    )
+
+    loop.run(7, lambda tick, _: processed.append(tick))
+
+    assert processed == list(range(1, 8))
+    with pytest.raises(ValueError):
+        loop.set_time_scale(0.0)
+
+
+def test_tick_loop_batch_mode_hands_over_tick_ranges() -> None:
+    clock = TickClock()
+    loop = TickLoop(clock=clock, rng=RandomSource(seed=6))
+    batches: List[range] = []
+
+    assert loop.advance_batch(2.0, lambda ticks, _: batches.append(ticks)) == 4
+    assert loop.advance_batch(0.2, lambda ticks, _: batches.append(ticks)) == 0
+    assert loop.advance_batch(0.3, lambda ticks, _: batches.append(ticks)) == 1
+
+    assert batches == [range(1, 5), range(5, 6)]
+    assert clock.current_tick() == 5
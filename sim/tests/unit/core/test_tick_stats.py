@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+
+from ki_dev_tycoon.core.loop import TickLoop
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.core.tick_stats import TickOverrun, TickStats
+from ki_dev_tycoon.core.time import TickClock
+
+
+class FakeTime:
+    """Manual clock whose sleeps overshoot by a fixed amount."""
+
+    def __init__(self, oversleep: float = 0.0, spin_step: float = 0.0001) -> None:
+        self.now = 0.0
+        self.oversleep = oversleep
+        self.spin_step = spin_step
+        self.sleeps: List[float] = []
+
+    def time(self) -> float:
+        self.now += self.spin_step
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds + self.oversleep
+
+
+def _loop(fake: FakeTime, stats: TickStats, **kwargs: float) -> TickLoop:
+    return TickLoop(
+        clock=TickClock(),
+        rng=RandomSource(seed=1),
+        time_source=fake.time,
+        sleep=fake.sleep,
+        stats=stats,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def test_tick_stats_records_handler_times_and_overruns() -> None:
+    fake = FakeTime()
+    overruns: List[TickOverrun] = []
+    stats = TickStats(on_overrun=overruns.append)
+    loop = _loop(fake, stats)
+
+    def handler(tick: int, _: RandomSource) -> None:
+        fake.now += 0.75 if tick == 2 else 0.01
+
+    loop.run(4, handler)
+    snapshot = stats.snapshot()
+
+    assert snapshot.ticks == 4
+    assert [overrun.tick for overrun in overruns] == [2]
+    assert overruns[0].budget == pytest.approx(0.5)
+    assert snapshot.overruns == 1
+    assert snapshot.handler_max == pytest.approx(0.7501, abs=1e-3)
+    assert sum(count for _, count in snapshot.histogram) == 4
+    assert snapshot.histogram[-1] == (float("inf"), 1)
+
+
+def test_tick_stats_adapts_sleep_to_observed_oversleep() -> None:
+    fake = FakeTime(oversleep=0.004)
+    stats = TickStats(smoothing=1.0)
+    loop = _loop(fake, stats)
+
+    loop.run(6, lambda *_: None)
+    snapshot = stats.snapshot()
+
+    assert stats.oversleep_estimate < 0.004
+    assert snapshot.jitter_p95 <= 0.0042
+    assert fake.sleeps[-1] < fake.sleeps[0]
+
+
+def test_sleep_then_spin_hits_deadline_precisely() -> None:
+    fake = FakeTime(oversleep=0.0, spin_step=0.00001)
+    stats = TickStats()
+    loop = _loop(fake, stats, spin_threshold=0.002)
+
+    loop.run(5, lambda *_: None)
+
+    assert stats.snapshot().jitter_max < 0.0001
+
+
+def test_tick_stats_validates_configuration() -> None:
+    with pytest.raises(ValueError):
+        TickStats(window=0)
+    with pytest.raises(ValueError):
+        TickStats(buckets=(0.1, 0.01))
@@ -4,7 +4,14 @@ from pathlib import Path
 
 import pytest
 
-from ki_dev_tycoon.data.loader import AssetLoaderError, load_assets
+from ki_dev_tycoon.data.loader import (
+    ASSET_FILES,
+    COMPILED_ASSETS_NAME,
+    AssetLoaderError,
+    compile_assets,
+    load_assets,
+    load_compiled_assets,
+)
 
 
 @pytest.fixture()
@@ -19,8 +26,7 @@ def asset_root(tmp_path: Path) -> Path:
   hiring_difficulty: 0.2
   training_rate: 0.05
   productivity: 0.5
-""".strip()
-        + "\n",
+""".strip() + "\n",
         encoding="utf-8",
     )
     (root / "products.yaml").write_text(
@@ -32,8 +38,7 @@ def asset_root(tmp_path: Path) -> Path:
   base_price: 10
   required_roles:
     engineer: 1
-""".strip()
-        + "\n",
+""".strip() + "\n",
         encoding="utf-8",
     )
     (root / "markets.yaml").write_text(
@@ -43,8 +48,7 @@ def asset_root(tmp_path: Path) -> Path:
   tam: 100
   base_demand: 0.1
   price_elasticity: 0.8
-""".strip()
-        + "\n",
+""".strip() + "\n",
         encoding="utf-8",
     )
     (root / "research.yaml").write_text(
@@ -55,8 +59,7 @@ def asset_root(tmp_path: Path) -> Path:
   unlocks:
     quality_bonus: 0.1
   prerequisites: []
-""".strip()
-        + "\n",
+""".strip() + "\n",
         encoding="utf-8",
     )
     (root / "events.yaml").write_text(
@@ -66,8 +69,7 @@ def asset_root(tmp_path: Path) -> Path:
   weight: 1.0
   effects:
     demand_multiplier: 1.05
-""".strip()
-        + "\n",
+""".strip() + "\n",
         encoding="utf-8",
     )
     return root
@@ -93,8 +95,7 @@ def test_product_reference_validation(asset_root: Path) -> None:
   base_price: 10
   required_roles:
     engineer: 1
-""".strip()
-        + "\n",
+""".strip() + "\n",
         encoding="utf-8",
     )
 
@@ -112,8 +113,7 @@ def test_event_effect_whitelist(asset_root: Path) -> None:
   weight: 1.0
   effects:
     unsupported: 1
-""".strip()
-        + "\n",
+""".strip() + "\n",
         encoding="utf-8",
     )
 
@@ -139,8 +139,7 @@ def test_research_prerequisites_validation(asset_root: Path) -> None:
     demand_bonus: 0.1
   prerequisites:
     - missing
-""".strip()
-        + "\n",
+""".strip() + "\n",
         encoding="utf-8",
     )
 
@@ -148,3 +147,58 @@ def test_research_prerequisites_validation(asset_root: Path) -> None:
         load_assets(asset_root)
 
     assert "missing" in str(excinfo.value)
+
+
+def test_compiled_assets_round_trip(asset_root: Path) -> None:
+    expected = load_assets(asset_root)
+    compiled = compile_assets(asset_root)
+
+    assert compiled == asset_root / COMPILED_ASSETS_NAME
+    assert load_compiled_assets(compiled) == expected
+    assert load_assets(asset_root) == expected
+
+
+def test_compiled_assets_skip_validation(
+    asset_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected = load_assets(asset_root)
+    compiled = compile_assets(asset_root)
+
+    def fail(raw: object) -> object:
+        raise AssertionError("compiled assets must not be validated again")
+
+    for filename in ASSET_FILES:
+        monkeypatch.setitem(ASSET_FILES, filename, fail)
+    loaded = load_compiled_assets(compiled)
+
+    assert loaded == expected
+    for name, node in loaded.research.items():
+        assert node.model_fields_set == expected.research[name].model_fields_set
+        assert isinstance(node.prerequisites, tuple)
+
+
+def test_compiled_assets_replace_missing_yaml(asset_root: Path, tmp_path: Path) -> None:
+    expected = load_assets(asset_root)
+    packaged = tmp_path / "packaged"
+    compile_assets(asset_root, packaged / COMPILED_ASSETS_NAME)
+
+    assert not any((packaged / filename).exists() for filename in ASSET_FILES)
+    assert load_assets(packaged) == expected
+
+
+def test_stale_compiled_assets_fall_back_to_yaml(asset_root: Path) -> None:
+    compiled = compile_assets(asset_root)
+    events = asset_root / "events.yaml"
+    events.write_text(events.read_text().replace("Event", "Renamed"), encoding="utf-8")
+
+    assert load_assets(asset_root).events["event"].name == "Renamed"
+    with pytest.raises(AssetLoaderError, match="out of date"):
+        load_compiled_assets(compiled, fingerprint=b"0" * 32)
+
+
+def test_corrupt_compiled_assets_are_rejected(tmp_path: Path) -> None:
+    compiled = tmp_path / COMPILED_ASSETS_NAME
+    compiled.write_bytes(b"not a bundle")
+
+    with pytest.raises(AssetLoaderError):
+        load_assets(tmp_path)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative ``-X importtime`` budget for ``ki_dev_tycoon.cli`` including
+# Typer/Click; measured at roughly 35 ms on CPython 3.11.
+IMPORT_BUDGET_US = 100_000
+HEAVY_MODULES = (
+    "asyncio",
+    "fastapi",
+    "ki_dev_tycoon.app",
+    "pydantic",
+    "rich",
+    "yaml",
+    "zstandard",
+)
+HELP_SNIPPET = "from ki_dev_tycoon.cli.sim import run_cli; run_cli(['run', '--help'])"
+
+
+def _import_times(code: str) -> dict[str, int]:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        if total.strip().isdigit():
+            cumulative[name.strip()] = int(total)
+    return cumulative
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["run", "--help"]], ids=str)
+def test_help_does_not_import_simulation_dependencies(argv: list[str]) -> None:
+    code = f"from ki_dev_tycoon.cli.sim import run_cli; run_cli({argv!r})"
+    imported = _import_times(code)
+
+    loaded = sorted(
+        module
+        for module in imported
+        if any(
+            module == heavy or module.startswith(f"{heavy}.") for heavy in HEAVY_MODULES
+        )
+    )
+    assert loaded == []
+
+
+def test_cli_import_time_budget() -> None:
+    imported = _import_times(HELP_SNIPPET)
+
+    assert imported["ki_dev_tycoon.cli"] <= IMPORT_BUDGET_US
+
+
+def test_core_defers_asyncio() -> None:
+    imported = _import_times("import ki_dev_tycoon.core")
+
+    assert "asyncio" not in imported
+    assert "importlib.metadata" not in imported
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import pytest
+
+from ki_dev_tycoon.app import (
+    SimulationConfig,
+    SimulationResult,
+    SimulationSession,
+    run_simulation,
+)
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.data import SyntheticAssetSpec, generate_assets
+from ki_dev_tycoon.economy import create_competition, step_competition
+from ki_dev_tycoon.pipeline import CompetitionSystem, default_systems
+
+
+def _config(ticks: int, competitors: int) -> SimulationConfig:
+    return SimulationConfig(
+        ticks=ticks,
+        seed=17,
+        daily_active_users=1_000,
+        arp_dau=0.1,
+        operating_costs=80.0,
+        competitors=competitors,
+    )
+
+
+def test_adding_companies_keeps_existing_offers() -> None:
+    assets = generate_assets(SyntheticAssetSpec(markets=4, products=4, seed=2))
+
+    small = create_competition(assets, companies=3, rng=RandomSource(seed=1))
+    large = create_competition(assets, companies=5, rng=RandomSource(seed=1))
+
+    for before, after in zip(small.markets, large.markets):
+        assert after.company_ids[:3] == before.company_ids
+        assert after.quality[:3] == before.quality
+        assert after.price[:3] == before.price
+    assert large.companies == tuple(f"studio_{index}" for index in range(5))
+
+
+def test_markets_per_company_limits_entries() -> None:
+    assets = generate_assets(SyntheticAssetSpec(markets=6, products=4, seed=2))
+
+    competition = create_competition(
+        assets, companies=10, rng=RandomSource(seed=1), markets_per_company=2
+    )
+
+    assert sum(len(market.company_ids) for market in competition.markets) == 20
+    with pytest.raises(ValueError):
+        create_competition(assets, companies=-1, rng=RandomSource(seed=1))
+
+
+def test_saturated_market_is_split_within_tam() -> None:
+    assets = generate_assets(SyntheticAssetSpec(markets=2, products=2, seed=4))
+    competition = create_competition(assets, companies=50, rng=RandomSource(seed=3))
+    market_id = competition.markets[0].market_id
+    tam = assets.markets[market_id].tam
+    offers = {market_id: [("flagship", 0.9, 1.0, tam // 2)]}
+
+    share = 0.0
+    for tick in range(60):
+        result = step_competition(
+            competition,
+            assets=assets,
+            rng=RandomSource(seed=9),
+            tick=tick,
+            player_offers=offers,
+            player_reputation=90.0,
+        )
+        competition = result.state
+        adoption = result.player_adoption["flagship"]
+        offers = {market_id: [("flagship", 0.9, 1.0, adoption)]}
+        assert competition.markets[0].total_adoption + adoption <= tam
+        share = result.player_share[market_id]
+
+    assert 0.0 < share < 1.0
+
+
+def test_single_studio_run_has_no_competition() -> None:
+    result = run_simulation(_config(5, competitors=0))
+
+    assert result.competition is None
+    assert all(
+        not isinstance(system, CompetitionSystem) for system in default_systems()
+    )
+
+
+def test_competitive_run_is_deterministic_and_resumable() -> None:
+    first = run_simulation(_config(12, competitors=4))
+    second = run_simulation(_config(12, competitors=4))
+    assert first.competition is not None
+    assert first == second
+    assert all(entry["rivals"] == 4 for entry in first.competition.values())
+
+    session = SimulationSession(_config(12, competitors=4))
+    session.advance(5)
+    snapshot = session.snapshot()
+    resumed = SimulationSession(
+        snapshot.config,
+        initial_state=snapshot.state,
+        competition=snapshot.competition,
+    )
+    resumed.advance(7)
+    assert resumed.result().state == first.state
+
+
+def test_rivals_take_share_from_the_player() -> None:
+    alone = run_simulation(_config(40, competitors=0))
+    contested = run_simulation(_config(40, competitors=8))
+
+    def adoption(result: SimulationResult) -> int:
+        return sum(product["adoption"] for product in result.state["products"])
+
+    assert adoption(contested) < adoption(alone)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from ki_dev_tycoon.app import SimulationConfig, SimulationResult
+from ki_dev_tycoon.data import load_assets
+from ki_dev_tycoon.scenarios import (
+    Parameter,
+    apply_parameters,
+    latin_hypercube,
+    run_design,
+    sobol,
+    successive_halving,
+)
+
+CONFIG = SimulationConfig(
+    ticks=90,
+    seed=3,
+    daily_active_users=5_000,
+    arp_dau=0.12,
+    operating_costs=450.0,
+)
+ASSETS = load_assets(CONFIG.resolve_asset_root())
+PARAMETERS = (
+    Parameter("product.base_price", 5.0, 60.0),
+    Parameter("market.base_demand", 0.005, 0.05),
+    Parameter("operating_costs", 100.0, 900.0),
+)
+
+
+def adoption(result: SimulationResult) -> float:
+    return float(sum(product["adoption"] for product in result.state["products"]))
+
+
+def _strata(points: list[dict[str, float]], parameter: Parameter) -> list[int]:
+    width = (parameter.high - parameter.low) / len(points)
+    return sorted(
+        int((point[parameter.name] - parameter.low) / width) for point in points
+    )
+
+
+def test_latin_hypercube_fills_every_stratum_once() -> None:
+    points = latin_hypercube(PARAMETERS, 20, seed=4)
+
+    for parameter in PARAMETERS:
+        assert _strata(points, parameter) == list(range(20))
+    assert points == latin_hypercube(PARAMETERS, 20, seed=4)
+    assert points != latin_hypercube(PARAMETERS, 20, seed=5)
+
+
+def test_sobol_prefixes_are_balanced() -> None:
+    unit = [Parameter(f"market.m{index}.base_demand", 0.0, 1.0) for index in range(13)]
+    points = sobol(unit, 64)
+
+    assert [tuple(point.values())[:3] for point in points[:4]] == [
+        (0.0, 0.0, 0.0),
+        (0.5, 0.5, 0.5),
+        (0.75, 0.25, 0.25),
+        (0.25, 0.75, 0.75),
+    ]
+    for size in (2, 8, 32, 64):
+        for parameter in unit:
+            assert _strata(points[:size], parameter) == list(range(size))
+    assert sobol(unit, 10, skip=54) == points[54:]
+    with pytest.raises(ValueError, match="at most 13"):
+        sobol([*unit, Parameter("arp_dau", 0.0, 1.0)], 4)
+
+
+def test_apply_parameters_updates_config_and_assets() -> None:
+    config, assets = apply_parameters(
+        CONFIG,
+        ASSETS,
+        {
+            "daily_active_users": 1234.6,
+            "market.base_demand": 0.03,
+            "role.engineer.training_rate": 0.2,
+        },
+    )
+
+    assert config.daily_active_users == 1235
+    assert {market.base_demand for market in assets.markets.values()} == {0.03}
+    assert assets.roles["engineer"].training_rate == 0.2
+    assert assets.roles["marketer"] == ASSETS.roles["marketer"]
+    assert ASSETS.roles["engineer"].training_rate != 0.2
+    with pytest.raises(ValueError):
+        apply_parameters(CONFIG, ASSETS, {"role.training_rate": 0.9})
+    with pytest.raises(ValueError, match="Unknown role"):
+        apply_parameters(CONFIG, ASSETS, {"role.intern.salary": 1.0})
+    with pytest.raises(TypeError, match="numeric asset field"):
+        apply_parameters(CONFIG, ASSETS, {"market.name": 1.0})
+
+
+def test_parameters_validate_their_names() -> None:
+    with pytest.raises(ValueError, match="sweepable"):
+        Parameter("seed", 0, 10)
+    with pytest.raises(ValueError, match="sweepable"):
+        Parameter("common_random_numbers", 0, 1)
+    with pytest.raises(ValueError, match="<kind>.<field>"):
+        Parameter("studio.size", 0, 10)
+    with pytest.raises(ValueError, match="low <= high"):
+        Parameter("arp_dau", 1.0, 0.5)
+
+
+def test_parallel_designs_match_sequential_runs() -> None:
+    points = latin_hypercube(PARAMETERS, 4, seed=1)
+    sequential = run_design(CONFIG, points, objective=adoption, seeds=(1, 2))
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = run_design(
+            CONFIG, points, objective=adoption, seeds=(1, 2), executor=executor
+        )
+
+    assert parallel == sequential
+    assert [trial.point for trial in sequential] == points
+    assert all(trial.seeds == 2 and trial.ticks == 90 for trial in sequential)
+
+
+def test_successive_halving_prunes_to_the_full_horizon() -> None:
+    points = sobol(PARAMETERS, 27)
+
+    result = successive_halving(
+        CONFIG, points, min_ticks=10, eta=3, seeds=(1, 2), assets=ASSETS
+    )
+
+    assert [len(rung) for rung in result.rungs] == [27, 9, 3]
+    assert [rung[0].ticks for rung in result.rungs] == [10, 30, 90]
+    assert result.simulations == 2 * (27 + 9 + 3)
+    assert result.simulated_ticks == 2 * (27 * 10 + 9 * 30 + 3 * 90)
+    assert result.best.ticks == CONFIG.ticks
+    survivors = [trial.point for trial in result.rungs[-1]]
+    full = run_design(CONFIG, survivors, seeds=(1, 2), assets=ASSETS)
+    assert result.best.score == max(trial.score for trial in full)
+
+
+def test_single_survivors_still_run_the_full_horizon() -> None:
+    points = latin_hypercube(PARAMETERS, 3, seed=2)
+
+    result = successive_halving(CONFIG, points, min_ticks=5, eta=4, assets=ASSETS)
+
+    assert [len(rung) for rung in result.rungs] == [3, 1]
+    assert result.best.ticks == CONFIG.ticks
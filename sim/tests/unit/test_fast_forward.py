@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import pytest
+
+from ki_dev_tycoon.app import SimulationConfig, SimulationSession, run_simulation
+from ki_dev_tycoon.core import (
+    AchievementUnlocked,
+    EventBus,
+    SimulationEvent,
+    TickProcessed,
+)
+from ki_dev_tycoon.data import SyntheticAssetSpec, generate_assets
+from ki_dev_tycoon.pipeline import FastForward, TickContext
+
+ASSETS = generate_assets(
+    SyntheticAssetSpec(roles=3, products=3, markets=2, research=30, events=4, seed=7)
+)
+
+
+def _config(seed: int, operating_costs: float = 450.0) -> SimulationConfig:
+    return SimulationConfig(
+        ticks=1,
+        seed=seed,
+        daily_active_users=5000,
+        arp_dau=0.12,
+        operating_costs=operating_costs,
+    )
+
+
+@pytest.mark.parametrize(
+    ("seed", "operating_costs"), [(1, 450.0), (2, 450.0), (3, 200_000.0)]
+)
+def test_fast_forward_matches_stepwise_execution(
+    seed: int, operating_costs: float
+) -> None:
+    config = _config(seed, operating_costs)
+    stepped = SimulationSession(config, assets=ASSETS, capture_history=True)
+    forwarded = SimulationSession(
+        config, assets=ASSETS, capture_history=True, fast_forward=True
+    )
+
+    for ticks in (7, 40, 250, 900):
+        stepped.advance(ticks)
+        forwarded.advance(ticks)
+        assert forwarded.state == stepped.state
+        assert forwarded.result() == stepped.result()
+
+
+def test_saturated_runs_are_fast_forwarded() -> None:
+    session = SimulationSession(_config(1), fast_forward=True)
+    session.advance(500)
+    fast_forward = FastForward(session.pipeline)
+
+    steady = fast_forward.steady_ticks(
+        session.state,
+        assets=session.assets,
+        product_ids=tuple(product.product_id for product in session.state.products),
+        limit=1000,
+    )
+
+    assert steady == 1000
+
+
+def test_hooks_disable_fast_forward() -> None:
+    observed: list[TickContext] = []
+    session = SimulationSession(
+        _config(1), tick_hooks=(observed.append,), fast_forward=True
+    )
+    session.advance(600)
+
+    assert [context.state.tick for context in observed] == list(range(1, 601))
+
+
+def test_event_bus_receives_every_fast_forwarded_tick() -> None:
+    events: list[SimulationEvent] = []
+    bus = EventBus()
+    bus.subscribe(TickProcessed, events.append)
+    bus.subscribe(AchievementUnlocked, events.append)
+    stepped_events: list[SimulationEvent] = []
+    stepped_bus = EventBus()
+    stepped_bus.subscribe(TickProcessed, stepped_events.append)
+    stepped_bus.subscribe(AchievementUnlocked, stepped_events.append)
+
+    SimulationSession(_config(1), event_bus=bus, fast_forward=True).advance(600)
+    SimulationSession(_config(1), event_bus=stepped_bus).advance(600)
+
+    assert events == stepped_events
+    assert [event.tick for event in events if isinstance(event, TickProcessed)] == (
+        list(range(1, 601))
+    )
+
+
+def test_run_simulation_fast_forward_keeps_history() -> None:
+    config = SimulationConfig(
+        ticks=3000,
+        seed=4,
+        daily_active_users=5000,
+        arp_dau=0.12,
+        operating_costs=450.0,
+    )
+    stepped = SimulationSession(config, capture_history=True)
+    stepped.advance(config.ticks)
+
+    result = run_simulation(config, capture_history=True)
+
+    assert result == stepped.result()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import pytest
+
+from ki_dev_tycoon.app import SimulationConfig, SimulationSession, run_simulation
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.core.state import TeamMember, TeamState
+from ki_dev_tycoon.data import SyntheticAssetSpec, generate_assets
+from ki_dev_tycoon.team import (
+    create_labor_market,
+    draw_candidates,
+    ensure_minimum_staff,
+    hire_from_pool,
+    refresh_labor_market,
+    staffing_requirements,
+)
+
+
+def _config(ticks: int, candidate_pool: int) -> SimulationConfig:
+    return SimulationConfig(
+        ticks=ticks,
+        seed=23,
+        daily_active_users=1_000,
+        arp_dau=0.1,
+        operating_costs=80.0,
+        candidate_pool=candidate_pool,
+    )
+
+
+def test_staffing_requirements_take_largest_product_need() -> None:
+    assets = generate_assets(SyntheticAssetSpec(roles=3, products=30, seed=8))
+
+    required = staffing_requirements(assets, tuple(assets.products))
+
+    for role_id, count in required.items():
+        assert count == max(
+            product.required_roles.get(role_id, 0)
+            for product in assets.products.values()
+        )
+
+
+def test_ensure_minimum_staff_fills_shared_deficits_once() -> None:
+    assets = generate_assets(SyntheticAssetSpec(roles=5, products=40, seed=8))
+    product_ids = tuple(assets.products)
+    required = staffing_requirements(assets, product_ids)
+    team = TeamState(members=(TeamMember(role_id="role_0", skill=0.5),))
+
+    result = ensure_minimum_staff(
+        team, assets=assets, rng=RandomSource(seed=1), product_ids=product_ids
+    )
+
+    assert result.team.members[:1] == team.members
+    assert result.team.members[1:] == result.hired
+    for role_id, count in required.items():
+        assert len(result.team.members_by_role(role_id)) <= max(count, 1)
+
+
+def test_candidates_are_sorted_and_deterministic() -> None:
+    assets = generate_assets(SyntheticAssetSpec(roles=2, products=2, seed=8))
+    role = assets.roles["role_0"]
+
+    first = draw_candidates(role, count=20, rng=RandomSource(seed=4))
+    second = draw_candidates(role, count=20, rng=RandomSource(seed=4))
+
+    assert first == second
+    assert [candidate.skill for candidate in first] == sorted(
+        (candidate.skill for candidate in first), reverse=True
+    )
+    assert all(candidate.salary_expectation > 0 for candidate in first)
+
+
+def test_hire_from_pool_consumes_best_candidates() -> None:
+    assets = generate_assets(SyntheticAssetSpec(roles=4, products=12, seed=8))
+    product_ids = tuple(assets.products)
+    market = create_labor_market(assets, size=6, rng=RandomSource(seed=2))
+
+    result = hire_from_pool(
+        TeamState(members=()),
+        market=market,
+        assets=assets,
+        rng=RandomSource(seed=3),
+        product_ids=product_ids,
+    )
+
+    required = staffing_requirements(assets, product_ids)
+    for role_id in required:
+        before = market.pool(role_id)
+        after = result.market.pool(role_id)
+        hired = result.hiring.team.members_by_role(role_id)
+        assert len(after) + len(hired) == len(before)
+        assert len(hired) + result.deficits.get(role_id, 0) == required[role_id]
+        assert {(member.skill, member.salary) for member in hired} <= {
+            (candidate.skill, candidate.salary_expectation)
+            for candidate in before[: required[role_id]]
+        }
+
+
+def test_keyed_pool_hiring_isolates_roles() -> None:
+    assets = generate_assets(SyntheticAssetSpec(roles=4, products=12, seed=8))
+    product_ids = tuple(assets.products)
+    market = create_labor_market(assets, size=6, rng=RandomSource(seed=2))
+    # A head start in role_0 changes how many offers that role makes.
+    head_start = TeamState(members=(TeamMember(role_id="role_0", skill=0.5),))
+
+    def hires(team: TeamState, seed: int, *, keyed: bool) -> list[TeamMember]:
+        result = hire_from_pool(
+            team,
+            market=market,
+            assets=assets,
+            rng=RandomSource(seed=seed),
+            product_ids=product_ids,
+            keyed=keyed,
+        )
+        return [member for member in result.hiring.hired if member.role_id != "role_0"]
+
+    for seed in range(10):
+        assert hires(TeamState(members=()), seed, keyed=True) == hires(
+            head_start, seed, keyed=True
+        )
+    assert any(
+        hires(TeamState(members=()), seed, keyed=False)
+        != hires(head_start, seed, keyed=False)
+        for seed in range(10)
+    )
+
+
+def test_refresh_tops_pools_up_to_size() -> None:
+    assets = generate_assets(SyntheticAssetSpec(roles=3, products=6, seed=8))
+    market = create_labor_market(
+        assets, size=5, rng=RandomSource(seed=2), refresh_interval=3
+    )
+    drained = hire_from_pool(
+        TeamState(members=()),
+        market=market,
+        assets=assets,
+        rng=RandomSource(seed=3),
+        product_ids=tuple(assets.products),
+    ).market
+
+    assert not drained.refresh_due(2)
+    assert drained.refresh_due(3)
+    refreshed = refresh_labor_market(
+        drained, assets=assets, rng=RandomSource(seed=2), tick=3
+    )
+    assert all(len(refreshed.pool(role_id)) == 5 for role_id in assets.roles)
+    assert refreshed.refreshed_tick == 3
+    with pytest.raises(ValueError):
+        create_labor_market(assets, size=0, rng=RandomSource(seed=2))
+
+
+def test_pooled_hiring_run_is_resumable() -> None:
+    full = run_simulation(_config(15, candidate_pool=8))
+
+    session = SimulationSession(_config(15, candidate_pool=8))
+    session.advance(6)
+    snapshot = session.snapshot()
+    resumed = SimulationSession(
+        snapshot.config,
+        initial_state=snapshot.state,
+        labor_market=snapshot.labor_market,
+    )
+    resumed.advance(9)
+
+    assert resumed.result().state == full.state
+    skills = {member["skill"] for member in full.state["team"]["members"]}
+    assert skills != {0.4}
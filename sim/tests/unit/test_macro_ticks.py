@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from ki_dev_tycoon.app import SimulationConfig, SimulationSession, run_simulation
+from ki_dev_tycoon.core import EventBus, SimulationEvent, TickProcessed
+from ki_dev_tycoon.core.state import TeamMember, TeamState
+from ki_dev_tycoon.data import SyntheticAssetSpec, generate_assets
+from ki_dev_tycoon.pipeline import StageProfiler
+from ki_dev_tycoon.team import train_team, train_team_for
+
+ASSETS = generate_assets(
+    SyntheticAssetSpec(roles=3, products=3, markets=2, research=30, events=4, seed=7)
+)
+ROLE_IDS = tuple(ASSETS.roles)
+
+
+def _config(ticks: int, resolution: str = "daily", **overrides) -> SimulationConfig:
+    return SimulationConfig(
+        ticks=ticks,
+        seed=11,
+        daily_active_users=5000,
+        arp_dau=0.12,
+        operating_costs=450.0,
+        resolution=resolution,  # type: ignore[arg-type]
+        **overrides,
+    )
+
+
+members = st.builds(
+    TeamMember,
+    role_id=st.sampled_from(ROLE_IDS),
+    skill=st.floats(0.0, 1.0),
+    training_progress=st.floats(0.0, 1.0),
+)
+
+
+@settings(max_examples=60, deadline=None)
+@given(
+    team=st.lists(members, max_size=5).map(lambda items: TeamState(tuple(items))),
+    training_bonus=st.sampled_from((0.0, 0.013, 0.4, -0.02, -1.0)),
+    days=st.integers(0, 90),
+)
+def test_train_team_for_matches_daily_training(
+    team: TeamState, training_bonus: float, days: int
+) -> None:
+    expected = team
+    for _ in range(days):
+        expected = train_team(
+            expected, assets=ASSETS, training_bonus=training_bonus
+        ).team
+
+    trained = train_team_for(
+        team, assets=ASSETS, training_bonus=training_bonus, days=days
+    )
+
+    assert trained.team == expected
+
+
+@pytest.mark.parametrize(("resolution", "rows"), [("weekly", 53), ("monthly", 13)])
+def test_coarse_runs_cover_every_day_in_macro_ticks(resolution: str, rows: int) -> None:
+    result = run_simulation(
+        _config(365, resolution), assets=ASSETS, capture_history=True
+    )
+
+    assert result.final_tick == 365
+    assert result.resolution == resolution
+    assert result.history is not None and len(result.history) == rows
+    assert result.history[-1]["tick"] == 365.0
+    assert run_simulation(_config(365), assets=ASSETS).resolution is None
+
+
+@pytest.mark.parametrize("resolution", ["weekly", "monthly"])
+def test_coarse_runs_track_the_daily_engine(resolution: str) -> None:
+    daily = run_simulation(_config(365), assets=ASSETS, capture_history=True)
+    coarse = run_simulation(
+        _config(365, resolution), assets=ASSETS, capture_history=True
+    )
+
+    assert coarse.cash == pytest.approx(daily.cash, rel=0.03)
+    # Research may change the training bonus mid-period, so only the
+    # training progress may drift, not roles or skills.
+    assert [
+        (member["role_id"], member["skill"])
+        for member in coarse.state["team"]["members"]
+    ] == [
+        (member["role_id"], member["skill"])
+        for member in daily.state["team"]["members"]
+    ]
+    assert coarse.history is not None and daily.history is not None
+    assert coarse.history[-1]["adoption"] == daily.history[-1]["adoption"]
+
+
+def test_coarse_runs_publish_one_tick_event_per_macro_tick() -> None:
+    bus = EventBus()
+    ticks: list[int] = []
+
+    def record(event: SimulationEvent) -> None:
+        assert isinstance(event, TickProcessed)
+        ticks.append(event.tick)
+
+    bus.subscribe(TickProcessed, record)
+    run_simulation(_config(20, "weekly"), assets=ASSETS, event_bus=bus)
+
+    assert ticks == [7, 14, 20]
+
+
+def test_coarse_runs_reject_unsupported_options() -> None:
+    with pytest.raises(ValueError, match="Unknown resolution"):
+        run_simulation(_config(10, "hourly"), assets=ASSETS)
+    with pytest.raises(ValueError, match="daily resolution"):
+        run_simulation(_config(10, "weekly"), assets=ASSETS, profiler=StageProfiler())
+    with pytest.raises(ValueError, match="daily resolution"):
+        run_simulation(_config(10, "monthly", competitors=2), assets=ASSETS)
+
+
+def test_session_forecast_leaves_the_session_untouched() -> None:
+    session = SimulationSession(_config(1), assets=ASSETS, capture_history=True)
+    session.advance(40)
+    before = session.result()
+
+    forecast = session.forecast(60, resolution="monthly")
+
+    assert [row["tick"] for row in forecast] == [70.0, 100.0]
+    assert session.result() == before
+    session.advance(60)
+    assert forecast[-1]["cash"] == pytest.approx(session.state.cash, rel=0.05)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from ki_dev_tycoon.app import SimulationConfig, run_simulation
+from ki_dev_tycoon.cli.sim import run_cli
+from ki_dev_tycoon.core.state import TeamMember, TeamState
+from ki_dev_tycoon.utils.memory import AllocationTracker, object_footprint
+
+
+def _config(ticks: int = 20) -> SimulationConfig:
+    return SimulationConfig(
+        ticks=ticks,
+        seed=42,
+        daily_active_users=5_000,
+        arp_dau=0.12,
+        operating_costs=450.0,
+    )
+
+
+def test_object_footprint_counts_shared_objects_once() -> None:
+    member = TeamMember(role_id="engineer", skill=0.5)
+    single = object_footprint(TeamState(members=(member,)))
+    shared = object_footprint(TeamState(members=(member, member)))
+
+    assert shared.by_type["TeamMember"].count == 1
+    assert shared.total_bytes - single.total_bytes == 8  # one extra tuple slot
+    assert single.to_dict()["types"]["TeamState"]["count"] == 1
+
+
+def test_allocation_tracker_reports_peak_and_sites() -> None:
+    tracker = AllocationTracker(top=3)
+    tracker.start()
+    blocks = [bytearray(10_000) for _ in range(10)]
+    report = tracker.stop({"blocks": blocks})
+
+    assert report["peak_bytes"] >= 100_000
+    assert report["retained_bytes"] >= 100_000
+    assert len(report["top_allocations"]) == 3
+    assert report["objects"]["blocks"]["types"]["bytearray"]["count"] == 10
+    assert not tracemalloc.is_tracing()
+
+
+def test_memory_tracking_does_not_change_results() -> None:
+    tracked = run_simulation(_config(), capture_history=True, track_memory=True)
+    plain = run_simulation(_config(), capture_history=True)
+
+    assert tracked.model_dump(exclude={"memory"}) == plain.model_dump(
+        exclude={"memory"}
+    )
+    assert plain.memory is None
+    memory = tracked.memory or {}
+    assert set(memory["objects"]) == {"game_state", "team", "history", "result_state"}
+    assert memory["objects"]["team"]["types"]["TeamMember"]["count"] == len(
+        tracked.state["team"]["members"]
+    )
+
+
+def test_cli_memory_report(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    output = tmp_path / "result.json"
+    exit_code = run_cli(
+        [
+            "run",
+            "--ticks",
+            "5",
+            "--log-level",
+            "WARNING",
+            "--memory-report",
+            "--output",
+            str(output),
+        ]
+    )
+
+    assert exit_code == 0
+    stderr = capsys.readouterr().err
+    assert "peak" in stderr
+    assert "allocated by" in stderr
+    assert json.loads(output.read_text())["memory"]["peak_bytes"] > 0
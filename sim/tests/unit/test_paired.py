@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+import pytest
+
+from ki_dev_tycoon.app import SimulationConfig, run_simulation
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.core.state import TeamState
+from ki_dev_tycoon.data import load_assets
+from ki_dev_tycoon.scenarios import (
+    apply_parameters,
+    compare_paired,
+    summarise_pairs,
+    t_quantile,
+)
+from ki_dev_tycoon.team import ensure_minimum_staff
+
+CONFIG = SimulationConfig(
+    ticks=60,
+    seed=0,
+    daily_active_users=5_000,
+    arp_dau=0.12,
+    operating_costs=450.0,
+)
+ASSETS = load_assets(CONFIG.resolve_asset_root())
+
+
+def _with_requirement(role_id: str, count: int):
+    products = dict(ASSETS.products)
+    analytics = products["analytics_suite"]
+    products["analytics_suite"] = analytics.model_copy(
+        update={"required_roles": {**analytics.required_roles, role_id: count}}
+    )
+    return replace(ASSETS, products=products)
+
+
+def _marketer_hire_ticks(assets, *, keyed: bool) -> list[list[int]]:
+    product_ids = tuple(assets.products)
+    runs = []
+    for seed in range(20):
+        team = TeamState(members=())
+        hires = []
+        for tick in range(1, 40):
+            result = ensure_minimum_staff(
+                team,
+                assets=assets,
+                rng=RandomSource(seed).namespaced(f"hiring:{tick}"),
+                product_ids=product_ids,
+                keyed=keyed,
+            )
+            team = result.team
+            hires += [tick for member in result.hired if member.role_id == "marketer"]
+        runs.append(hires)
+    return runs
+
+
+@pytest.mark.parametrize(
+    ("df", "expected"),
+    [(1, 12.7062), (2, 4.3027), (3, 3.1824), (5, 2.5706), (30, 2.0423)],
+)
+def test_t_quantiles_match_the_tables(df: int, expected: float) -> None:
+    assert t_quantile(0.975, df) == pytest.approx(expected, rel=2e-3)
+
+
+def test_summaries_match_the_paired_sample_statistics() -> None:
+    pairs = [(10.0, 12.5), (14.0, 15.0), (9.0, 12.0), (20.0, 21.5), (11.0, 13.0)]
+    differences = [variant - baseline for baseline, variant in pairs]
+
+    summary = summarise_pairs(pairs, confidence=0.9)
+
+    stddev = statistics.stdev(differences)
+    half_width = t_quantile(0.95, 4) * stddev / len(pairs) ** 0.5
+    assert summary.difference == pytest.approx(statistics.fmean(differences))
+    assert summary.stddev == pytest.approx(stddev)
+    assert summary.low == pytest.approx(summary.difference - half_width)
+    assert summary.high == pytest.approx(summary.difference + half_width)
+    assert summary.effect_size == pytest.approx(summary.difference / stddev)
+    assert summary.correlation == pytest.approx(statistics.correlation(*zip(*pairs)))
+    assert summary.significant
+    assert summary.to_dict()["seeds"] == 5
+    with pytest.raises(ValueError, match="two seeds"):
+        summarise_pairs(pairs[:1])
+
+
+def test_keyed_hiring_isolates_roles_from_other_requirements() -> None:
+    variant = _with_requirement("data_scientist", 3)
+
+    keyed = _marketer_hire_ticks(ASSETS, keyed=True)
+    ordered = _marketer_hire_ticks(ASSETS, keyed=False)
+
+    assert keyed == _marketer_hire_ticks(variant, keyed=True)
+    assert ordered != _marketer_hire_ticks(variant, keyed=False)
+
+
+def test_identical_arms_show_no_effect() -> None:
+    result = compare_paired(CONFIG, seeds=range(6), baseline_assets=ASSETS)
+
+    assert result.difference == 0.0
+    assert result.stddev == 0.0
+    assert not result.significant
+    assert result.correlation == pytest.approx(1.0)
+
+
+def test_paired_runs_detect_small_asset_changes() -> None:
+    _, variant = apply_parameters(
+        CONFIG, ASSETS, {"market.sme_automation.base_demand": 0.022}
+    )
+
+    paired = compare_paired(
+        CONFIG, seeds=range(8), baseline_assets=ASSETS, variant_assets=variant
+    )
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = compare_paired(
+            CONFIG,
+            seeds=range(8),
+            baseline_assets=ASSETS,
+            variant_assets=variant,
+            executor=executor,
+            batch_size=3,
+        )
+    independent = summarise_pairs(
+        [
+            (
+                run_simulation(replace(CONFIG, seed=seed), assets=ASSETS).cash,
+                run_simulation(replace(CONFIG, seed=seed + 100), assets=variant).cash,
+            )
+            for seed in range(8)
+        ]
+    )
+
+    assert paired.significant and paired.difference > 0
+    assert paired.correlation > 0.99
+    assert paired.stddev * 10 < independent.stddev
+    assert parallel == paired
+
+
+def test_common_random_numbers_work_with_coarse_resolution() -> None:
+    config = replace(CONFIG, ticks=90, resolution="monthly")
+    variant = replace(config, operating_costs=500.0)
+
+    result = compare_paired(config, variant, seeds=range(4), baseline_assets=ASSETS)
+
+    assert result.difference == pytest.approx(-50.0 * 90, rel=0.05)
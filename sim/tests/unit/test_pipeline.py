@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+
+from ki_dev_tycoon.app import SimulationConfig, SimulationSession
+from ki_dev_tycoon.pipeline import (
+    HiringSystem,
+    TickContext,
+    TickPipeline,
+    default_systems,
+)
+
+
+def _config() -> SimulationConfig:
+    return SimulationConfig(
+        ticks=5,
+        seed=5,
+        daily_active_users=1_000,
+        arp_dau=0.1,
+        operating_costs=80.0,
+    )
+
+
+def test_default_systems_run_in_canonical_order() -> None:
+    names = [system.name for system in default_systems()]
+
+    assert names == [
+        "hiring",
+        "training",
+        "research",
+        "events",
+        "market",
+        "finance",
+        "achievements",
+    ]
+
+
+def test_tick_hooks_observe_every_tick() -> None:
+    contexts: List[TickContext] = []
+    session = SimulationSession(_config(), tick_hooks=(contexts.append,))
+
+    session.advance(5)
+
+    assert [context.tick for context in contexts] == [1, 2, 3, 4, 5]
+    assert contexts[-1].state == session.state
+    assert contexts[0].hired
+    assert any(context.event is not None for context in contexts)
+
+
+def test_custom_systems_replace_default_pipeline() -> None:
+    session = SimulationSession(_config(), systems=(HiringSystem(),))
+
+    session.advance(2)
+
+    assert session.state.team.members
+    assert session.state.cash == 0.0
+
+
+def test_pipeline_rejects_duplicate_system_names() -> None:
+    with pytest.raises(ValueError):
+        TickPipeline((HiringSystem(), HiringSystem()))
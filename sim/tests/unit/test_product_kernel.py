@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import hypothesis.strategies as st
+from hypothesis import given, settings
+
+from ki_dev_tycoon.core.rng import RandomSource
+from ki_dev_tycoon.core.state import (
+    GameState,
+    ProductState,
+    ResearchState,
+    TeamMember,
+    TeamState,
+)
+from ki_dev_tycoon.data import SyntheticAssetSpec, generate_assets
+from ki_dev_tycoon.economy import project_adoption
+from ki_dev_tycoon.products import ProductKernel, QualityCache, compute_quality
+
+ASSETS = generate_assets(SyntheticAssetSpec(roles=6, products=40, markets=5, seed=12))
+
+
+def _state(skills: list[float], reputation: float, adoption: int) -> GameState:
+    role_ids = list(ASSETS.roles)
+    return GameState(
+        tick=9,
+        cash=0.0,
+        reputation=reputation,
+        team=TeamState(
+            members=tuple(
+                TeamMember(role_id=role_ids[index % len(role_ids)], skill=skill)
+                for index, skill in enumerate(skills)
+            )
+        ),
+        products=tuple(
+            ProductState(
+                product_id=product.id,
+                quality=product.base_quality,
+                adoption=adoption,
+                price=product.base_price,
+            )
+            for product in ASSETS.products.values()
+        ),
+        research=ResearchState(
+            unlocked=frozenset(), active=None, progress=0.0, backlog=()
+        ),
+    )
+
+
+@settings(max_examples=40, deadline=None)
+@given(
+    skills=st.lists(st.floats(min_value=0.0, max_value=1.0), max_size=30),
+    bonus=st.floats(min_value=0.0, max_value=0.3),
+)
+def test_kernel_quality_matches_scalar(skills: list[float], bonus: float) -> None:
+    state = _state(skills, 50.0, 0)
+    kernel = ProductKernel.build(ASSETS, tuple(ASSETS.products))
+
+    assert kernel.quality(state.team, bonus) == [
+        compute_quality(
+            state, product=product, assets=ASSETS, research_quality_bonus=bonus
+        )
+        for product in state.products
+    ]
+
+
+@settings(max_examples=40, deadline=None)
+@given(
+    reputation=st.floats(min_value=0.0, max_value=100.0),
+    adoption=st.integers(min_value=0, max_value=60_000),
+    demand_bonus=st.floats(min_value=0.0, max_value=0.1),
+    multiplier=st.floats(min_value=0.5, max_value=1.5),
+)
+def test_kernel_adoption_matches_scalar(
+    reputation: float, adoption: int, demand_bonus: float, multiplier: float
+) -> None:
+    state = _state([0.5, 0.6], reputation, adoption)
+    kernel = ProductKernel.build(ASSETS, tuple(ASSETS.products))
+    rng = RandomSource(seed=77)
+
+    assert kernel.adoption(
+        state.products,
+        reputation=reputation,
+        rng=rng,
+        tick=state.tick,
+        demand_bonus=demand_bonus,
+        demand_multiplier=multiplier,
+    ) == [
+        project_adoption(
+            state,
+            product=product,
+            assets=ASSETS,
+            rng=rng.namespaced(f"{product.product_id}:{state.tick}"),
+            demand_bonus=demand_bonus,
+            demand_multiplier=multiplier,
+        )
+        for product in state.products
+    ]
+
+
+def test_kernel_matches_only_its_portfolio() -> None:
+    state = _state([], 50.0, 0)
+    kernel = ProductKernel.build(ASSETS, tuple(ASSETS.products))
+
+    assert kernel.matches(ASSETS, state.products)
+    assert not kernel.matches(ASSETS, state.products[1:])
+    assert not kernel.matches(ASSETS, tuple(reversed(state.products)))
+
+
+@settings(max_examples=30, deadline=None)
+@given(
+    steps=st.lists(
+        st.tuples(
+            st.integers(min_value=0, max_value=11),
+            st.floats(min_value=0.0, max_value=1.0),
+            st.sampled_from([0.0, 0.05]),
+            st.sampled_from([0.0, 0.03]),
+        ),
+        min_size=1,
+        max_size=12,
+    )
+)
+def test_quality_cache_matches_full_recompute(
+    steps: list[tuple[int, float, float, float]],
+) -> None:
+    kernel = ProductKernel.build(ASSETS, tuple(ASSETS.products))
+    cache = QualityCache(kernel)
+    skills = [0.4] * 12
+    for member, skill, bonus, penalty in steps:
+        skills[member] = skill
+        team = _state(skills, 50.0, 0).team
+        expected = [
+            max(0.0, quality - penalty) if penalty else quality
+            for quality in kernel.quality(team, bonus)
+        ]
+
+        assert cache.qualities(team, bonus, penalty) == expected
+
+
+def test_quality_cache_skips_unchanged_roles() -> None:
+    kernel = ProductKernel.build(ASSETS, tuple(ASSETS.products))
+    cache = QualityCache(kernel)
+    team = _state([0.4] * 12, 50.0, 0).team
+
+    cache.qualities(team, 0.0, 0.0)
+    assert cache.recomputed == len(kernel.product_ids)
+
+    cache.qualities(team, 0.0, 0.05)
+    assert cache.recomputed == 0
+
+    trained = _state([0.45] + [0.4] * 11, 50.0, 0).team
+    cache.qualities(trained, 0.0, 0.05)
+    role_id = trained.members[0].role_id
+    assert cache.recomputed == sum(
+        role_id in product.required_roles for product in ASSETS.products.values()
+    )
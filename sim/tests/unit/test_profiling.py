@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ki_dev_tycoon.app import SimulationConfig, run_simulation
+from ki_dev_tycoon.cli.sim import run_cli
+from ki_dev_tycoon.pipeline import StageProfiler
+
+
+def _config(ticks: int = 20) -> SimulationConfig:
+    return SimulationConfig(
+        ticks=ticks,
+        seed=8,
+        daily_active_users=1_000,
+        arp_dau=0.1,
+        operating_costs=80.0,
+    )
+
+
+def test_profiling_reports_every_stage_without_changing_results() -> None:
+    profiler = StageProfiler()
+    profiled = run_simulation(_config(), capture_history=True, profiler=profiler)
+    plain = run_simulation(_config(), capture_history=True)
+
+    assert profiled.model_dump(exclude={"profile"}) == plain.model_dump(
+        exclude={"profile"}
+    )
+    assert plain.profile is None
+    breakdown = profiled.profile or {}
+    assert set(breakdown) == {
+        "tick",
+        "hiring",
+        "training",
+        "research",
+        "events",
+        "market",
+        "market.quality",
+        "market.adoption",
+        "finance",
+        "achievements",
+        "history",
+    }
+    assert breakdown["tick"]["calls"] == 20
+    assert breakdown["tick"]["share"] == 1.0
+    # The market kernel evaluates the whole portfolio in one span per tick.
+    assert breakdown["market.quality"]["calls"] == 20
+
+
+def test_chrome_trace_and_speedscope_exports(tmp_path: Path) -> None:
+    profiler = StageProfiler(trace=True)
+    run_simulation(_config(5), profiler=profiler)
+
+    chrome = json.loads(profiler.write_trace(tmp_path / "trace.json").read_text())
+    events = chrome["traceEvents"]
+    assert {event["ph"] for event in events} == {"X"}
+    assert sum(event["name"] == "tick" for event in events) == 5
+
+    speedscope = profiler.speedscope()
+    frames = [frame["name"] for frame in speedscope["shared"]["frames"]]
+    stack: list[int] = []
+    for event in speedscope["profiles"][0]["events"]:
+        if event["type"] == "O":
+            stack.append(event["frame"])
+        else:
+            assert stack.pop() == event["frame"]
+    assert not stack
+    assert frames[0] == "tick"
+
+
+def test_trace_export_requires_tracing() -> None:
+    with pytest.raises(RuntimeError):
+        StageProfiler().chrome_trace()
+
+
+def test_cli_profile_flag_adds_breakdown(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    trace = tmp_path / "profile.speedscope.json"
+    exit_code = run_cli(
+        [
+            "run",
+            "--ticks",
+            "3",
+            "--log-level",
+            "WARNING",
+            "--profile-output",
+            str(trace),
+            "--profile-format",
+            "speedscope",
+        ]
+    )
+
+    captured = capsys.readouterr()
+    assert exit_code == 0
+    assert json.loads(captured.out)["profile"]["tick"]["calls"] == 3
+    assert "market.adoption" in captured.err
+    assert json.loads(trace.read_text())["profiles"][0]["type"] == "evented"
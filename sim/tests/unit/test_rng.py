@@ -57,3 +57,20 @@ def test_random_source_randint_property(seed: int, lower: int, span: int) -> Non
     draws_b = [rng_b.randint(lower, upper) for _ in range(10)]
 
     assert draws_a == draws_b
+
+
+def test_random_source_randoms_matches_single_draws() -> None:
+    batched = RandomSource(seed=5)
+    single = RandomSource(seed=5)
+
+    assert batched.randoms(4) == [single.random() for _ in range(4)]
+    assert batched.random() == single.random()
+
+
+def test_random_source_namespaced_randoms_match_children() -> None:
+    base = RandomSource(seed=31)
+    namespaces = [f"product_{index}:7" for index in range(5)]
+
+    assert base.namespaced_randoms(namespaces) == [
+        base.namespaced(namespace).random() for namespace in namespaces
+    ]
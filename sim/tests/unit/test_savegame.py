@@ -12,6 +12,7 @@ from ki_dev_tycoon.core.state import (
     GameState,
     ProductState,
     ResearchState,
+    TeamMember,
     TeamState,
 )
 from ki_dev_tycoon.persistence import (
@@ -30,7 +31,7 @@ def _state() -> GameState:
         ProductState(product_id="p", quality=0.5, adoption=100, price=10.0),
     )
     research = ResearchState(unlocked=frozenset({"n"}), active=None, progress=0.0, backlog=())
-    team = TeamState(members=())
+    team = TeamState(members=(TeamMember(role_id="r", skill=0.4, salary=95.5),))
     return GameState(
         tick=7,
         cash=250.5,
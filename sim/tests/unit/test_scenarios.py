@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from ki_dev_tycoon.app import SimulationConfig, run_simulation
+from ki_dev_tycoon.data import load_assets
+from ki_dev_tycoon.scenarios import (
+    ScenarioBranch,
+    ScenarioTree,
+    apply_parameters,
+    run_scenario_tree,
+)
+
+
+def _config(ticks: int) -> SimulationConfig:
+    return SimulationConfig(
+        ticks=ticks,
+        seed=11,
+        daily_active_users=1_000,
+        arp_dau=0.1,
+        operating_costs=80.0,
+    )
+
+
+def test_unmodified_branch_matches_linear_run() -> None:
+    tree = ScenarioTree(
+        config=_config(6),
+        branches=(ScenarioBranch(name="baseline", ticks=4),),
+    )
+
+    results = run_scenario_tree(tree, capture_history=True)
+    linear = run_simulation(_config(10), capture_history=True)
+
+    assert results[""].final_tick == 6
+    assert results["baseline"].state == linear.state
+    assert results["baseline"].history == linear.history
+
+
+def test_branch_overrides_apply_at_fork_tick() -> None:
+    tree = ScenarioTree(
+        config=_config(5),
+        branches=(
+            ScenarioBranch(name="baseline", ticks=5),
+            ScenarioBranch(
+                name="cheap",
+                ticks=5,
+                price_overrides={"onboarding_bot": 0.0},
+                config_overrides={"operating_costs": 10.0},
+                children=(ScenarioBranch(name="later", ticks=2, reseed=True),),
+            ),
+        ),
+    )
+
+    results = run_scenario_tree(tree)
+
+    assert set(results) == {"", "baseline", "cheap", "cheap/later"}
+    cheap_prices = {
+        p["product_id"]: p["price"] for p in results["cheap"].state["products"]
+    }
+    assert cheap_prices["onboarding_bot"] == 0.0
+    assert results["cheap"].state != results["baseline"].state
+    assert results["cheap/later"].final_tick == 12
+    assert run_scenario_tree(tree)["cheap/later"] == results["cheap/later"]
+
+
+def test_process_pool_matches_in_process_execution() -> None:
+    tree = ScenarioTree(
+        config=_config(3),
+        branches=(
+            ScenarioBranch(name="a", ticks=2),
+            ScenarioBranch(
+                name="b", ticks=2, config_overrides={"operating_costs": 0.0}
+            ),
+        ),
+    )
+
+    _, assets = apply_parameters(
+        tree.config,
+        load_assets(tree.config.resolve_asset_root()),
+        {"market.base_demand": 0.05},
+    )
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        pooled = run_scenario_tree(tree, executor=executor)
+        custom = run_scenario_tree(tree, executor=executor, assets=assets)
+
+    assert pooled == run_scenario_tree(tree)
+    assert custom == run_scenario_tree(tree, assets=assets)
+    assert custom["a"] != pooled["a"]
+
+
+def test_branch_rejects_unknown_overrides() -> None:
+    with pytest.raises(ValueError):
+        ScenarioBranch(name="x", ticks=1, config_overrides={"seed": 3})
+    with pytest.raises(ValueError):
+        ScenarioTree(
+            config=_config(1),
+            branches=(
+                ScenarioBranch(name="x", ticks=1),
+                ScenarioBranch(name="x", ticks=1),
+            ),
+        )
@@ -55,6 +55,14 @@ def test_game_state_serialization_roundtrip() -> None:
     assert restored == state
 
 
+def test_team_member_salary_overrides_role_salary() -> None:
+    member = TeamMember(role_id="engineer", skill=0.3, salary=130.0)
+
+    assert member.daily_salary(100.0) == 130.0
+    assert TeamMember(role_id="engineer", skill=0.3).daily_salary(100.0) == 100.0
+    assert TeamMember.from_dict(member.to_dict()) == member
+
+
 def test_add_achievements_is_idempotent() -> None:
     state = _empty_state()
     achievement = AchievementSnapshot(
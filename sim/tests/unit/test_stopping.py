@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ki_dev_tycoon.app import SimulationConfig, SimulationSession, run_simulation
+from ki_dev_tycoon.data import SyntheticAssetSpec, generate_assets
+from ki_dev_tycoon.pipeline import (
+    Bankruptcy,
+    Stagnation,
+    StopMonitor,
+    StopReason,
+    TargetReached,
+)
+
+ASSETS = generate_assets(
+    SyntheticAssetSpec(roles=3, products=3, markets=2, research=30, events=4, seed=7)
+)
+
+
+def _config(
+    ticks: int, operating_costs: float = 450.0, resolution: str = "daily"
+) -> SimulationConfig:
+    return SimulationConfig(
+        ticks=ticks,
+        seed=4,
+        daily_active_users=5000,
+        arp_dau=0.12,
+        operating_costs=operating_costs,
+        resolution=resolution,  # type: ignore[arg-type]
+    )
+
+
+def test_bankrupt_runs_stop_after_patience_ticks_at_zero_cash() -> None:
+    config = _config(1_000, operating_costs=10_000_000.0)
+
+    result = run_simulation(
+        config,
+        assets=ASSETS,
+        capture_history=True,
+        stop_conditions=(Bankruptcy(patience=25),),
+    )
+    full = run_simulation(config, assets=ASSETS, capture_history=True)
+
+    assert result.stopped == {"condition": "bankruptcy", "tick": 25}
+    assert result.final_tick == 25
+    assert full.stopped is None and full.final_tick == 1_000
+    assert result.history == full.history[:25]
+
+
+def test_fast_forwarded_stretches_stop_on_the_same_tick() -> None:
+    conditions = (Stagnation(patience=150), TargetReached(cash=5e9))
+    stepped = SimulationSession(_config(1), assets=ASSETS, stop_conditions=conditions)
+    forwarded = SimulationSession(
+        _config(1), assets=ASSETS, stop_conditions=conditions, fast_forward=True
+    )
+
+    processed = forwarded.advance(5_000)
+
+    assert stepped.advance(5_000) == processed < 5_000
+    assert forwarded.stop_reason == stepped.stop_reason
+    assert forwarded.stop_reason is not None
+    assert forwarded.stop_reason.tick == processed
+    assert forwarded.result() == stepped.result()
+    assert forwarded.advance(10) == 0
+
+
+def test_target_reached_fires_on_first_qualifying_tick() -> None:
+    result = run_simulation(
+        _config(365),
+        assets=ASSETS,
+        capture_history=True,
+        stop_conditions=(TargetReached(cash=1_000_000.0),),
+    )
+
+    assert result.history is not None
+    assert result.history[-1]["cash"] >= 1_000_000.0
+    assert result.history[-2]["cash"] < 1_000_000.0
+    assert result.stopped == {"condition": "target_reached", "tick": result.final_tick}
+
+
+def test_coarse_runs_count_patience_in_days() -> None:
+    result = run_simulation(
+        _config(365, operating_costs=10_000_000.0, resolution="weekly"),
+        assets=ASSETS,
+        stop_conditions=(Bankruptcy(patience=30),),
+    )
+
+    assert result.stopped == {"condition": "bankruptcy", "tick": 35}
+
+
+def test_stop_conditions_validate_their_settings() -> None:
+    with pytest.raises(ValueError, match="at least one"):
+        TargetReached()
+    with pytest.raises(ValueError, match="positive patience"):
+        StopMonitor((Bankruptcy(patience=0),))
+
+
+def test_stop_monitor_resets_streaks_when_a_condition_breaks() -> None:
+    session = SimulationSession(_config(1), assets=ASSETS)
+    broke = session.state
+    monitor = StopMonitor((Bankruptcy(patience=2),))
+
+    assert monitor.check(broke, ASSETS) is None
+    assert monitor.check(broke.apply_cash_delta(10.0), ASSETS) is None
+    assert monitor.check(broke, ASSETS) is None
+    assert monitor.check(broke, ASSETS) == StopReason("bankruptcy", broke.tick)
+
+
+def test_async_advance_stops_on_the_same_tick_as_advance() -> None:
+    conditions = (TargetReached(reputation=0.0),)
+    stepped = SimulationSession(_config(1), assets=ASSETS, stop_conditions=conditions)
+    driven = SimulationSession(_config(1), assets=ASSETS, stop_conditions=conditions)
+
+    processed = asyncio.run(driven.advance_async(50))
+
+    assert stepped.advance(50) == processed == 1
+    assert driven.stop_reason == stepped.stop_reason == StopReason("target_reached", 1)
+    assert driven.result() == stepped.result()
+    assert asyncio.run(driven.advance_async(10)) == 0
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import math
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from ki_dev_tycoon.app import SimulationConfig, run_simulation
+from ki_dev_tycoon.data import load_assets
+from ki_dev_tycoon.scenarios import KpiBands, apply_parameters, run_sweep
+from ki_dev_tycoon.utils import QuantileSketch, RunningStats
+
+
+def _config(ticks: int) -> SimulationConfig:
+    return SimulationConfig(
+        ticks=ticks,
+        seed=0,
+        daily_active_users=1_000,
+        arp_dau=0.1,
+        operating_costs=80.0,
+    )
+
+
+values = st.lists(
+    st.floats(-1e9, 1e9, allow_nan=False) | st.sampled_from((0.0, 1.0, -2.5)),
+    max_size=60,
+)
+
+
+@settings(max_examples=60, deadline=None)
+@given(
+    parts=st.lists(values, min_size=1, max_size=4),
+    max_buckets=st.sampled_from((4, 2048)),
+)
+def test_merged_sketches_equal_a_single_stream(
+    parts: list[list[float]], max_buckets: int
+) -> None:
+    single = QuantileSketch(max_buckets=max_buckets)
+    merged = QuantileSketch(max_buckets=max_buckets)
+    for part in parts:
+        sketch = QuantileSketch(max_buckets=max_buckets)
+        for value in part:
+            sketch.add(value)
+            single.add(value)
+        merged.merge(sketch)
+
+    assert merged == single
+
+
+def test_sketch_quantiles_stay_within_the_relative_accuracy() -> None:
+    rng = random.Random(3)
+    data = sorted(rng.lognormvariate(8, 2) for _ in range(20_000))
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in data:
+        sketch.add(value)
+
+    for q in (0.0, 0.05, 0.5, 0.95, 0.999, 1.0):
+        exact = data[round(q * (len(data) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.01)
+    assert len(sketch.positive) < 1_500
+
+
+def test_running_stats_merge_matches_the_population_moments() -> None:
+    rng = random.Random(5)
+    data = [rng.gauss(100.0, 15.0) for _ in range(5_000)]
+    merged = RunningStats()
+    for start in range(0, len(data), 700):
+        part = RunningStats()
+        for value in data[start : start + 700]:
+            part.add(value)
+        merged.merge(part)
+
+    assert merged.count == len(data)
+    assert merged.mean == pytest.approx(statistics.fmean(data))
+    assert merged.variance == pytest.approx(statistics.pvariance(data))
+    assert math.isclose(merged.stddev, statistics.pstdev(data), rel_tol=1e-9)
+
+
+def test_sketches_validate_their_settings() -> None:
+    with pytest.raises(ValueError, match="relative_accuracy"):
+        QuantileSketch(relative_accuracy=1.0)
+    with pytest.raises(ValueError, match="empty"):
+        QuantileSketch().quantile(0.5)
+    with pytest.raises(ValueError, match="same accuracy"):
+        QuantileSketch().merge(QuantileSketch(relative_accuracy=0.02))
+
+
+def test_sweep_bands_match_collected_histories() -> None:
+    config = _config(20)
+    bands = run_sweep(config, range(12), batch_size=5)
+    finals = sorted(
+        run_simulation(replace(config, seed=seed), capture_history=True).history[-1][
+            "cash"
+        ]
+        for seed in range(12)
+    )
+
+    rows = bands.bands("cash", percentiles=(0, 50, 100))
+
+    assert bands.runs == 12
+    assert [row["tick"] for row in rows] == [float(tick) for tick in range(1, 21)]
+    assert rows[-1]["runs"] == 12.0
+    assert rows[-1]["p0"] == finals[0]
+    assert rows[-1]["p100"] == finals[-1]
+    assert rows[-1]["p50"] == pytest.approx(finals[5], rel=0.01)
+    assert rows[-1]["mean"] == pytest.approx(statistics.fmean(finals))
+    with pytest.raises(ValueError, match="Unknown KPI"):
+        bands.bands("headcount")
+
+
+def test_parallel_sweeps_merge_to_the_sequential_percentiles() -> None:
+    config = _config(15)
+    sequential = run_sweep(config, range(8), batch_size=8)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = run_sweep(config, range(8), executor=executor, batch_size=3)
+
+    for kpi in ("cash", "adoption", "reputation"):
+        expected = sequential.bands(kpi)
+        actual = parallel.bands(kpi)
+        assert [(row["p5"], row["p50"], row["p95"], row["runs"]) for row in actual] == [
+            (row["p5"], row["p50"], row["p95"], row["runs"]) for row in expected
+        ]
+        assert [row["mean"] for row in actual] == pytest.approx(
+            [row["mean"] for row in expected]
+        )
+
+
+def test_parallel_sweeps_use_the_given_assets() -> None:
+    config = _config(15)
+    _, assets = apply_parameters(
+        config,
+        load_assets(config.resolve_asset_root()),
+        {"market.base_demand": 0.05},
+    )
+    sequential = run_sweep(config, range(6), assets=assets)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = run_sweep(
+            config, range(6), executor=executor, assets=assets, batch_size=3
+        )
+
+    assert parallel.bands("adoption")[-1]["p50"] == (
+        sequential.bands("adoption")[-1]["p50"]
+    )
+    assert parallel.bands("adoption")[-1]["p50"] != (
+        run_sweep(config, range(6)).bands("adoption")[-1]["p50"]
+    )
+
+
+def test_band_memory_does_not_grow_with_the_number_of_runs() -> None:
+    history = [
+        {"tick": float(tick), "cash": 1_000.0 + tick, "adoption": float(tick % 7)}
+        for tick in range(1, 31)
+    ]
+    bands = KpiBands()
+    for _ in range(50):
+        bands.add_run(history)
+    buckets = sum(
+        len(sketch.positive)
+        for kpis in bands.ticks.values()
+        for sketch, _ in kpis.values()
+    )
+    for _ in range(500):
+        bands.add_run(history)
+
+    assert bands.runs == 550
+    assert buckets == sum(
+        len(sketch.positive)
+        for kpis in bands.ticks.values()
+        for sketch, _ in kpis.values()
+    )
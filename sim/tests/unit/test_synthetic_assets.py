@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ki_dev_tycoon.cli.sim import run_cli
+from ki_dev_tycoon.data import (
+    SyntheticAssetSpec,
+    generate_assets,
+    load_assets,
+    write_assets,
+)
+
+
+def test_generated_assets_pass_loader_validation(tmp_path: Path) -> None:
+    spec = SyntheticAssetSpec(
+        roles=30, products=2_000, markets=40, research=1_500, events=60, seed=5
+    )
+    bundle = generate_assets(spec)
+
+    loaded = load_assets(write_assets(bundle, tmp_path / "assets"))
+
+    assert loaded == bundle
+    assert len(loaded.products) == 2_000
+    assert len(loaded.research) == 1_500
+    assert len(loaded.events) == 60
+
+
+def test_generator_is_seeded() -> None:
+    spec = SyntheticAssetSpec(products=50, research=50, seed=9)
+
+    assert generate_assets(spec) == generate_assets(spec)
+    assert generate_assets(spec) != generate_assets(SyntheticAssetSpec(seed=10))
+
+
+def test_resizing_one_catalogue_keeps_the_others() -> None:
+    small = generate_assets(SyntheticAssetSpec(events=5))
+    large = generate_assets(SyntheticAssetSpec(events=500))
+
+    assert small.products == large.products
+    assert small.research == large.research
+    assert large.events["event_4"] == small.events["event_4"]
+
+
+def test_research_prerequisites_form_a_local_dag() -> None:
+    spec = SyntheticAssetSpec(research=500, max_prerequisites=4, prerequisite_window=8)
+    research = generate_assets(spec).research
+
+    parents_per_node = [len(node.prerequisites) for node in research.values()]
+    assert max(parents_per_node) <= 4
+    assert any(parents_per_node[1:])
+    for node in research.values():
+        index = int(node.id.removeprefix("node_"))
+        for prerequisite in node.prerequisites:
+            parent = int(prerequisite.removeprefix("node_"))
+            assert index - 8 <= parent < index
+
+
+def test_event_weights_are_skewed() -> None:
+    weights = sorted(
+        event.weight
+        for event in generate_assets(SyntheticAssetSpec(events=400)).events.values()
+    )
+
+    assert all(weight > 0 for weight in weights)
+    assert weights[-1] > 5 * weights[len(weights) // 2]
+
+
+def test_spec_rejects_empty_catalogues() -> None:
+    with pytest.raises(ValueError):
+        SyntheticAssetSpec(markets=0)
+    with pytest.raises(ValueError):
+        SyntheticAssetSpec(research=-1)
+
+
+def test_cli_gen_assets_writes_loadable_catalogues(tmp_path: Path) -> None:
+    output = tmp_path / "generated"
+
+    exit_code = run_cli(
+        [
+            "gen-assets",
+            "--output",
+            str(output),
+            "--products",
+            "250",
+            "--research",
+            "120",
+            "--seed",
+            "3",
+        ]
+    )
+
+    assert exit_code == 0
+    bundle = load_assets(output)
+    assert len(bundle.products) == 250
+    assert bundle == generate_assets(
+        SyntheticAssetSpec(products=250, research=120, seed=3)
+    )
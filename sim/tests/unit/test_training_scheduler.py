@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given, settings
+
+from ki_dev_tycoon.app import SimulationConfig, SimulationSession
+from ki_dev_tycoon.core.state import TeamMember, TeamState
+from ki_dev_tycoon.data import SyntheticAssetSpec, generate_assets
+from ki_dev_tycoon.pipeline import TickContext, TrainingSystem, default_systems
+from ki_dev_tycoon.team import (
+    TrainingScheduler,
+    ticks_to_skill_up,
+    train_team,
+    training_progress_after,
+)
+
+ASSETS = generate_assets(SyntheticAssetSpec(roles=4, products=6, markets=2, seed=3))
+ROLE_IDS = tuple(ASSETS.roles)
+CONFIG = SimulationConfig(
+    ticks=1, seed=5, daily_active_users=5000, arp_dau=0.12, operating_costs=450.0
+)
+
+
+class SteppedTraining:
+    """Reference system that trains every member on every tick."""
+
+    name = "training"
+
+    def process(self, context: TickContext) -> None:
+        result = train_team(
+            context.state.team,
+            assets=context.assets,
+            training_bonus=context.training_bonus,
+        )
+        context.state = context.state.update_team(result.team)
+
+
+def _members(draws: list[tuple[int, float, float]]) -> tuple[TeamMember, ...]:
+    return tuple(
+        TeamMember(
+            role_id=ROLE_IDS[role % len(ROLE_IDS)],
+            skill=skill,
+            training_progress=progress,
+        )
+        for role, skill, progress in draws
+    )
+
+
+member_draws = st.lists(
+    st.tuples(
+        st.integers(min_value=0, max_value=3),
+        st.floats(min_value=0.0, max_value=1.0),
+        st.floats(min_value=0.0, max_value=1.0),
+    ),
+    max_size=8,
+)
+
+
+@settings(max_examples=40, deadline=None)
+@given(
+    initial=member_draws,
+    hires=member_draws,
+    bonuses=st.lists(st.sampled_from([0.0, 0.01, 0.035]), min_size=1, max_size=4),
+)
+def test_scheduler_matches_stepwise_training(
+    initial: list[tuple[int, float, float]],
+    hires: list[tuple[int, float, float]],
+    bonuses: list[float],
+) -> None:
+    scheduler = TrainingScheduler()
+    expected = team = TeamState(members=_members(initial))
+    for tick in range(1, 121):
+        bonus = bonuses[tick * len(bonuses) // 121]
+        if tick % 40 == 0:
+            new = _members(hires)
+            expected = TeamState(members=expected.members + new)
+            team = TeamState(members=team.members + new)
+        expected = train_team(expected, assets=ASSETS, training_bonus=bonus).team
+        team = scheduler.advance(team, assets=ASSETS, training_bonus=bonus, tick=tick)
+        if tick % 7 == 0:
+            team = scheduler.materialise(team, tick)
+            assert team == expected
+
+    assert scheduler.materialise(team, 120) == expected
+
+
+def test_unchanged_ticks_keep_the_team_object() -> None:
+    scheduler = TrainingScheduler()
+    team = TeamState(members=_members([(0, 0.4, 0.0), (1, 0.4, 0.0)]))
+    rate = min(ASSETS.roles[role_id].training_rate for role_id in ROLE_IDS[:2])
+    first = scheduler.advance(team, assets=ASSETS, training_bonus=0.0, tick=1)
+
+    assert first is team
+    assert scheduler.pending == 2
+    assert ticks_to_skill_up(0.0, rate) > 1
+
+
+@settings(max_examples=200, deadline=None)
+@given(
+    start=st.floats(min_value=0.0, max_value=1.0),
+    rate=st.floats(min_value=1e-4, max_value=1.5),
+    ticks=st.integers(min_value=0, max_value=20_000),
+)
+def test_training_progress_matches_stepwise_additions(
+    start: float, rate: float, ticks: int
+) -> None:
+    member = TeamMember(role_id="dev", skill=0.0, training_progress=start)
+    expected = (ticks, start)
+    for tick in range(1, ticks + 1):
+        member = member.advance_training(rate)
+        expected = (tick, member.training_progress)
+        if member.training_progress >= 1.0:
+            break
+
+    assert training_progress_after(start, rate, ticks) == expected
+
+
+def test_stalled_training_never_skills_up() -> None:
+    assert training_progress_after(0.5, 1e-17, 10**12) == (10**12, 0.5)
+    assert ticks_to_skill_up(0.5, 1e-17) is None
+
+
+def test_training_progress_rejects_non_positive_rates() -> None:
+    with pytest.raises(ValueError):
+        training_progress_after(0.5, 0.0, 1)
+
+
+def test_session_state_matches_stepwise_training() -> None:
+    stepped_systems = list(default_systems())
+    stepped_systems[1] = SteppedTraining()
+    stepped = SimulationSession(CONFIG, systems=stepped_systems)
+    scheduled = SimulationSession(CONFIG)
+    observed: list[TickContext] = []
+    hooked = SimulationSession(CONFIG, tick_hooks=(observed.append,))
+
+    for ticks in (1, 13, 150, 400):
+        for session in (stepped, scheduled, hooked):
+            session.advance(ticks)
+        assert scheduled.state == stepped.state
+        assert hooked.state == stepped.state
+        assert observed[-1].state == stepped.state
+        assert scheduled.result() == stepped.result()
+
+    resumed = SimulationSession(CONFIG, initial_state=scheduled.snapshot().state)
+    resumed.advance(50)
+    stepped.advance(50)
+    assert resumed.state.team == stepped.state.team
+    assert isinstance(scheduled.pipeline.systems[1], TrainingSystem)